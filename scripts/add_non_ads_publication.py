@@ -20,20 +20,30 @@ Usage:
   # Dry run (preview without writing)
   python scripts/add_non_ads_publication.py --from-bibtex path/to/file.bib --category whitepaper --dry-run
 
+  # Bulk import of a large exported library (streamed, converted in parallel)
+  python scripts/add_non_ads_publication.py --from-bibtex library.bib --category conference --bulk [--jobs N]
+
 Generated with Claude Code
 """
 
 import argparse
 import json
+import os
 import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
 
-from utils import get_public_data_dir
+from dedup import DedupIndex, near_miss_message
+from instrumentation import instrument_run, phase
+from markup_translator import strip_latex
+from utils import get_public_data_dir, write_json_atomic
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -118,6 +128,7 @@ def strip_latex_formatting(text: str) -> str:
 
     Removes \textbf{}, \emph{}, \textit{}, \textsuperscript{}, curly braces,
     non-breaking spaces (~), and backslashes before special characters.
+    Delegates to the shared single-pass translator in markup_translator.py.
 
     Args:
         text: Text potentially containing LaTeX commands.
@@ -125,40 +136,7 @@ def strip_latex_formatting(text: str) -> str:
     Returns:
         Plain text with LaTeX formatting removed.
     """
-    if not text:
-        return ""
-
-    # Replace non-breaking spaces with regular spaces
-    text = text.replace("~", " ")
-
-    # Remove \textsuperscript{...}
-    while r"\textsuperscript{" in text:
-        text = re.sub(r"\\textsuperscript\{([^}]*)\}", r"\1", text)
-
-    # Remove common LaTeX commands but keep their content
-    while re.search(r"\\(?:textbf|emph|textit|textsc|textrm|text)\{", text):
-        text = re.sub(
-            r"\\(?:textbf|emph|textit|textsc|textrm|text)\{([^}]*)\}",
-            r"\1",
-            text,
-        )
-
-    # Remove remaining curly braces
-    text = text.replace("{", "").replace("}", "")
-
-    # Remove any remaining backslash commands (e.g. \textbf without braces)
-    text = re.sub(r"\\(?:textbf|emph|textit|textsc|textrm)", "", text)
-
-    # Remove backslashes before special characters
-    text = re.sub(r"\\([&$%#_])", r"\1", text)
-
-    # Remove any remaining stray backslashes
-    text = text.replace("\\", "")
-
-    # Clean up multiple spaces
-    text = re.sub(r"\s+", " ", text)
-
-    return text.strip()
+    return strip_latex(text)
 
 
 # ---------------------------------------------------------------------------
@@ -302,47 +280,61 @@ def make_synthetic_bibcode(citation_key: str) -> str:
 # Deduplication
 # ---------------------------------------------------------------------------
 
-def build_dedup_keys(entries: List[Dict]) -> set:
+def build_dedup_index(entries: List[Dict]) -> DedupIndex:
     """
-    Build a set of deduplication keys from existing publication entries.
+    Build a fuzzy deduplication index from existing publication entries.
 
-    Key is (lowercased title, 4-char year prefix).
+    Titles are compared after normalization (markup, punctuation and case
+    removed) by trigram similarity within the same year; see dedup.py.
 
     Args:
         entries: List of existing publication dictionaries.
 
     Returns:
-        Set of (title, year) tuples for deduplication.
+        DedupIndex over the entries.
     """
-    keys = set()
-    for entry in entries:
-        title = entry.get("title", "").lower().strip()
-        year = entry.get("year", "")[:4]
-        if title and year:
-            keys.add((title, year))
-    return keys
+    return DedupIndex(entries)
 
 
-def is_duplicate(entry: Dict, dedup_keys: set) -> bool:
+def is_duplicate(entry: Dict, dedup_index: DedupIndex) -> bool:
     """
     Check whether a publication entry is a duplicate.
 
     Args:
         entry: Publication dictionary to check.
-        dedup_keys: Set of existing (title, year) tuples.
+        dedup_index: Index of existing entries.
 
     Returns:
         True if entry is a duplicate.
     """
-    title = entry.get("title", "").lower().strip()
-    year = entry.get("year", "")[:4]
-    return (title, year) in dedup_keys
+    return dedup_index.find(entry) is not None
+
+
+def report_near_misses(entry: Dict, dedup_index: DedupIndex) -> None:
+    """
+    Print indexed entries that resemble entry but are numbered differently.
+
+    Such pairs (e.g. "Paper I" and "Paper II") are kept as separate entries;
+    the warning lets them be checked by hand.
+    """
+    for other, score in dedup_index.near_misses(entry):
+        print(near_miss_message(entry, other, score))
 
 
 # ---------------------------------------------------------------------------
 # BibTeX File Parsing
 # ---------------------------------------------------------------------------
 
+def make_bibtex_parser() -> BibTexParser:
+    """Create a BibTexParser configured for CV exports."""
+    parser = BibTexParser(common_strings=True)
+    parser.customization = convert_to_unicode
+    # Accept biblatex entry types like @report, @dataset, @eprint
+    # (bibtexparser defaults to ignoring non-standard BibTeX types)
+    parser.ignore_nonstandard_types = False
+    return parser
+
+
 def parse_bibtex_file(file_path: Path) -> List[Dict]:
     """
     Parse a BibTeX file and return the list of raw entry dictionaries.
@@ -353,12 +345,6 @@ def parse_bibtex_file(file_path: Path) -> List[Dict]:
     Returns:
         List of parsed BibTeX entry dictionaries.
     """
-    parser = BibTexParser(common_strings=True)
-    parser.customization = convert_to_unicode
-    # Accept biblatex entry types like @report, @dataset, @eprint
-    # (bibtexparser defaults to ignoring non-standard BibTeX types)
-    parser.ignore_nonstandard_types = False
-
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -366,11 +352,62 @@ def parse_bibtex_file(file_path: Path) -> List[Dict]:
     # comments inside entries and silently drops entries that contain them.
     content = re.sub(r"^\s*%.*$", "", content, flags=re.MULTILINE)
 
-    bib_db = bibtexparser.loads(content, parser)
+    bib_db = bibtexparser.loads(content, make_bibtex_parser())
 
     return bib_db.entries
 
 
+# @, braces, and backslash escapes (so \{ and \} don't change brace depth)
+_BIBTEX_TOKEN = re.compile(r"\\.|[{}@]")
+_COMMENT_LINE = re.compile(r"^\s*%")
+
+
+def iter_bibtex_chunks(file_path: Path) -> Iterator[str]:
+    """
+    Stream a BibTeX file as one text chunk per @-block, without loading it whole.
+
+    Blocks are delimited by brace depth: a block starts at an '@' outside any
+    block and ends at the brace that closes its first '{'. Text between blocks
+    and %-prefixed comment lines are dropped, as in parse_bibtex_file().
+
+    Args:
+        file_path: Path to a .bib file.
+
+    Yields:
+        Raw text of each @entry / @string / @comment block.
+    """
+    parts: List[str] = []
+    depth = 0
+    in_block = False
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if _COMMENT_LINE.match(line):
+                continue
+
+            start = 0
+            for match in _BIBTEX_TOKEN.finditer(line):
+                token = match.group()
+                if not in_block:
+                    if token == "@":
+                        in_block = True
+                        depth = 0
+                        start = match.start()
+                    continue
+                if token == "{":
+                    depth += 1
+                elif token == "}":
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(line[start:match.end()])
+                        yield "".join(parts)
+                        parts = []
+                        in_block = False
+
+            if in_block:
+                parts.append(line[start:])
+
+
 def convert_bibtex_entry(entry: Dict, category: str) -> Dict:
     """
     Convert a parsed BibTeX entry dict to the ads_publications.json schema.
@@ -441,7 +478,7 @@ def import_from_bibtex(
     bib_path: Path,
     category: str,
     existing: List[Dict],
-    dedup_keys: set,
+    dedup_index: DedupIndex,
 ) -> Tuple[List[Dict], List[Dict]]:
     """
     Parse a .bib file and convert entries to website JSON format.
@@ -450,7 +487,7 @@ def import_from_bibtex(
         bib_path: Path to the .bib file.
         category: One of 'conference' or 'whitepaper'.
         existing: Current list of publications (for context).
-        dedup_keys: Set of (title, year) dedup keys.
+        dedup_index: Fuzzy dedup index of existing entries.
 
     Returns:
         Tuple of (new_entries, skipped_duplicates).
@@ -462,18 +499,119 @@ def import_from_bibtex(
     for raw in raw_entries:
         converted = convert_bibtex_entry(raw, category)
 
-        if is_duplicate(converted, dedup_keys):
+        # New entries are indexed so later entries in same file are checked
+        if dedup_index.find_or_add(converted) is not None:
             skipped.append(converted)
         else:
+            report_near_misses(converted, dedup_index)
             new_entries.append(converted)
-            # Add to dedup keys so later entries in same file are checked
-            title = converted.get("title", "").lower().strip()
-            year = converted.get("year", "")[:4]
-            dedup_keys.add((title, year))
 
     return new_entries, skipped
 
 
+def _convert_bibtex_batch(args: Tuple[str, str, str]) -> List[Dict]:
+    """
+    Worker: parse a batch of raw BibTeX blocks and convert each entry.
+
+    Args:
+        args: (string_defs, batch_text, category) where string_defs holds the
+            @string blocks seen so far in the file.
+
+    Returns:
+        Converted entries, in file order.
+    """
+    string_defs, batch_text, category = args
+    bib_db = bibtexparser.loads(string_defs + batch_text, make_bibtex_parser())
+    return [convert_bibtex_entry(raw, category) for raw in bib_db.entries]
+
+
+def iter_bibtex_batches(bib_path: Path, category: str, batch_size: int) -> Iterator[Tuple[str, str, str]]:
+    """Group streamed BibTeX blocks into worker batches, carrying @string macros along."""
+    string_defs: List[str] = []
+    batch: List[str] = []
+
+    for chunk in iter_bibtex_chunks(bib_path):
+        block_type = chunk[1:chunk.find("{")].strip().lower() if "{" in chunk else ""
+        if block_type == "string":
+            # Later batches may reference it; flush so macro order is preserved
+            if batch:
+                yield "\n".join(string_defs), "\n".join(batch), category
+                batch = []
+            string_defs.append(chunk)
+            continue
+        if block_type in ("comment", "preamble"):
+            continue
+        batch.append(chunk)
+        if len(batch) >= batch_size:
+            yield "\n".join(string_defs), "\n".join(batch), category
+            batch = []
+
+    if batch:
+        yield "\n".join(string_defs), "\n".join(batch), category
+
+
+def bulk_import_from_bibtex(
+    bib_path: Path,
+    category: str,
+    dedup_index: DedupIndex,
+    jobs: Optional[int] = None,
+    batch_size: int = 500,
+) -> Tuple[List[Dict], List[Dict], Dict]:
+    """
+    Stream a large .bib file and convert its entries in a process pool.
+
+    Blocks are read incrementally and parsed/converted (LaTeX stripping,
+    author parsing, synthetic bibcodes) in worker batches. At most 2 x jobs
+    batches are in flight, so memory stays bounded. Results are consumed in
+    file order and deduplicated in this process exactly as in
+    import_from_bibtex(): the first occurrence wins and later entries in the
+    same file are checked against it.
+
+    Args:
+        bib_path: Path to the .bib file.
+        category: One of 'conference' or 'whitepaper'.
+        dedup_index: Fuzzy dedup index of existing entries.
+        jobs: Worker processes (default: CPU count).
+        batch_size: BibTeX blocks per worker task.
+
+    Returns:
+        Tuple of (new_entries, skipped_duplicates, stats) where stats has
+        'entries', 'seconds' and 'entries_per_second'.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    new_entries: List[Dict] = []
+    skipped: List[Dict] = []
+    total = 0
+    start = time.perf_counter()
+
+    def consume(converted_batch: List[Dict]) -> None:
+        nonlocal total
+        for converted in converted_batch:
+            total += 1
+            if dedup_index.find_or_add(converted) is not None:
+                skipped.append(converted)
+            else:
+                report_near_misses(converted, dedup_index)
+                new_entries.append(converted)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: deque = deque()
+        for batch in iter_bibtex_batches(bib_path, category, batch_size):
+            pending.append(executor.submit(_convert_bibtex_batch, batch))
+            if len(pending) >= 2 * jobs:
+                consume(pending.popleft().result())
+        while pending:
+            consume(pending.popleft().result())
+
+    seconds = time.perf_counter() - start
+    stats = {
+        "entries": total,
+        "seconds": seconds,
+        "entries_per_second": total / seconds if seconds > 0 else 0.0,
+    }
+    return new_entries, skipped, stats
+
+
 # ---------------------------------------------------------------------------
 # Interactive CLI
 # ---------------------------------------------------------------------------
@@ -711,11 +849,8 @@ def save_publications(entries: List[Dict], dry_run: bool = False) -> str:
     if dry_run:
         return f"DRY RUN: Would write {len(entries)} entries to {pub_file}"
 
-    with open(pub_file, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    # Ensure trailing newline
-    with open(pub_file, "a", encoding="utf-8") as f:
-        f.write("\n")
+    if not write_json_atomic(pub_file, entries, ensure_ascii=False, trailing_newline=True):
+        return f"{pub_file} already up to date ({len(entries)} entries)"
 
     return f"Wrote {len(entries)} entries to {pub_file}"
 
@@ -767,11 +902,23 @@ def main() -> None:
         action="store_true",
         help="Preview entries without writing to files.",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Stream the .bib file and convert entries in parallel (for large libraries).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --bulk (default: CPU count).",
+    )
     args = parser.parse_args()
 
     # Load existing publications
+    phase("load")
     existing = load_publications()
-    dedup_keys = build_dedup_keys(existing)
+    dedup_index = build_dedup_index(existing)
     original_count = len(existing)
 
     print(f"Loaded {original_count} existing publications from {PUBLICATIONS_FILE}.\n")
@@ -792,23 +939,33 @@ def main() -> None:
         print(f"Category:       {args.category} -> publication_type: {CATEGORY_MAP[args.category]}")
         print()
 
-        new_entries, skipped = import_from_bibtex(
-            bib_path, args.category, existing, dedup_keys
-        )
+        phase("import")
+        if args.bulk:
+            new_entries, skipped, stats = bulk_import_from_bibtex(
+                bib_path, args.category, dedup_index, jobs=args.jobs
+            )
+            print(f"Converted {stats['entries']} entries in {stats['seconds']:.2f}s "
+                  f"({stats['entries_per_second']:.0f} entries/s)")
+            print(f"  New: {len(new_entries)}  Duplicates skipped: {len(skipped)}\n")
+        else:
+            new_entries, skipped = import_from_bibtex(
+                bib_path, args.category, existing, dedup_index
+            )
 
-        if skipped:
-            print(f"Skipped {len(skipped)} duplicate(s):")
-            for entry in skipped:
-                print(f"  - {entry.get('title', '?')} ({entry.get('year', '?')[:4]})")
-            print()
+            if skipped:
+                print(f"Skipped {len(skipped)} duplicate(s):")
+                for entry in skipped:
+                    print(f"  - {entry.get('title', '?')} ({entry.get('year', '?')[:4]})")
+                print()
 
         if not new_entries:
             print("No new entries to add.")
             return
 
-        print(f"Found {len(new_entries)} new entry/entries:\n")
-        for i, entry in enumerate(new_entries, 1):
-            print_entry(entry, index=i)
+        if not args.bulk:
+            print(f"Found {len(new_entries)} new entry/entries:\n")
+            for i, entry in enumerate(new_entries, 1):
+                print_entry(entry, index=i)
 
         existing.extend(new_entries)
 
@@ -824,17 +981,20 @@ def main() -> None:
         print("=" * 60)
         print_entry(entry)
 
-        if is_duplicate(entry, dedup_keys):
-            print("WARNING: This entry appears to be a duplicate (matching title + year).")
+        if is_duplicate(entry, dedup_index):
+            print("WARNING: This entry appears to be a duplicate (similar title, same year).")
             confirm = input("Add anyway? (y/N): ").strip().lower()
             if confirm != "y":
                 print("Cancelled.")
                 return
+        else:
+            report_near_misses(entry, dedup_index)
 
         existing.append(entry)
         new_entries = [entry]
 
     # Save
+    phase("save")
     print("=" * 60)
     message = save_publications(existing, dry_run=args.dry_run)
     print(message)
@@ -850,4 +1010,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
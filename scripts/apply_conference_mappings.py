@@ -18,7 +18,8 @@ import re
 from pathlib import Path
 from typing import Dict
 
-from utils import get_public_data_dir
+from instrumentation import instrument_run, phase
+from utils import get_public_data_dir, write_json_atomic
 
 
 def create_venue_mappings() -> Dict[str, str]:
@@ -71,6 +72,7 @@ def main():
     publications_file = data_dir / "ads_publications.json"
 
     # Load publications
+    phase("load")
     print(f"📖 Loading publications from {publications_file}")
     with open(publications_file, "r") as f:
         publications = json.load(f)
@@ -78,6 +80,7 @@ def main():
     print(f"   Loaded {len(publications)} publications")
 
     # Create and apply mappings
+    phase("map")
     mappings = create_venue_mappings()
     print(f"\n🔄 Applying {len(mappings)} venue name mappings...")
     publications, stats = apply_mappings(publications, mappings)
@@ -97,8 +100,8 @@ def main():
         print(f"\n✅ Total publications updated: {total_mapped}")
 
     # Save updated publications
-    with open(publications_file, "w") as f:
-        json.dump(publications, f, indent=2)
+    phase("write")
+    write_json_atomic(publications_file, publications)
 
     print(f"\n💾 Saved updated publications to {publications_file}")
 
@@ -106,4 +109,5 @@ def main():
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
@@ -20,12 +20,16 @@ import json
 import sys
 from collections import defaultdict
 from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 import openpyxl
 
-from utils import get_repo_root, get_public_data_dir
+from generate_figure_registry_from_corpus import write_sharded_registry
+from instrumentation import instrument_run, phase
+from topic_index import update_topic_figure_index
+from utils import get_repo_root, get_public_data_dir, write_json_atomic
 
 
 # =============================================================================
@@ -75,71 +79,96 @@ class Assignment:
     relevance: str | None = None
 
 
+# Registry field populated for each role
+ROLE_FIELDS: dict[str, str] = {
+    "PRIMARY": "used_as_primary_in",
+    "RELATED": "used_as_related_in",
+    "NOT SHOWN": "used_as_not_shown_in",
+}
+
+# Hash index of assignments keyed on (figure_key, topic), in first-seen order
+AssignmentIndex = dict[tuple[str, str], Assignment]
+
+
+def add_assignment(index: AssignmentIndex, assignment: Assignment) -> None:
+    """Insert an assignment; a later row for the same (figure, topic) replaces the earlier one."""
+    pair = (assignment.figure_key, assignment.topic)
+    previous = index.get(pair)
+    if previous is not None and previous.role != assignment.role:
+        print(f"  WARNING: {pair[0]} in {pair[1]} assigned {previous.role} "
+              f"then {assignment.role}; keeping {assignment.role}", file=sys.stderr)
+    index[pair] = assignment
+
+
 # =============================================================================
 # Phase A: Read Excel
 # =============================================================================
 
-def read_excel(excel_path: Path) -> list[Assignment]:
-    """Read all figure assignments from the review Excel."""
+def iter_excel_assignments(excel_path: Path) -> Iterator[Assignment]:
+    """Stream figure assignments from the review Excel, one row at a time."""
     wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
     ws = wb.active
 
-    assignments = []
-    for row in ws.iter_rows(min_row=2, values_only=False):
-        key = row[1].value       # Column B: figure key
-        topic = row[3].value     # Column D: topic slug
-        role = row[4].value      # Column E: role (PRIMARY/RELATED/NOT SHOWN)
-        relevance = row[5].value  # Column F: relevance string
-        # Column H (notes) is handled via multi-topic overrides
-
-        if key is None:
-            continue
-
-        # Clean values
-        key = str(key).strip()
-        if topic:
-            topic = str(topic).strip()
-        if role:
-            role = str(role).strip().upper()
-        if relevance:
-            relevance = str(relevance).strip()
-
-        # Skip rows with missing topic/role (e.g., 2026_L12/fig_2 — handled by overrides)
-        if not topic or not role:
-            continue
+    try:
+        for row in ws.iter_rows(min_row=2, max_col=6, values_only=True):
+            row = row + (None,) * (6 - len(row))
+            key = row[1]        # Column B: figure key
+            topic = row[3]      # Column D: topic slug
+            role = row[4]       # Column E: role (PRIMARY/RELATED/NOT SHOWN)
+            relevance = row[5]  # Column F: relevance string
+            # Column H (notes) is handled via multi-topic overrides
+
+            if key is None:
+                continue
+
+            # Clean values
+            key = str(key).strip()
+            if topic:
+                topic = str(topic).strip()
+            if role:
+                role = str(role).strip().upper()
+            if relevance:
+                relevance = str(relevance).strip()
+
+            # Skip rows with missing topic/role (e.g., 2026_L12/fig_2 — handled by overrides)
+            if not topic or not role:
+                continue
+
+            yield Assignment(
+                figure_key=key,
+                topic=topic,
+                role=role,
+                relevance=relevance if relevance else None,
+            )
+    finally:
+        wb.close()
 
-        assignments.append(Assignment(
-            figure_key=key,
-            topic=topic,
-            role=role,
-            relevance=relevance if relevance else None,
-        ))
 
-    wb.close()
-    return assignments
+def read_excel(excel_path: Path) -> AssignmentIndex:
+    """Read all figure assignments from the review Excel into a (figure, topic) index."""
+    index: AssignmentIndex = {}
+    for assignment in iter_excel_assignments(excel_path):
+        add_assignment(index, assignment)
+    return index
 
 
 # =============================================================================
 # Phase B: Apply multi-topic overrides
 # =============================================================================
 
-def apply_overrides(assignments: list[Assignment]) -> list[Assignment]:
+def apply_overrides(index: AssignmentIndex) -> AssignmentIndex:
     """Add multi-topic assignments from the dispatch table."""
     for fig_key, topic, role in MULTI_TOPIC_OVERRIDES:
-        # Check this assignment doesn't already exist in Excel data
-        exists = any(
-            a.figure_key == fig_key and a.topic == topic
-            for a in assignments
-        )
-        if not exists:
-            assignments.append(Assignment(
+        # Excel data takes precedence over the dispatch table
+        if (fig_key, topic) not in index:
+            index[(fig_key, topic)] = Assignment(
                 figure_key=fig_key,
                 topic=topic,
                 role=role,
                 relevance=None,
-            ))
+            )
 
-    return assignments
+    return index
 
 
 # =============================================================================
@@ -185,29 +214,22 @@ def update_registry(registry_path: Path, assignments: list[Assignment]) -> dict:
     with open(registry_path) as f:
         registry = json.load(f)
 
-    # Build reverse mapping: figure_key -> {primary_in: [topics], related_in: [...], not_shown_in: [...]}
-    reverse_map: dict[str, dict[str, list[str]]] = defaultdict(
-        lambda: {"primary_in": [], "related_in": [], "not_shown_in": []}
-    )
+    # Build reverse mapping in one pass: figure_key -> {registry field: [topics]}
+    reverse_map: dict[str, dict[str, list[str]]] = {}
     for a in assignments:
-        if a.role == "PRIMARY":
-            reverse_map[a.figure_key]["primary_in"].append(a.topic)
-        elif a.role == "RELATED":
-            reverse_map[a.figure_key]["related_in"].append(a.topic)
-        elif a.role == "NOT SHOWN":
-            reverse_map[a.figure_key]["not_shown_in"].append(a.topic)
+        field_name = ROLE_FIELDS.get(a.role)
+        if field_name is None:
+            continue
+        reverse_map.setdefault(a.figure_key, {}).setdefault(field_name, []).append(a.topic)
 
     # Update each registry entry
     for key, entry in registry.items():
-        mapping = reverse_map.get(key, {"primary_in": [], "related_in": [], "not_shown_in": []})
-        entry["used_as_primary_in"] = sorted(mapping["primary_in"])
-        entry["used_as_related_in"] = sorted(mapping["related_in"])
-        entry["used_as_not_shown_in"] = sorted(mapping["not_shown_in"])
+        mapping = reverse_map.get(key, {})
+        for field_name in ROLE_FIELDS.values():
+            entry[field_name] = sorted(mapping.get(field_name, []))
 
     # Write back
-    with open(registry_path, "w") as f:
-        json.dump(registry, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_json_atomic(registry_path, registry, ensure_ascii=False, trailing_newline=True)
 
     # Verify all figures have at least one assignment
     empty = [k for k, v in registry.items()
@@ -324,9 +346,7 @@ def update_existing_topics(
                     rt["slug"] = ALFVEN_WAVES_REPLACEMENT
 
         # Write back
-        with open(topic_path, "w") as f:
-            json.dump(topic_data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        write_json_atomic(topic_path, topic_data, ensure_ascii=False, trailing_newline=True)
 
         n_primary = len(primary_figures)
         n_related = len(related_figures)
@@ -418,9 +438,7 @@ def create_new_topics(
         }
 
         topic_path = topics_dir / f"{slug}.json"
-        with open(topic_path, "w") as f:
-            json.dump(topic_data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        write_json_atomic(topic_path, topic_data, ensure_ascii=False, trailing_newline=True)
 
         n_primary = len(primary_figures)
         n_related = len(related_figures)
@@ -443,16 +461,20 @@ def main():
         sys.exit(1)
 
     # Phase A: Read Excel
+    phase("read-excel")
     print("Phase A: Reading Excel...")
-    assignments = read_excel(excel_path)
-    print(f"  Read {len(assignments)} assignments from Excel")
+    index = read_excel(excel_path)
+    print(f"  Read {len(index)} assignments from Excel")
 
     # Phase B: Apply multi-topic overrides
+    phase("overrides")
     print("Phase B: Applying multi-topic overrides...")
-    assignments = apply_overrides(assignments)
+    index = apply_overrides(index)
+    assignments = list(index.values())
     print(f"  Total assignments after overrides: {len(assignments)}")
 
     # Phase C: Validate counts
+    phase("validate")
     print("Phase C: Validating counts against dispatch...")
     if not validate_counts(assignments):
         print("ERROR: Count validation failed. Aborting.", file=sys.stderr)
@@ -475,11 +497,15 @@ def main():
     topic_assignments = build_topic_assignments(assignments)
 
     # Phase D: Update registry
+    phase("registry")
     print("Phase D: Updating figure-registry.json...")
     registry = update_registry(registry_path, assignments)
     print(f"  Updated {len(registry)} entries")
+    write_sharded_registry(registry, data_dir, repo_root)
+    print("  Re-sharded figure-registry/ index and paper shards")
 
     # Phase E: Update existing topic files
+    phase("topics")
     print("Phase E: Updating existing topic files...")
     update_existing_topics(topics_dir, topic_assignments, alfven_waves_data)
 
@@ -492,6 +518,10 @@ def main():
     alfven_path.unlink()
     print(f"  Deleted {alfven_path.name}")
 
+    # Refresh the topic-figure index for the rewritten topic files
+    phase("topic-index")
+    update_topic_figure_index(data_dir)
+
     # Summary
     print("\n=== Summary ===")
     topic_files = list(topics_dir.glob("*.json"))
@@ -502,4 +532,5 @@ def main():
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
@@ -0,0 +1,118 @@
+"""
+Author name standardization for ADS publication data.
+
+Rules live in author_name_config.json next to this file; each enabled rule
+maps the format variants ADS returns for one author ("Alterman, B. L.",
+"Benjamin L. Alterman", ...) to a single canonical spelling.
+"""
+import json
+import re
+from pathlib import Path
+
+
+def load_author_standardization_config():
+    """Load author name standardization rules from config file."""
+    config_path = Path(__file__).parent / "author_name_config.json"
+
+    if not config_path.exists():
+        print(f"⚠️  Warning: {config_path.name} not found, using no standardization rules")
+        return {}
+
+    with open(config_path, 'r') as f:
+        data = json.load(f)
+
+    # Convert to dictionary keyed by last name for fast lookup
+    rules = {}
+    for rule in data.get('standardization_rules', []):
+        if rule.get('enabled', True):
+            rules[rule['last_name']] = rule
+
+    print(f"✓ Loaded {len(rules)} author standardization rule(s)")
+    return rules
+
+
+# Load configuration at module level
+AUTHOR_STANDARDIZATION_CONFIG = load_author_standardization_config()
+
+
+def standardize_author_name(author_name: str) -> str:
+    """
+    Standardize author names using configuration-based rules.
+
+    Handles multiple format variants for configured authors:
+    - Reverse format: "Lastname, Firstname..." (most common from ADS)
+    - Forward format: "Firstname Lastname" (some publishers)
+    - Initials vs full names: "Benjamin" vs "Ben" vs "B."
+    - Spacing variations: "B.L." vs "B. L."
+
+    Falls through to original name if no standardization rule matches.
+
+    Args:
+        author_name: Raw author name from ADS API
+
+    Returns:
+        Standardized author name (or original if no rule matches)
+    """
+    name = author_name.strip()
+
+    # Check each configured author
+    for last_name, config in AUTHOR_STANDARDIZATION_CONFIG.items():
+        canonical = config['canonical']
+
+        # Already canonical - return immediately
+        if name == canonical:
+            return name
+
+        # Extract configuration
+        last = config['last_name']
+        first_initial = config['first_initial']
+        middle_initial = config.get('middle_initial', '')
+        first_names = config.get('first_names', [])
+
+        # PATTERN GROUP 1: REVERSE FORMAT (Lastname, Firstname...)
+        # Most common format from ADS API
+
+        # Match: "Alterman, Benjamin L." or "Alterman, Benjamin"
+        for first_name in first_names:
+            # With optional middle initial (with/without period)
+            pattern = rf'^{last},\s*{first_name}(\s+{middle_initial}\.?)?$'
+            if re.match(pattern, name, re.IGNORECASE):
+                return canonical
+
+        # Match: "Alterman, B." (first initial only, missing middle)
+        if re.match(rf'^{last},\s*{first_initial}\.$', name, re.IGNORECASE):
+            return canonical
+
+        # Match: "Alterman, B.L." (no space between initials)
+        if middle_initial:
+            if re.match(rf'^{last},\s*{first_initial}\.{middle_initial}\.$', name, re.IGNORECASE):
+                return canonical
+
+        # Match: "Alterman, B. L. L." (triple initial - data error)
+        if middle_initial:
+            if re.match(rf'^{last},\s*{first_initial}\.\s*{middle_initial}\.\s*{middle_initial}\.$', name, re.IGNORECASE):
+                return canonical
+
+        # PATTERN GROUP 2: FORWARD FORMAT (Firstname Lastname)
+        # Less common but appears in some datasets (user-reported)
+
+        # Match: "Benjamin L. Alterman" or "Benjamin Alterman"
+        for first_name in first_names:
+            # With optional middle initial
+            pattern = rf'^{first_name}(\s+{middle_initial}\.?)?\s+{last}$'
+            if re.match(pattern, name, re.IGNORECASE):
+                return canonical
+
+        # Match: "B. L. Alterman" or "B. Alterman"
+        if middle_initial:
+            # With optional middle initial
+            pattern = rf'^{first_initial}\.(\s*{middle_initial}\.?)?\s+{last}$'
+            if re.match(pattern, name, re.IGNORECASE):
+                return canonical
+        else:
+            # Just first initial
+            if re.match(rf'^{first_initial}\.\s+{last}$', name, re.IGNORECASE):
+                return canonical
+
+    # No standardization rule matched - return original name unchanged
+    return name
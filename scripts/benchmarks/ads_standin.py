@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the NASA ADS API endpoints the fetch scripts call.
+
+Serves, from a cassette of recorded responses:
+
+- GET  /v1/search/query            Solr-style search with rows/start/cursorMark paging
+- POST /v1/metrics                 bulk metrics (fetch_ads_metrics_to_data_dir.py)
+- GET  /v1/metrics/<bibcode>       single-bibcode metrics (fetch_ads_citations_to_data_dir.py)
+
+and can inject faults:
+
+- latency:     fixed delay plus seeded jitter on every request
+- rate limits: a burst of 429 responses (with X-RateLimit-Reset and
+               Retry-After headers, as ADS sends them) after a number of
+               successful requests, optionally repeating
+- partial pages: a ceiling on search rows, rewritten in the response
+               header the way ADS applies its own row limit
+
+A cassette is a JSON file:
+
+    {"version": 1, "source": ...,
+     "search": {"docs": [...]},
+     "metrics": {"bulk": {...}, "by_bibcode": {"<bibcode>": {...}}}}
+
+`build` derives one from the committed public/data files (no network);
+`record` captures one from the live API (needs ADS_DEV_KEY and ADS_ORCID).
+With --members N a built cassette also gets N synthetic group members: every
+doc is credited to one member ORCID (and a third of them to a co-author
+member too) through orcid_pub, and searches naming ORCIDs only return those
+members' docs (see fetch_ads_group.py).
+
+Point the fetch scripts at a running stand-in with ADS_API_URL:
+
+    python scripts/benchmarks/ads_standin.py serve --port 8765 --latency-ms 50
+    ADS_API_URL=http://127.0.0.1:8765/v1 ADS_DEV_KEY=x ADS_ORCID=x \\
+        PUBLIC_DATA_DIR=/tmp/ads-data python scripts/fetch_ads_publications_to_data_dir.py
+
+GET /__stats returns request counters; POST /__reset clears them.
+
+Usage:
+    python scripts/benchmarks/ads_standin.py serve [--cassette FILE] [fault options]
+    python scripts/benchmarks/ads_standin.py build --out FILE [--scale N]
+    python scripts/benchmarks/ads_standin.py record --out FILE
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+# Add scripts/ to path for shared imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils import get_repo_root, write_json_atomic  # noqa: E402
+
+CASSETTE_VERSION = 1
+# Fields the fetch scripts request from search (union across the three)
+SEARCH_FIELDS = ["bibcode", "title", "author", "pubdate", "pub", "doctype",
+                 "citation_count", "doi", "property", "orcid_pub", "orcid_user", "orcid_other"]
+ORCID_PATTERN = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]")
+ROUTE_METHODS = {"search": "GET", "metrics-bulk": "POST", "metrics-single": "GET"}
+CITATION_KEYS = ("refereed to refereed", "nonrefereed to refereed",
+                 "refereed to nonrefereed", "nonrefereed to nonrefereed")
+
+
+# ---------------------------------------------------------------------------
+# Cassettes
+# ---------------------------------------------------------------------------
+
+def _load_data(name: str, default: Any) -> Any:
+    path = get_repo_root() / "public" / "data" / name
+    if not path.exists():
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def search_doc(pub: dict, bibcode: str) -> dict:
+    """An ADS search doc reconstructed from an ads_publications.json entry."""
+    url = pub.get("url") or ""
+    doi = [url.split("dx.doi.org/", 1)[1]] if "dx.doi.org/" in url else None
+    doc = {
+        "bibcode": bibcode,
+        "title": [pub.get("title", "")],
+        "author": pub.get("authors", []),
+        # ads_publications.json keeps ADS's raw "YYYY-MM-00" pubdate as its year
+        "pubdate": pub.get("year", ""),
+        "pub": pub.get("journal", ""),
+        "doctype": pub.get("publication_type", ""),
+        "citation_count": pub.get("citations", 0),
+        "property": pub.get("properties", []),
+    }
+    if doi:
+        doc["doi"] = doi
+    return doc
+
+
+def spread(total: int, n: int, i: int) -> int:
+    """Share i of `total` split as evenly as possible into n integer parts."""
+    return total // n + (1 if i < total % n else 0)
+
+
+def member_orcids(members: int) -> List[str]:
+    """Synthetic ORCIDs for group members."""
+    return [f"0000-0009-{i // 10000:04d}-{i % 10000:04d}" for i in range(members)]
+
+
+def assign_members(docs: List[dict], members: int, seed: int = 0) -> None:
+    """Credit each doc to one member, a third of them to a second co-author member."""
+    rng = random.Random(seed)
+    orcids = member_orcids(members)
+    for doc in docs:
+        authors = doc.get("author") or ["Anonymous"]
+        credited = rng.sample(orcids, 2 if members > 1 and rng.random() < 1 / 3 else 1)
+        orcid_pub = ["-"] * len(authors)
+        for position, orcid in zip(rng.sample(range(len(authors)), min(len(credited), len(authors))), credited):
+            orcid_pub[position] = orcid
+        doc["orcid_pub"] = orcid_pub
+
+
+def build_cassette(scale: int = 1, members: int = 0) -> dict:
+    """
+    Cassette from the committed data files, replicated `scale` times.
+
+    Per-bibcode citation histograms split citations_by_year.json evenly over
+    the cited bibcodes, so replaying fetch_ads_citations_to_data_dir.py at
+    scale 1 reproduces the committed yearly totals. Each doc's citation_count
+    is set to its histogram total, as ADS reports it.
+    """
+    pubs = _load_data("ads_publications.json", [])
+    docs = []
+    for copy_index in range(scale):
+        for i, pub in enumerate(pubs):
+            bibcode = pub["bibcode"] if copy_index == 0 else f"{pub['bibcode'][:4]}X{copy_index:05d}.{i:07d}"
+            docs.append(search_doc(pub, bibcode))
+
+    by_year = _load_data("citations_by_year.json", {"years": [], "refereed": [], "nonrefereed": []})
+    cited = [doc for doc in docs if doc["citation_count"]] or docs
+    n = len(cited) or 1
+    by_bibcode = {doc["bibcode"]: {"histograms": {"citations": {key: {} for key in CITATION_KEYS}}}
+                  for doc in docs}
+    for i, doc in enumerate(cited):
+        hist = by_bibcode[doc["bibcode"]]["histograms"]["citations"]
+        for year, ref, nonref in zip(by_year["years"], by_year["refereed"], by_year["nonrefereed"]):
+            hist["refereed to refereed"][str(year)] = spread(ref * scale, n, i)
+            hist["nonrefereed to refereed"][str(year)] = 0
+            hist["refereed to nonrefereed"][str(year)] = spread(nonref * scale, n, i)
+            hist["nonrefereed to nonrefereed"][str(year)] = 0
+    for doc in docs:
+        hist = by_bibcode[doc["bibcode"]]["histograms"]["citations"]
+        doc["citation_count"] = sum(sum(counts.values()) for counts in hist.values())
+    if members:
+        assign_members(docs, members)
+
+    return {
+        "version": CASSETTE_VERSION,
+        "source": f"public/data x{scale}" + (f", {members} members" if members else ""),
+        "members": member_orcids(members),
+        "search": {"docs": docs},
+        "metrics": {"bulk": _load_data("ads_metrics.json", {}), "by_bibcode": by_bibcode},
+    }
+
+
+def record_cassette(api_url: str, token: str, orcid: str) -> dict:
+    """Cassette captured from the live ADS API."""
+    import requests
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = requests.get(f"{api_url}/search/query", headers=headers, params={
+        "q": f'orcid:"{orcid}"', "fl": ",".join(["id"] + SEARCH_FIELDS), "rows": 2000,
+    })
+    response.raise_for_status()
+    docs = response.json()["response"]["docs"]
+    bibcodes = [doc["bibcode"] for doc in docs]
+    print(f"  Recorded {len(docs)} search docs")
+
+    bulk = requests.post(f"{api_url}/metrics", headers=headers, json={"bibcodes": bibcodes})
+    bulk.raise_for_status()
+
+    by_bibcode = {}
+    for bibcode in bibcodes:
+        single = requests.get(f"{api_url}/metrics/{bibcode}", headers=headers)
+        if single.status_code == 200:
+            by_bibcode[bibcode] = single.json()
+    print(f"  Recorded bulk metrics and {len(by_bibcode)} single-bibcode metrics")
+
+    return {
+        "version": CASSETTE_VERSION,
+        "source": f"recorded {time.strftime('%Y-%m-%d')}",
+        "search": {"docs": docs},
+        "metrics": {"bulk": bulk.json(), "by_bibcode": by_bibcode},
+    }
+
+
+def load_cassette(path: Optional[Path], scale: int = 1, members: int = 0) -> dict:
+    if path is None:
+        return build_cassette(scale, members)
+    with open(path, encoding="utf-8") as f:
+        cassette = json.load(f)
+    if cassette.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version in {path}")
+    return cassette
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Faults:
+    """Fault injection settings (all off by default)."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # 429 burst: after this many successful requests, send `rate_limit_burst`
+    # 429s, then repeat every `rate_limit_every` successes (0 = once)
+    rate_limit_after: Optional[int] = None
+    rate_limit_burst: int = 1
+    rate_limit_every: int = 0
+    retry_after: int = 60
+    # Search rows ceiling (partial pages); None = honour the requested rows
+    rows_cap: Optional[int] = None
+    seed: int = 0
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], cassette: dict, faults: Faults):
+        super().__init__(address, StandInHandler)
+        self.cassette = cassette
+        self.lock = threading.Lock()
+        self.configure(faults)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def configure(self, faults: Faults) -> None:
+        """Apply new fault settings and reset counters."""
+        with self.lock:
+            self.faults = faults
+            self.rng = random.Random(faults.seed)
+            self.successes_until_limit = faults.rate_limit_after
+            self.burst_remaining = 0
+            self.stats: Dict[str, Any] = {"requests": 0, "by_endpoint": {}, "status": {}, "bytes": 0}
+
+    def admit(self) -> Tuple[bool, float]:
+        """Decide whether the next request is rate limited; returns (limited, delay)."""
+        with self.lock:
+            f = self.faults
+            delay = (f.latency_ms + self.rng.uniform(0, f.jitter_ms)) / 1000 if f.latency_ms or f.jitter_ms else 0.0
+            if self.successes_until_limit is not None and self.successes_until_limit <= 0 and not self.burst_remaining:
+                self.burst_remaining = f.rate_limit_burst
+                self.successes_until_limit = f.rate_limit_every or None
+            if self.burst_remaining:
+                self.burst_remaining -= 1
+                return True, delay
+            if self.successes_until_limit is not None:
+                self.successes_until_limit -= 1
+            return False, delay
+
+    def count(self, endpoint: str, status: int, size: int) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["by_endpoint"][endpoint] = self.stats["by_endpoint"].get(endpoint, 0) + 1
+            self.stats["status"][str(status)] = self.stats["status"].get(str(status), 0) + 1
+            self.stats["bytes"] += size
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def send_json(self, status: int, body: Any, endpoint: str, headers: Optional[dict] = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, str(value))
+        self.end_headers()
+        self.wfile.write(payload)
+        if endpoint:
+            self.server.count(endpoint, status, len(payload))
+
+    def route(self) -> Tuple[str, str]:
+        path = urlparse(self.path).path
+        if path.endswith("/search/query"):
+            return "search", ""
+        if path.endswith("/metrics"):
+            return "metrics-bulk", ""
+        if "/metrics/" in path:
+            return "metrics-single", unquote(path.rsplit("/metrics/", 1)[1])
+        return "", ""
+
+    def serve(self, method: str) -> None:
+        path = urlparse(self.path).path
+        if path == "/__stats" and method == "GET":
+            with self.server.lock:
+                stats = {**self.server.stats, "faults": asdict(self.server.faults)}
+            return self.send_json(200, stats, "")
+        if path == "/__reset" and method == "POST":
+            self.server.configure(self.server.faults)
+            return self.send_json(200, {"reset": True}, "")
+
+        endpoint, arg = self.route()
+        if ROUTE_METHODS.get(endpoint) != method:
+            return self.send_json(404, {"error": f"no route for {method} {path}"}, "unknown")
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self.send_json(401, {"error": "Unauthorized"}, endpoint)
+
+        body = b""
+        if method == "POST":
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        limited, delay = self.server.admit()
+        if delay:
+            time.sleep(delay)
+        reset = int(time.time()) + self.server.faults.retry_after
+        rate_headers = {"X-RateLimit-Limit": 5000, "X-RateLimit-Reset": reset}
+        if limited:
+            return self.send_json(429, {"error": "Too many requests"}, endpoint, {
+                **rate_headers, "X-RateLimit-Remaining": 0, "Retry-After": self.server.faults.retry_after,
+            })
+        rate_headers["X-RateLimit-Remaining"] = max(0, 5000 - self.server.stats["requests"])
+
+        if endpoint == "search":
+            return self.send_json(200, self.search(parse_qs(urlparse(self.path).query)), endpoint, rate_headers)
+        if endpoint == "metrics-bulk":
+            json.loads(body or b"{}")  # malformed bodies fail like the real API would
+            return self.send_json(200, self.server.cassette["metrics"]["bulk"], endpoint, rate_headers)
+        metrics = self.server.cassette["metrics"]["by_bibcode"].get(arg)
+        if metrics is None:
+            return self.send_json(404, {"Error": "Unable to get results!"}, endpoint, rate_headers)
+        return self.send_json(200, metrics, endpoint, rate_headers)
+
+    def search(self, params: Dict[str, List[str]]) -> dict:
+        """Solr-style response for one page of the cassette's docs."""
+        docs = self.server.cassette["search"]["docs"]
+        # Docs carrying ORCID fields only match queries naming one of their ORCIDs
+        wanted = set(ORCID_PATTERN.findall(params.get("q", [""])[0]))
+        if wanted:
+            docs = [doc for doc in docs if not {"orcid_pub", "orcid_user", "orcid_other"} & doc.keys()
+                    or wanted & set(doc.get("orcid_pub", []) + doc.get("orcid_user", []) + doc.get("orcid_other", []))]
+        fields = [f.strip() for value in params.get("fl", []) for f in value.split(",") if f.strip()]
+        rows = int(params.get("rows", ["10"])[0])
+        cap = self.server.faults.rows_cap
+        if cap:
+            rows = min(rows, cap)
+        cursor = params.get("cursorMark", [None])[0]
+        if "start" in params:
+            offset = int(params["start"][0])
+        else:
+            offset = 0 if cursor in (None, "*") else int(cursor)
+
+        page = []
+        for i, doc in enumerate(docs[offset:offset + rows], start=offset):
+            full = {"id": str(i), **doc}
+            page.append({k: full[k] for k in fields if k in full} if fields else full)
+
+        header_params = {"q": params.get("q", [""])[0], "fl": ",".join(fields), "rows": str(rows)}
+        result = {
+            "responseHeader": {"status": 0, "QTime": 1, "params": header_params},
+            "response": {"numFound": len(docs), "start": offset, "docs": page},
+        }
+        if cursor is not None:
+            result["nextCursorMark"] = str(offset + len(page))
+        return result
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.serve("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.serve("POST")
+
+
+def start_server(cassette: dict, faults: Faults, port: int = 0) -> StandInServer:
+    """Start a stand-in on 127.0.0.1 in a background thread."""
+    server = StandInServer(("127.0.0.1", port), cassette, faults)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline stand-in for the NASA ADS API.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Serve a cassette")
+    serve.add_argument("--cassette", type=Path, help="Cassette file (default: built from public/data)")
+    serve.add_argument("--scale", type=int, default=1, help="Replicate the built cassette N times")
+    serve.add_argument("--members", type=int, default=0, help="Synthetic group members in the built cassette")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency-ms", type=float, default=0.0)
+    serve.add_argument("--jitter-ms", type=float, default=0.0)
+    serve.add_argument("--rate-limit-after", type=int, help="Successful requests before a 429 burst")
+    serve.add_argument("--rate-limit-burst", type=int, default=1, help="429s per burst")
+    serve.add_argument("--rate-limit-every", type=int, default=0, help="Repeat the burst every N successes")
+    serve.add_argument("--retry-after", type=int, default=60, help="Retry-After seconds on 429s")
+    serve.add_argument("--rows-cap", type=int, help="Ceiling on search rows (partial pages)")
+    serve.add_argument("--seed", type=int, default=0)
+
+    build = sub.add_parser("build", help="Write a cassette built from public/data")
+    build.add_argument("--out", type=Path, required=True)
+    build.add_argument("--scale", type=int, default=1)
+    build.add_argument("--members", type=int, default=0)
+
+    record = sub.add_parser("record", help="Record a cassette from the live ADS API")
+    record.add_argument("--out", type=Path, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        cassette = build_cassette(args.scale, args.members)
+        write_json_atomic(args.out, cassette, ensure_ascii=False)
+        print(f"✓ Cassette with {len(cassette['search']['docs'])} docs written to {args.out}")
+        return 0
+
+    if args.command == "record":
+        token, orcid = os.getenv("ADS_DEV_KEY"), os.getenv("ADS_ORCID")
+        if not token or not orcid:
+            raise EnvironmentError("Both ADS_ORCID and ADS_DEV_KEY must be set to record.")
+        print("📡 Recording from the live ADS API...")
+        cassette = record_cassette("https://api.adsabs.harvard.edu/v1", token, orcid)
+        write_json_atomic(args.out, cassette, ensure_ascii=False)
+        print(f"✓ Cassette written to {args.out}")
+        return 0
+
+    faults = Faults(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_limit_after=args.rate_limit_after, rate_limit_burst=args.rate_limit_burst,
+        rate_limit_every=args.rate_limit_every, retry_after=args.retry_after,
+        rows_cap=args.rows_cap, seed=args.seed,
+    )
+    server = StandInServer(("127.0.0.1", args.port), load_cassette(args.cassette, args.scale, args.members), faults)
+    print(f"🛰️  ADS stand-in serving {len(server.cassette['search']['docs'])} docs")
+    print(f"   export ADS_API_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✓ Stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
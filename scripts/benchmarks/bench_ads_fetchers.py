@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark the ADS fetch scripts against the offline stand-in (ads_standin.py).
+
+Each fetcher runs in a fresh subprocess with ADS_API_URL pointed at an
+in-process stand-in and PUBLIC_DATA_DIR at a temporary directory, so the
+committed data is never touched and no secrets or network are needed.
+time.sleep is replaced in the child by a virtual clock: retry back-offs are
+recorded rather than slept, so a scenario that triggers the 60 s / 180 s
+retries still finishes in seconds and always behaves the same way.
+
+Scenarios (fault settings of the stand-in):
+
+- replay:        recorded responses, no faults
+- latency:       50 ms +- 10 ms per request
+- 429-at-start:  the first request is rate limited
+- 429-mid-run:   three 429s after 20 successful requests (a cold citations
+                 fetch makes ~50; a row notes when a 429 scenario never fired)
+- partial-pages: search rows capped at 100 (ADS row ceiling)
+
+Reported per fetcher: exit status, wall time, requests by status, request
+throughput, virtual back-off seconds, and records written vs. available.
+
+--group N instead compares group mode with one citations fetch per member
+on a cassette with N synthetic members, under the latency scenario: total
+requests and wall time of N separate fetch_ads_citations_to_data_dir.py runs
+against one fetch_ads_group.py run.
+
+Usage:
+    python scripts/benchmarks/bench_ads_fetchers.py [--scale 1] [--scenarios replay latency]
+    python scripts/benchmarks/bench_ads_fetchers.py --cassette recorded.json
+    python scripts/benchmarks/bench_ads_fetchers.py --group 8
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add scripts/ to path for shared imports
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ads_standin import Faults, load_cassette, start_server  # noqa: E402
+
+SCENARIOS: Dict[str, Faults] = {
+    "replay": Faults(),
+    "latency": Faults(latency_ms=50, jitter_ms=10),
+    "429-at-start": Faults(rate_limit_after=0, rate_limit_burst=1),
+    "429-mid-run": Faults(rate_limit_after=20, rate_limit_burst=3),
+    "partial-pages": Faults(rows_cap=100),
+}
+
+# Marks the child's summary line (the fetcher's own exit output follows it)
+RESULT_PREFIX = "bench-result: "
+
+FETCHERS = {
+    "publications": ["fetch_ads_publications_to_data_dir.py"],
+    "metrics": ["fetch_ads_metrics_to_data_dir.py", "--orcid", "0000-0000-0000-0000"],
+    "citations": ["fetch_ads_citations_to_data_dir.py"],
+}
+
+
+def run_child(argv: List[str]) -> None:
+    """Run one fetch script with a virtual clock; print a JSON summary line."""
+    sleeps: List[float] = []
+    time.sleep = sleeps.append  # retry back-offs are recorded, not slept
+
+    script = str(SCRIPTS_DIR / argv[0])
+    sys.argv = [script, *argv[1:]]
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    output = io.StringIO()
+    status = 0
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        status = exc.code if isinstance(exc.code, int) else 1
+    except Exception as exc:  # noqa: BLE001 - reported, not raised
+        status = 1
+        error = f"{type(exc).__name__}: {str(exc)[:120]}"
+    elapsed = time.perf_counter() - start
+
+    print(RESULT_PREFIX + json.dumps({
+        "status": status,
+        "error": error,
+        "seconds": round(elapsed, 4),
+        "backoff_seconds": sum(sleeps),
+        "retries": len(sleeps),
+        "tail": output.getvalue().strip().splitlines()[-1:] if status else [],
+    }), file=sys.__stdout__)
+
+
+def records_written(data_dir: Path, fetcher: str) -> int:
+    """Number of records the fetcher wrote (publications, bibcodes or citations)."""
+    paths = {
+        "publications": data_dir / "ads_publications.json",
+        "metrics": data_dir / "ads_metrics.json",
+        "citations": data_dir / "citations_by_year.json",
+    }
+    path = paths[fetcher]
+    if not path.exists():
+        return 0
+    with open(path) as f:
+        data = json.load(f)
+    if fetcher == "publications":
+        return len(data)
+    if fetcher == "metrics":
+        return data.get("basic stats", {}).get("number of papers", 0)
+    return sum(data.get("refereed", [])) + sum(data.get("nonrefereed", []))
+
+
+def expected_records(cassette: dict, fetcher: str) -> int:
+    docs = cassette["search"]["docs"]
+    if fetcher == "publications":
+        return len(docs)
+    if fetcher == "metrics":
+        return cassette["metrics"]["bulk"].get("basic stats", {}).get("number of papers", 0)
+    return sum(
+        count
+        for metrics in cassette["metrics"]["by_bibcode"].values()
+        for hist in metrics["histograms"]["citations"].values()
+        for count in hist.values()
+    )
+
+
+def run_fetcher(server, argv: List[str], env_extra: Dict[str, str]) -> dict:
+    """Run one fetcher against the stand-in in a fresh data dir; summary plus request count."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        data_dir.mkdir()
+        env = {
+            **os.environ,
+            "ADS_API_URL": server.base_url,
+            "ADS_DEV_KEY": "stand-in-token",
+            "ADS_ORCID": "0000-0000-0000-0000",
+            "PUBLIC_DATA_DIR": str(data_dir),
+            "PIPELINE_TIMING_DIR": str(Path(tmp) / "timing"),
+            **env_extra,
+        }
+        before = server.stats["requests"]
+        result = subprocess.run([sys.executable, __file__, "--child", *argv], env=env,
+                                capture_output=True, text=True)
+        summary = json.loads(next(
+            line[len(RESULT_PREFIX):] for line in result.stdout.splitlines()
+            if line.startswith(RESULT_PREFIX)
+        ))
+        summary["requests"] = server.stats["requests"] - before
+        summary["data_dir_files"] = sorted(p.name for p in data_dir.rglob("*.json"))
+        if (data_dir / "group" / "combined.json").exists():
+            with open(data_dir / "group" / "combined.json") as f:
+                summary["citations"] = json.load(f)["total_citations"]
+        else:
+            summary["citations"] = records_written(data_dir, "citations")
+    return summary
+
+
+def compare_group(members: int, scale: int) -> None:
+    """N per-member citations fetches vs. one group fetch, on the latency scenario."""
+    cassette = load_cassette(None, scale, members)
+    orcids = cassette["members"]
+    server = start_server(cassette, SCENARIOS["latency"])
+    print(f"🛰️  Stand-in at {server.base_url} with {len(cassette['search']['docs']):,} docs, "
+          f"{members} members")
+
+    separate = {"seconds": 0.0, "requests": 0, "citations": 0, "status": 0}
+    for orcid in orcids:
+        summary = run_fetcher(server, FETCHERS["citations"], {"ADS_ORCID": orcid})
+        for key in ("seconds", "requests", "citations"):
+            separate[key] += summary[key]
+        separate["status"] = max(separate["status"], summary["status"])
+
+    group = run_fetcher(server, ["fetch_ads_group.py", "--orcids", *orcids], {})
+    if group["error"] or group["tail"]:
+        print(f"   └ {group['error'] or group['tail'][0]}")
+    server.shutdown()
+
+    print(f"\n{'mode':<22} {'exit':>4} {'wall':>8} {'req':>6} {'citations':>10}")
+    print(f"{f'{members} x single':<22} {separate['status']:>4} {separate['seconds']:>7.2f}s "
+          f"{separate['requests']:>6} {separate['citations']:>10,}")
+    print(f"{'group':<22} {group['status']:>4} {group['seconds']:>7.2f}s "
+          f"{group['requests']:>6} {group['citations']:>10,}")
+    print("   (per-member citation totals double-count co-authored papers; the group total does not)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ADS fetchers against the offline stand-in.")
+    parser.add_argument("--cassette", type=Path, help="Cassette file (default: built from public/data)")
+    parser.add_argument("--scale", type=int, default=1, help="Replicate the built cassette N times")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--fetchers", nargs="+", choices=list(FETCHERS), default=list(FETCHERS))
+    parser.add_argument("--group", type=int, metavar="N", help="Compare group mode with N members instead")
+    parser.add_argument("--child", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return 0
+    if args.group:
+        compare_group(args.group, args.scale)
+        return 0
+
+    cassette = load_cassette(args.cassette, args.scale)
+    server = start_server(cassette, Faults())
+    print(f"🛰️  Stand-in at {server.base_url} with {len(cassette['search']['docs']):,} docs")
+
+    header = (f"{'scenario':<14} {'fetcher':<13} {'exit':>4} {'wall':>8} {'req':>6} {'429':>4} "
+              f"{'req/s':>8} {'backoff':>8} {'records':>17}")
+    print(f"\n{header}")
+    for scenario in args.scenarios:
+        for fetcher in args.fetchers:
+            server.configure(SCENARIOS[scenario])
+            with tempfile.TemporaryDirectory() as tmp:
+                data_dir = Path(tmp) / "data"
+                data_dir.mkdir()
+                env = {
+                    **os.environ,
+                    "ADS_API_URL": server.base_url,
+                    "ADS_DEV_KEY": "stand-in-token",
+                    "ADS_ORCID": "0000-0000-0000-0000",
+                    "PUBLIC_DATA_DIR": str(data_dir),
+                    "PIPELINE_TIMING_DIR": str(Path(tmp) / "timing"),
+                }
+                result = subprocess.run(
+                    [sys.executable, __file__, "--child", *FETCHERS[fetcher]],
+                    env=env, capture_output=True, text=True,
+                )
+                summary = json.loads(next(
+                    line[len(RESULT_PREFIX):] for line in result.stdout.splitlines()
+                    if line.startswith(RESULT_PREFIX)
+                ))
+                written = records_written(data_dir, fetcher)
+
+            stats = server.stats
+            requests = stats["requests"]
+            limited = stats["status"].get("429", 0)
+            rate = requests / summary["seconds"] if summary["seconds"] else 0.0
+            expected = expected_records(cassette, fetcher)
+            records = f"{written:,}/{expected:,}" + ("" if written == expected else " ⚠️")
+            print(f"{scenario:<14} {fetcher:<13} {summary['status']:>4} {summary['seconds']:>7.2f}s "
+                  f"{requests:>6} {limited:>4} {rate:>8.1f} {summary['backoff_seconds']:>7.0f}s {records:>17}")
+            if summary["error"] or summary["tail"]:
+                print(f"{'':<14} └ {summary['error'] or summary['tail'][0]}")
+            threshold = SCENARIOS[scenario].rate_limit_after
+            if threshold is not None and not limited:
+                print(f"{'':<14} └ ⚠️  no 429 sent: {requests} request(s), limit after {threshold}")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak RSS of the figure audit workbook writers.
+
+Builds a synthetic corpus (papers of 20 figures, each with its own cached
+thumbnail PNG) and writes the audit workbook in both modes, each run in a
+fresh subprocess so ru_maxrss reflects that run alone:
+
+- in-memory: create_audit_workbook() + Workbook.save()
+- streaming: write_audit_workbook_streaming() (openpyxl write-only mode)
+
+The streaming writer's peak RSS should stay roughly flat from 100 to
+5,000 figures while the in-memory writer grows with the figure count.
+
+Usage:
+    python scripts/benchmarks/bench_audit_workbook.py [--sizes 100 1000 5000]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add scripts/ to path for shared imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FIGURES_PER_PAPER = 20
+DEFAULT_SIZES = [100, 500, 1000, 2500, 5000]
+
+
+def build_synthetic_corpus(root: Path, n_figures: int) -> tuple[dict, dict, dict[Path, Path]]:
+    """
+    Create a synthetic corpus under root.
+
+    Returns:
+        (papers, registry, thumbnails) shaped like load_corpus(),
+        load_figure_registry() and build_thumbnail_cache() output.
+    """
+    from PIL import Image
+    from corpus import CorpusPaper
+    from generate_figure_audit_workbook import THUMB_WIDTH, THUMB_HEIGHT
+
+    thumbs_dir = root / "thumbs"
+    thumbs_dir.mkdir(parents=True, exist_ok=True)
+
+    papers = {}
+    registry = {}
+    thumbnails = {}
+    caption = "Synthetic technical caption describing panels, axes and units. " * 8
+
+    for paper_idx in range((n_figures + FIGURES_PER_PAPER - 1) // FIGURES_PER_PAPER):
+        paper_id = f"Synthetic_{paper_idx:04d}"
+        paper_dir = root / "papers" / paper_id
+        figures_dir = paper_dir / "figures"
+        n = min(FIGURES_PER_PAPER, n_figures - paper_idx * FIGURES_PER_PAPER)
+
+        figures = []
+        pdf_files = []
+        for i in range(1, n + 1):
+            fig_id = f"fig_{i}"
+            figures.append({
+                "figure_id": fig_id,
+                "multi_panel": i % 2 == 0,
+                "panel_count": i % 4 + 1,
+                "technical_caption": caption,
+            })
+            pdf_files.append(f"{fig_id}.pdf")
+            registry[f"{paper_id}/{fig_id}"] = {}
+
+            # Distinct image per figure so image bytes scale with the corpus
+            thumb = thumbs_dir / f"{paper_id}_{fig_id}.png"
+            Image.new("RGB", (THUMB_WIDTH, THUMB_HEIGHT), (paper_idx % 256, i * 10 % 256, 128)).save(thumb)
+            thumbnails[figures_dir / f"{fig_id}.pdf"] = thumb
+
+        papers[paper_id] = CorpusPaper(paper_id, paper_dir, {"figures": figures}, tuple(sorted(pdf_files)))
+
+    return papers, registry, thumbnails
+
+
+def run_child(mode: str, n_figures: int) -> None:
+    """Build the corpus and write one workbook, then report timings and peak RSS."""
+    import contextlib
+    import io
+
+    from generate_figure_audit_workbook import create_audit_workbook, write_audit_workbook_streaming
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        papers, registry, thumbnails = build_synthetic_corpus(root, n_figures)
+        baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        output_path = root / "out" / "figure-audit.xlsx"
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if mode == "streaming":
+                write_audit_workbook_streaming(papers, registry, root, thumbnails, output_path)
+            else:
+                wb = create_audit_workbook(papers, registry, root, thumbnails)
+                output_path.parent.mkdir(exist_ok=True)
+                wb.save(output_path)
+        elapsed = time.perf_counter() - start
+
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(json.dumps({
+            "mode": mode,
+            "figures": n_figures,
+            "seconds": round(elapsed, 3),
+            "baseline_rss_mb": round(baseline_kb / 1024, 1),
+            "peak_rss_mb": round(peak_kb / 1024, 1),
+            "output_mb": round(output_path.stat().st_size / 1024 / 1024, 2),
+        }))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark audit workbook peak RSS.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--modes", nargs="+", default=["in-memory", "streaming"],
+                        choices=["in-memory", "streaming"])
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "FIGURES"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]))
+        return 0
+
+    print(f"{'mode':<10} {'figures':>8} {'seconds':>8} {'peak RSS':>10} {'Δ RSS':>8}")
+    for mode in args.modes:
+        for size in args.sizes:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(size)],
+                capture_output=True, text=True, check=True,
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            delta = r["peak_rss_mb"] - r["baseline_rss_mb"]
+            print(f"{r['mode']:<10} {r['figures']:>8} {r['seconds']:>8.2f} "
+                  f"{r['peak_rss_mb']:>8.1f}MB {delta:>6.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data scripts against synthetic corpora at 10x, 100x and 1000x.
+
+For each scale a synthetic tree is written (see synthetic_corpus.py) and
+these workloads are timed, best of --rounds:
+
+- statistics:        generate_publication_statistics.main()
+- registry-load:     load_corpus_metadata() + load_topic_refs()
+- registry:          generate_registry()
+- merge:             merge_conferences()
+- authors:           standardize_author_name() over every author of every publication
+- render:<script>:   the plot spans of each timeline script, run as a
+                     subprocess against the tree (interpreter start-up and
+                     imports excluded, read from its timing report)
+
+Timings are also stored normalized by a fixed CPU calibration workload, so
+baselines recorded on one machine can be checked on another. --record
+writes scripts/benchmarks/baselines.json; --check exits 1 when a workload's
+normalized time exceeds its baseline by more than --tolerance (workloads
+under --min-seconds are reported but never fail).
+
+Usage:
+    python scripts/benchmarks/bench_data_pipeline.py                  # 10x, 100x, 1000x
+    python scripts/benchmarks/bench_data_pipeline.py --scales 10 100 --check
+    python scripts/benchmarks/bench_data_pipeline.py --record
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add scripts/ to path for shared imports
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_corpus import write_synthetic_tree  # noqa: E402
+from utils import write_json_atomic  # noqa: E402
+
+BASELINES_PATH = Path(__file__).resolve().parent / "baselines.json"
+DEFAULT_SCALES = [10, 100, 1000]
+TIMELINE_SCRIPTS = [
+    "generate_publications_timeline",
+    "generate_citations_timeline",
+    "generate_h_index_timeline",
+]
+
+
+def best_of(rounds: int, fn: Callable[[], None]) -> float:
+    """Fastest of `rounds` timed calls, stdout suppressed."""
+    best = float("inf")
+    for _ in range(rounds):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Seconds for a fixed pure-Python workload (JSON round trip, sort, string ops)."""
+    payload = [{"title": f"Synthetic title {i}", "authors": [f"Author, {j}." for j in range(8)],
+                "year": str(2000 + i % 25), "citations": i % 97} for i in range(20_000)]
+
+    def workload() -> None:
+        data = json.loads(json.dumps(payload))
+        data.sort(key=lambda p: (p["year"], -p["citations"], p["title"]))
+        sum(len(a.lower().split(",")) for p in data for a in p["authors"])
+
+    return best_of(rounds, workload)
+
+
+def in_process_benchmarks(root: Path) -> Dict[str, Callable[[], None]]:
+    """Workloads run inside this interpreter against the tree at root."""
+    import generate_publication_statistics
+    from author_names import standardize_author_name
+    from generate_figure_registry_from_corpus import generate_registry, load_corpus_metadata, load_topic_refs
+    from merge_invited_conferences import merge_conferences
+    from records import InvitedTalk, Publication, load_records
+
+    data_dir = root / "public" / "data"
+
+    ads_pubs = load_records(data_dir / "ads_publications.json", Publication)
+    non_ads = load_records(data_dir / "non_ads_publications.json", Publication)
+    invited_conf = load_records(data_dir / "invited_conferences.json", InvitedTalk)
+    corpus_dir = root / "research-corpus"
+    papers = load_corpus_metadata(corpus_dir)
+    topic_usage = load_topic_refs(data_dir, write=False)
+
+    def load_registry_inputs() -> None:
+        load_corpus_metadata(corpus_dir)
+        load_topic_refs(data_dir, write=False)
+
+    def standardize_all() -> None:
+        for pub in ads_pubs:
+            for author in pub.authors:
+                standardize_author_name(author)
+
+    return {
+        "statistics": generate_publication_statistics.main,
+        "registry-load": load_registry_inputs,
+        "registry": lambda: generate_registry(papers, topic_usage, root),
+        "merge": lambda: merge_conferences(ads_pubs, invited_conf, non_ads),
+        "authors": standardize_all,
+    }
+
+
+def render_seconds(root: Path, script: str) -> float:
+    """Plot-span time of one timeline script run against the tree at root."""
+    timing_dir = root / "timing"
+    env = {
+        **os.environ,
+        "PUBLIC_DATA_DIR": str(root / "public" / "data"),
+        "PUBLIC_PLOTS_DIR": str(root / "public" / "plots"),
+        "PIPELINE_TIMING_DIR": str(timing_dir),
+    }
+    env.pop("PIPELINE_PROFILE", None)
+    subprocess.run([sys.executable, str(SCRIPTS_DIR / f"{script}.py")], env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    with open(timing_dir / f"{script}.json") as f:
+        report = json.load(f)
+    return sum(span["wall_seconds"] for span in report["spans"] if span["name"] == "plot")
+
+
+def run_scale(scale: int, rounds: int, only: Optional[List[str]], keep: bool) -> Dict[str, float]:
+    """Write a tree at `scale` and time every selected workload on it."""
+    tmp = tempfile.mkdtemp(prefix=f"bench-{scale}x-") if keep else None
+    with (contextlib.nullcontext(tmp) if keep else tempfile.TemporaryDirectory()) as tmp_dir:
+        root = Path(tmp_dir)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            counts = write_synthetic_tree(root, scale)
+        print(f"\n📦 {scale}x tree: {counts['ads_publications']:,} ADS publications, "
+              f"{counts['figures']:,} figures in {counts['papers']:,} papers, {counts['topics']:,} topics "
+              f"({time.perf_counter() - start:.1f}s to generate)")
+
+        previous = {k: os.environ.get(k) for k in ("PUBLIC_DATA_DIR", "PUBLIC_PLOTS_DIR")}
+        os.environ["PUBLIC_DATA_DIR"] = str(root / "public" / "data")
+        os.environ["PUBLIC_PLOTS_DIR"] = str(root / "public" / "plots")
+        try:
+            results = {}
+            with contextlib.redirect_stdout(io.StringIO()):
+                workloads = in_process_benchmarks(root)
+            for name, fn in workloads.items():
+                if only and name not in only:
+                    continue
+                results[name] = best_of(rounds, fn)
+                print(f"   {name:<40} {results[name] * 1000:>10.1f} ms")
+            for script in TIMELINE_SCRIPTS:
+                name = f"render:{script}"
+                if only and name not in only and "render" not in only:
+                    continue
+                results[name] = min(render_seconds(root, script) for _ in range(rounds))
+                print(f"   {name:<40} {results[name] * 1000:>10.1f} ms")
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+        if keep:
+            print(f"   Tree kept at {root}")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], calibration: float, baselines: dict,
+            tolerance: float, min_seconds: float) -> List[str]:
+    """Print normalized times against the baselines; returns regressions."""
+    regressions = []
+    base_results = baselines.get("results", {})
+    print(f"\n{'workload':<44} {'scale':>6} {'norm':>9} {'baseline':>9} {'ratio':>7}")
+    for scale_key, timings in results.items():
+        for name, seconds in timings.items():
+            normalized = seconds / calibration
+            base = base_results.get(scale_key, {}).get(name)
+            if base is None:
+                print(f"{name:<44} {scale_key:>6} {normalized:>9.3f} {'-':>9} {'-':>7}")
+                continue
+            ratio = normalized / base["normalized"] if base["normalized"] else float("inf")
+            flag = ""
+            if ratio > tolerance and seconds >= min_seconds:
+                flag = "  ❌ regression"
+                regressions.append(f"{name} @ {scale_key}: {ratio:.2f}x baseline")
+            print(f"{name:<44} {scale_key:>6} {normalized:>9.3f} {base['normalized']:>9.3f} "
+                  f"{ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the data scripts on synthetic corpora.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Multiples of today's corpus size")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed runs per workload (best is kept)")
+    parser.add_argument("--only", nargs="+", help="Workload names to run ('render' for all plots)")
+    parser.add_argument("--record", action="store_true", help=f"Write results to {BASELINES_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions against the baselines")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="Allowed normalized slowdown before --check fails (default 1.5x)")
+    parser.add_argument("--min-seconds", type=float, default=0.02,
+                        help="Workloads faster than this never fail --check")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic trees")
+    args = parser.parse_args()
+
+    calibration = calibrate()
+    print(f"⏱️  Calibration workload: {calibration * 1000:.1f} ms")
+
+    results = {f"{scale}x": run_scale(scale, args.rounds, args.only, args.keep) for scale in args.scales}
+
+    baselines = {}
+    if BASELINES_PATH.exists():
+        with open(BASELINES_PATH) as f:
+            baselines = json.load(f)
+    regressions = compare(results, calibration, baselines, args.tolerance, args.min_seconds)
+
+    if args.record:
+        recorded = baselines.get("results", {})
+        for scale_key, timings in results.items():
+            recorded.setdefault(scale_key, {}).update({
+                name: {"seconds": round(seconds, 4), "normalized": round(seconds / calibration, 4)}
+                for name, seconds in timings.items()
+            })
+        write_json_atomic(BASELINES_PATH, {
+            "version": 1,
+            "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "calibration_seconds": round(calibration, 4),
+            "results": dict(sorted(recorded.items(), key=lambda kv: int(kv[0].rstrip("x")))),
+        }, trailing_newline=True)
+        print(f"\n💾 Baselines written to {BASELINES_PATH.name}")
+
+    if args.check and regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance}x:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    if args.check:
+        print(f"\n✓ No regressions beyond {args.tolerance}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
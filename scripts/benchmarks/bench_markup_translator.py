@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass markup translator against the chained re.sub passes.
+
+Inputs are every title in public/data (ADS, pre-fix ADS snapshot, non-ADS
+and invited talks), each also in an HTML-marked-up and a LaTeX-marked-up
+variant. The legacy implementations below are verbatim copies of the
+previous convert_html_to_unicode() and strip_latex_formatting(). Outputs,
+including printed warnings, are asserted identical before timing:
+
+- legacy: chained passes
+- cold:   markup_translator with the memo cache cleared every round
+- warm:   markup_translator with the memo cache kept (repeated titles)
+
+Usage:
+    python scripts/benchmarks/bench_markup_translator.py [--rounds 20]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add scripts/ to path for shared imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from markup_translator import (  # noqa: E402
+    SUBSCRIPT_MAP, SUPERSCRIPT_MAP, _html_to_unicode, html_to_unicode, strip_latex,
+)
+from utils import get_public_data_dir  # noqa: E402
+
+DATA_FILES = [
+    "ads_publications.json",
+    "ads_publications.pre-fixes.json",
+    "non_ads_publications.json",
+    "invited_conferences.json",
+    "invited_presentations.json",
+    "invited_public.json",
+]
+
+
+# ---------------------------------------------------------------------------
+# Legacy implementations (chained passes)
+# ---------------------------------------------------------------------------
+
+def legacy_convert_html_to_unicode(text: str) -> str:
+    if not text:
+        return text
+
+    def convert_superscript(match):
+        content = match.group(1)
+        result = ''.join(SUPERSCRIPT_MAP.get(c, c) for c in content)
+        unconverted = [c for c in content if c not in SUPERSCRIPT_MAP and not c.isspace()]
+        if unconverted:
+            print(f"⚠️  Warning: No superscript mapping for: {unconverted} in '{content}'")
+        return result
+
+    def convert_subscript(match):
+        content = match.group(1)
+        result = ''.join(SUBSCRIPT_MAP.get(c, c) for c in content)
+        unconverted = [c for c in content if c not in SUBSCRIPT_MAP and not c.isspace()]
+        if unconverted:
+            print(f"⚠️  Warning: No subscript mapping for: {unconverted} in '{content}'")
+        return result
+
+    text = re.sub(r'<SUP>([^<]+)</SUP>', convert_superscript, text, flags=re.IGNORECASE)
+    text = re.sub(r'<sub>([^<]+)</sub>', convert_subscript, text, flags=re.IGNORECASE)
+    text = re.sub(r'</?i>', '', text, flags=re.IGNORECASE)
+    return text
+
+
+def legacy_strip_latex_formatting(text: str) -> str:
+    if not text:
+        return ""
+    text = text.replace("~", " ")
+    while r"\textsuperscript{" in text:
+        text = re.sub(r"\\textsuperscript\{([^}]*)\}", r"\1", text)
+    while re.search(r"\\(?:textbf|emph|textit|textsc|textrm|text)\{", text):
+        text = re.sub(
+            r"\\(?:textbf|emph|textit|textsc|textrm|text)\{([^}]*)\}",
+            r"\1",
+            text,
+        )
+    text = text.replace("{", "").replace("}", "")
+    text = re.sub(r"\\(?:textbf|emph|textit|textsc|textrm)", "", text)
+    text = re.sub(r"\\([&$%#_])", r"\1", text)
+    text = text.replace("\\", "")
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def load_titles() -> list[str]:
+    """All titles from the publication and talk data files."""
+    data_dir = get_public_data_dir()
+    titles = []
+    for name in DATA_FILES:
+        path = data_dir / name
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                titles.extend(e["title"] for e in json.load(f) if e.get("title"))
+    return titles
+
+
+def html_variant(title: str, i: int) -> str:
+    """Re-introduce ADS-style markup: ions, subscripts, italics, an unmapped char."""
+    words = title.split()
+    mid = len(words) // 2
+    marks = ["He<SUP>2+</SUP>", "O<sup>7+</sup>/O<SUP>6+</SUP>", "T<sub>e</sub>", "<i>in situ</i>",
+             "v<sub>A</sub>", "n<SUP>Q</SUP>"]
+    return " ".join(words[:mid] + [marks[i % len(marks)]] + words[mid:])
+
+
+def latex_variant(title: str, i: int) -> str:
+    """BibTeX-style markup: braces, bold, escapes, non-breaking spaces, ordinals."""
+    words = title.split()
+    if words:
+        words[0] = "{" + words[0] + "}"
+    if len(words) > 2:
+        words[2] = r"\textbf{" + words[2] + "}"
+    return "~".join(words[:2]) + " " + " ".join(words[2:]) + \
+        [r" \& co", r" (3\textsuperscript{rd} of 7)", r" \emph{et al.}", r" 50\%"][i % 4]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the markup translator.")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the input list")
+    args = parser.parse_args()
+
+    titles = load_titles()
+    html_inputs = titles + [html_variant(t, i) for i, t in enumerate(titles)]
+    latex_inputs = titles + [latex_variant(t, i) for i, t in enumerate(titles)]
+    print(f"Inputs: {len(html_inputs)} HTML-path strings, {len(latex_inputs)} LaTeX-path strings "
+          f"({len(set(titles))} unique titles)")
+
+    # Equivalence, including printed warnings
+    for label, legacy, new, inputs in [
+        ("html", legacy_convert_html_to_unicode, html_to_unicode, html_inputs),
+        ("latex", legacy_strip_latex_formatting, strip_latex, latex_inputs),
+    ]:
+        old_out, new_out = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(old_out):
+            expected = [legacy(t) for t in inputs]
+        with contextlib.redirect_stdout(new_out):
+            actual = [new(t) for t in inputs]
+        mismatches = [(t, e, a) for t, e, a in zip(inputs, expected, actual) if e != a]
+        assert not mismatches, f"{label}: {len(mismatches)} mismatches, first: {mismatches[0]}"
+        assert old_out.getvalue() == new_out.getvalue(), f"{label}: warning output differs"
+        print(f"  ✓ {label}: outputs and warnings identical")
+
+    def timed(fn, inputs, clear=None) -> float:
+        """Best of 5 repeats, to damp scheduler noise."""
+        best = float("inf")
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(args.rounds):
+                    if clear:
+                        clear()
+                    for t in inputs:
+                        fn(t)
+                best = min(best, time.perf_counter() - start)
+        return best
+
+    print(f"\n{'path':<6} {'legacy':>9} {'cold':>9} {'warm':>9}   ({args.rounds} rounds)")
+    for label, legacy, new, clear, inputs in [
+        ("html", legacy_convert_html_to_unicode, html_to_unicode, _html_to_unicode.cache_clear, html_inputs),
+        ("latex", legacy_strip_latex_formatting, strip_latex, strip_latex.cache_clear, latex_inputs),
+    ]:
+        t_legacy = timed(legacy, inputs)
+        t_cold = timed(new, inputs, clear)
+        t_warm = timed(new, inputs)
+        print(f"{label:<6} {t_legacy * 1000:>7.1f}ms {t_cold * 1000:>7.1f}ms {t_warm * 1000:>7.1f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Compare plain dicts with the record types of records.py on synthetic corpora.
+
+For each scale a synthetic tree is written (see synthetic_corpus.py) and,
+for the publication list and the figure registry, both representations are
+measured:
+
+- memory:  bytes allocated per entry while decoding (tracemalloc, the decoded
+           structure only)
+- decode:  file bytes -> dicts (json) vs. file bytes -> records
+- encode:  entries -> the bytes the scripts write (indent=2, ensure_ascii=False)
+
+Both encodings are checked to be byte-identical before timings are reported.
+
+Usage:
+    python scripts/benchmarks/bench_records.py [--scales 10 100] [--rounds 3]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+# Add scripts/ to path for shared imports
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import JSON_BACKEND  # noqa: E402
+from records import Figure, Publication, decode_records, encode_records, to_builtins  # noqa: E402
+from synthetic_corpus import write_synthetic_tree  # noqa: E402
+from utils import json_bytes  # noqa: E402
+
+
+def best_of(rounds: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def allocated(fn: Callable[[], Any]) -> int:
+    """Bytes still allocated by fn's result once it returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def compare(name: str, body: bytes, record_type: type, rounds: int) -> None:
+    dicts = json.loads(body)
+    records = decode_records(body, record_type)
+    count = len(dicts)
+
+    plain = json_bytes(dicts, ensure_ascii=False)
+    typed = encode_records(records, ensure_ascii=False)
+    if plain != typed or to_builtins(records) != dicts:
+        print(f"{name:<14} ⚠️  record encoding differs from the dict encoding")
+        return
+
+    rows = [
+        ("bytes/entry", allocated(lambda: json.loads(body)) / count,
+         allocated(lambda: decode_records(body, record_type)) / count, "{:,.0f}"),
+        ("decode", best_of(rounds, lambda: json.loads(body)),
+         best_of(rounds, lambda: decode_records(body, record_type)), "{:.3f}s"),
+        ("encode", best_of(rounds, lambda: json_bytes(dicts, ensure_ascii=False)),
+         best_of(rounds, lambda: encode_records(records, ensure_ascii=False)), "{:.3f}s"),
+    ]
+    for metric, before, after, fmt in rows:
+        change = (after / before - 1) * 100 if before else 0.0
+        print(f"{name:<14} {metric:<12} {fmt.format(before):>10} {fmt.format(after):>10} {change:>+7.0f}%")
+        name = ""
+
+
+def run_scale(scale: int, rounds: int) -> None:
+    from generate_figure_registry_from_corpus import generate_registry, load_corpus_metadata, load_topic_refs
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_synthetic_tree(root, scale)
+        data_dir = root / "public" / "data"
+        with contextlib.redirect_stdout(io.StringIO()):
+            papers = load_corpus_metadata(root / "research-corpus")
+            topic_usage = load_topic_refs(data_dir, write=False)
+            registry = generate_registry(papers, topic_usage, root)
+        registry_body = encode_records(registry, ensure_ascii=False)
+
+        publications = (data_dir / "ads_publications.json").read_bytes()
+        print(f"\n{scale}x: {len(json.loads(publications)):,} publications, {len(registry):,} figures")
+        compare("publications", publications, Publication, rounds)
+        compare("registry", registry_body, Figure, rounds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare dicts with record types on synthetic corpora.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"JSON backend: {JSON_BACKEND}")
+    print(f"{'':<14} {'':<12} {'dicts':>10} {'records':>10} {'change':>8}")
+    for scale in args.scales:
+        run_scale(scale, args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
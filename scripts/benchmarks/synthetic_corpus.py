@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Synthetic data trees for the data-pipeline benchmarks.
+
+Scales today's data by a factor (10x, 100x, ...) and writes it in the same
+layout as the repository, so scripts can run against it unchanged with
+PUBLIC_DATA_DIR / PUBLIC_PLOTS_DIR pointed at the tree:
+
+    <root>/public/data/ads_publications.json, non_ads_publications.json,
+        invited_presentations.json, invited_conferences.json,
+        ads_metrics.json, citations_by_year.json, research-topics/*.json
+    <root>/public/plots/
+    <root>/research-corpus/papers/<paper_id>/paper_metadata.json
+
+Publications and invited entries are resampled from the real files with
+fresh bibcodes, shuffled titles and author orders; a quarter of the author
+names are rewritten into the raw ADS variants author standardization has to
+recognise. Half of the invited conferences point at a synthetic ADS bibcode
+(enrichment path), the rest have none (non-ADS path). ads_metrics.json keeps
+its year-keyed shape with every count multiplied by the scale. Corpus papers
+reuse the real figure texts from figure-registry.json, and topics reference
+random corpus figures.
+
+Generation is seeded, so a given scale always produces the same tree.
+
+Usage:
+    python scripts/benchmarks/synthetic_corpus.py --scale 100 --out /tmp/synthetic-100
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add scripts/ to path for shared imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from author_names import AUTHOR_STANDARDIZATION_CONFIG  # noqa: E402
+from utils import get_repo_root  # noqa: E402
+
+REAL_DATA_DIR = get_repo_root() / "public" / "data"
+
+
+def load_real(filename: str, default: Any = None) -> Any:
+    path = REAL_DATA_DIR / filename
+    if not path.exists():
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def current_sizes() -> Dict[str, int]:
+    """Today's corpus size: the 1x baseline every scale multiplies."""
+    registry = load_real("figure-registry.json", {})
+    return {
+        "ads_publications": len(load_real("ads_publications.json", [])),
+        "non_ads_publications": len(load_real("non_ads_publications.json", [])),
+        "invited_presentations": len(load_real("invited_presentations.json", [])),
+        "invited_conferences": len(load_real("invited_conferences.json", [])),
+        "topics": len(list((REAL_DATA_DIR / "research-topics").glob("*.json"))),
+        "papers": len({entry["paper_id"] for entry in registry.values()}),
+        "figures": len(registry),
+    }
+
+
+def author_variants() -> List[str]:
+    """Raw ADS spellings of the configured authors (see author_names.py)."""
+    variants = []
+    for rule in AUTHOR_STANDARDIZATION_CONFIG.values():
+        last, first, middle = rule["last_name"], rule["first_initial"], rule.get("middle_initial", "")
+        for name in rule.get("first_names", []):
+            variants += [f"{last}, {name} {middle}.", f"{last}, {name}", f"{name} {middle}. {last}"]
+        variants += [f"{last}, {first}.", f"{first}. {middle}. {last}"]
+        if middle:
+            variants += [f"{last}, {first}.{middle}.", f"{last}, {first}. {middle}. {middle}."]
+    return variants
+
+
+def shuffled_title(rng: random.Random, title: str, serial: int) -> str:
+    words = title.split()
+    rng.shuffle(words)
+    return " ".join(words) + f" ({serial})"
+
+
+def synthetic_bibcode(year: str, serial: int) -> str:
+    # 19 characters like real bibcodes: YYYYJJJJJVVVVMPPPPA
+    return f"{(year or '2020')[:4]}SYN..{serial:08d}X"
+
+
+def make_publications(rng: random.Random, templates: List[dict], count: int, prefix: str,
+                      variants: List[str]) -> List[dict]:
+    canonical = {rule["canonical"] for rule in AUTHOR_STANDARDIZATION_CONFIG.values()}
+    publications = []
+    for serial in range(count):
+        pub = copy.deepcopy(rng.choice(templates))
+        pub["title"] = shuffled_title(rng, pub.get("title", ""), serial)
+        if "bibcode" in pub:
+            pub["bibcode"] = (synthetic_bibcode(pub.get("year", ""), serial) if prefix == "ads"
+                              else f"NOADS-SYN-{serial}")
+        authors = list(pub.get("authors", []))
+        if len(authors) > 1:
+            tail = authors[1:]
+            rng.shuffle(tail)
+            authors = authors[:1] + tail
+        if variants and rng.random() < 0.25:
+            authors = [rng.choice(variants) if a in canonical else a for a in authors]
+        pub["authors"] = authors
+        publications.append(pub)
+    return publications
+
+
+def make_invited_conferences(rng: random.Random, templates: List[dict], count: int,
+                             ads_pubs: List[dict]) -> List[dict]:
+    conferences = []
+    for serial in range(count):
+        conf = copy.deepcopy(rng.choice(templates))
+        conf["title"] = shuffled_title(rng, conf.get("title", ""), serial)
+        conf.pop("invited_url", None)
+        if ads_pubs and serial % 2 == 0:
+            conf["bibcode"] = rng.choice(ads_pubs)["bibcode"]
+        conferences.append(conf)
+    return conferences
+
+
+def scale_counts(value: Any, scale: int) -> Any:
+    """Multiply every number in a nested metrics structure, keeping its shape."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value * scale
+    if isinstance(value, dict):
+        return {k: scale_counts(v, scale) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scale_counts(v, scale) for v in value]
+    return value
+
+
+def make_corpus(rng: random.Random, count: int) -> Dict[str, dict]:
+    """paper_id -> paper_metadata.json content, figures taken from the real registry."""
+    registry = load_real("figure-registry.json", {})
+    by_paper: Dict[str, List[dict]] = {}
+    for entry in registry.values():
+        by_paper.setdefault(entry["paper_id"], []).append(entry)
+    templates = list(by_paper.values()) or [[]]
+
+    papers = {}
+    for serial in range(count):
+        paper_id = f"Synthetic_{serial:06d}"
+        figures = []
+        for entry in rng.choice(templates):
+            figures.append({
+                "figure_id": entry["figure_id"],
+                "short_title": entry.get("short_title", ""),
+                "summary": entry.get("summary"),
+                "metadata": {"keywords": entry.get("keywords", [])},
+                "technical_caption": entry.get("technical_caption", ""),
+            })
+        papers[paper_id] = {"paper": {"id": paper_id}, "figures": figures}
+    return papers
+
+
+def make_topics(rng: random.Random, count: int, papers: Dict[str, dict]) -> Dict[str, dict]:
+    refs = [f"{pid}/{fig['figure_id']}" for pid, paper in papers.items() for fig in paper["figures"]]
+    topics = {}
+    for serial in range(count):
+        slug = f"synthetic-topic-{serial:05d}"
+        chosen = rng.sample(refs, min(len(refs), 4)) if refs else []
+        topic = {
+            "slug": slug,
+            "title": f"Synthetic Topic {serial}",
+            "related_figures": [{"ref": ref, "relevance": "synthetic"} for ref in chosen[1:]],
+            "related_topics": [],
+            "published": True,
+        }
+        if chosen:
+            topic["primary_figure"] = {"ref": chosen[0]}
+        topics[slug] = topic
+    return topics
+
+
+def write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def write_synthetic_tree(root: Path, scale: int, seed: int = 0) -> Dict[str, int]:
+    """
+    Write a synthetic tree at `scale` x today's size under root.
+
+    Returns:
+        Entry counts per generated dataset.
+    """
+    rng = random.Random(seed * 1_000_003 + scale)
+    sizes = current_sizes()
+    variants = author_variants()
+    data_dir = root / "public" / "data"
+    (root / "public" / "plots").mkdir(parents=True, exist_ok=True)
+
+    ads_pubs = make_publications(rng, load_real("ads_publications.json", []),
+                                 sizes["ads_publications"] * scale, "ads", variants)
+    non_ads = make_publications(rng, load_real("non_ads_publications.json", []),
+                                sizes["non_ads_publications"] * scale, "non_ads", variants)
+    invited_pres = make_publications(rng, load_real("invited_presentations.json", []),
+                                     sizes["invited_presentations"] * scale, "invited", variants)
+    invited_conf = make_invited_conferences(rng, load_real("invited_conferences.json", []),
+                                            sizes["invited_conferences"] * scale, ads_pubs)
+
+    write_json(data_dir / "ads_publications.json", ads_pubs)
+    write_json(data_dir / "non_ads_publications.json", non_ads)
+    write_json(data_dir / "invited_presentations.json", invited_pres)
+    write_json(data_dir / "invited_conferences.json", invited_conf)
+    write_json(data_dir / "ads_metrics.json", scale_counts(load_real("ads_metrics.json", {}), scale))
+    write_json(data_dir / "citations_by_year.json", load_real("citations_by_year.json", {}))
+
+    papers = make_corpus(rng, sizes["papers"] * scale)
+    for paper_id, metadata in papers.items():
+        write_json(root / "research-corpus" / "papers" / paper_id / "paper_metadata.json", metadata)
+
+    topics = make_topics(rng, sizes["topics"] * scale, papers)
+    for slug, topic in topics.items():
+        write_json(data_dir / "research-topics" / f"{slug}.json", topic)
+
+    return {
+        "ads_publications": len(ads_pubs),
+        "non_ads_publications": len(non_ads),
+        "invited_presentations": len(invited_pres),
+        "invited_conferences": len(invited_conf),
+        "papers": len(papers),
+        "figures": sum(len(p["figures"]) for p in papers.values()),
+        "topics": len(topics),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic data tree for benchmarking.")
+    parser.add_argument("--scale", type=int, default=10, help="Multiple of today's corpus size")
+    parser.add_argument("--out", type=Path, required=True, help="Root directory to write")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    counts = write_synthetic_tree(args.out, args.scale, args.seed)
+    print(f"✓ {args.scale}x synthetic tree written to {args.out}")
+    for name, count in counts.items():
+        print(f"  {name:<22} {count:>9,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
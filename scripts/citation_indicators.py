@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Citation indicators (h, g, i10, i100, m) computed locally from per-paper data.
+
+Works on the papers x years citation matrix of the citation store
+(citation_store.py, built from the citations_by_paper.json snapshot written
+by fetch_ads_citations_to_data_dir.py). The yearly time series comes from the
+cumulative sums along the year axis, with every year's column sorted at once:
+
+    sorted = counts sorted descending per year       (papers x years)
+    h[y]   = #{rank : sorted[rank, y] >= rank}
+    g[y]   = max{rank : cumsum(sorted)[rank, y] >= rank**2}
+    i10[y] = #{paper : cumulative[paper, y] >= 10}
+
+Definitions follow the ADS metrics service, so the output has the same shape
+as the "indicators" and "time series" blocks of ads_metrics.json. Reads,
+downloads and the read10/tori indicators need ADS usage data and are not
+computed here.
+
+Used by generate_h_index_timeline.py and generate_publication_statistics.py
+(--indicators local), which overlay the local values on ads_metrics.json:
+
+    metrics = with_local_indicators(ads_metrics, load_store(data_dir))
+
+citations_by_paper.json is not in a fresh checkout until the citations
+workflow (or fetch_ads_citations_to_data_dir.py) has run. Without it the
+comparison is skipped and --indicators local falls back to the ADS values,
+each with a message saying so (local_indicators_or_ads()).
+
+Usage:
+    python scripts/citation_indicators.py          # compare with ads_metrics.json
+    python scripts/citation_indicators.py --check  # exit 1 on any mismatch
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from citation_store import SNAPSHOT_FILENAME, CitationStore, load_store
+from instrumentation import instrument_run, phase
+from utils import get_public_data_dir, get_relative_path
+
+LOCAL_INDICATORS = ("h", "g", "i10", "i100", "m")
+LOCAL_SERIES = ("h", "g", "i10", "i100")
+
+
+def _rank_indicators(cumulative: np.ndarray) -> Dict[str, np.ndarray]:
+    """h, g, i10 and i100 for every column of a papers x columns matrix."""
+    ranked = -np.sort(-cumulative, axis=0)
+    ranks = np.arange(1, ranked.shape[0] + 1)[:, None]
+    h = (ranked >= ranks).sum(axis=0)
+    g = np.where(np.cumsum(ranked, axis=0) >= ranks ** 2, ranks, 0).max(axis=0, initial=0)
+    return {
+        "h": h,
+        "g": g,
+        "i10": (cumulative >= 10).sum(axis=0),
+        "i100": (cumulative >= 100).sum(axis=0),
+    }
+
+
+def compute_indicators(store: CitationStore, refereed_only: bool = False,
+                       rows: Optional[np.ndarray] = None) -> Dict[str, dict]:
+    """
+    Indicators and yearly time series in the ads_metrics.json shape.
+
+    rows optionally restricts the computation to a subset of papers (a boolean
+    mask over store.bibcodes), e.g. one member of a group.
+
+    Returns:
+        {"indicators": {h, g, i10, i100, m}, "time series": {h, g, i10, i100: {year: value}}}
+    """
+    if rows is None:
+        rows = np.ones(len(store), dtype=bool)
+    counts = store.citations()[rows & store.refereed if refereed_only else rows]
+    cumulative = np.cumsum(counts, axis=1)
+    series = _rank_indicators(cumulative)
+
+    if counts.shape[1]:
+        current = {name: int(values[-1]) for name, values in series.items()}
+    else:
+        current = {name: 0 for name in series}
+    # ADS: m = h / years since the first publication (inclusive), refereed or not
+    career_years = int(store.years[-1] - store.pub_years[rows].min() + 1) if rows.any() else 0
+    current["m"] = current["h"] / career_years if career_years else 0.0
+
+    return {
+        "indicators": current,
+        "time series": {
+            name: {str(year): int(value) for year, value in zip(store.years, values)}
+            for name, values in series.items()
+        },
+    }
+
+
+def with_local_indicators(ads_metrics: dict, store: CitationStore) -> dict:
+    """
+    Copy of ads_metrics with the locally computable indicators and time series replaced.
+
+    Values ADS alone can provide (read10, tori, riq, ...) are kept.
+    """
+    local = compute_indicators(store)
+    local_refereed = compute_indicators(store, refereed_only=True)
+
+    metrics = dict(ads_metrics)
+    metrics["indicators"] = {**ads_metrics.get("indicators", {}), **local["indicators"]}
+    metrics["indicators refereed"] = {
+        **ads_metrics.get("indicators refereed", {}), **local_refereed["indicators"]
+    }
+    metrics["time series"] = {**ads_metrics.get("time series", {}), **local["time series"]}
+    return metrics
+
+
+def local_indicators_or_ads(ads_metrics: dict, data_dir: Optional[Path] = None) -> dict:
+    """
+    with_local_indicators() on the stored snapshot, or ads_metrics unchanged if none was fetched.
+
+    The fallback prints a warning, so a run without the snapshot says
+    which values it used.
+    """
+    data_dir = data_dir or get_public_data_dir()
+    if not (data_dir / SNAPSHOT_FILENAME).exists():
+        print(f"⚠️  No per-paper citation snapshot at {get_relative_path(data_dir / SNAPSHOT_FILENAME)}; "
+              "using the ADS indicators. Run fetch_ads_citations_to_data_dir.py to compute them locally.")
+        return ads_metrics
+    return with_local_indicators(ads_metrics, load_store(data_dir))
+
+
+def compare_with_ads(ads_metrics: dict, store: CitationStore) -> List[str]:
+    """Print local vs ADS values; returns a description of every mismatch."""
+    mismatches = []
+    print(f"\n{'indicator':<24} {'local':>10} {'ADS':>10}")
+    for block, refereed_only in (("indicators", False), ("indicators refereed", True)):
+        local = compute_indicators(store, refereed_only)["indicators"]
+        for name in LOCAL_INDICATORS:
+            ads_value = ads_metrics.get(block, {}).get(name)
+            matches = ads_value is not None and np.isclose(local[name], ads_value)
+            flag = "" if matches else "  ⚠️"
+            label = f"{name}{' (refereed)' if refereed_only else ''}"
+            print(f"{label:<24} {local[name]:>10.4g} {ads_value if ads_value is not None else '-':>10}{flag}")
+            if not matches:
+                mismatches.append(f"{block}.{name}: local {local[name]:.4g}, ADS {ads_value}")
+
+    local_series = compute_indicators(store)["time series"]
+    for name in LOCAL_SERIES:
+        ads_series = ads_metrics.get("time series", {}).get(name, {})
+        differing = [year for year, value in ads_series.items() if local_series[name].get(year) != value]
+        status = f"{len(differing)} of {len(ads_series)} years differ" if differing else "matches"
+        print(f"time series {name:<12} {status}")
+        if differing:
+            mismatches.append(f"time series.{name}: {', '.join(differing)}")
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compute citation indicators from per-paper citation data.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any value differs from ads_metrics.json")
+    args = parser.parse_args()
+
+    data_dir = get_public_data_dir()
+    if not (data_dir / SNAPSHOT_FILENAME).exists():
+        print(f"⏭️  No per-paper citation snapshot at {get_relative_path(data_dir / SNAPSHOT_FILENAME)}; "
+              "nothing to compare. Run fetch_ads_citations_to_data_dir.py first.")
+        return 0
+    phase("load")
+    store = load_store(data_dir)
+    with open(data_dir / "ads_metrics.json", "r", encoding="utf-8") as f:
+        ads_metrics = json.load(f)
+    print(f"📖 {len(store)} papers from {get_relative_path(data_dir / SNAPSHOT_FILENAME)}")
+
+    phase("compare")
+    mismatches = compare_with_ads(ads_metrics, store)
+    if mismatches:
+        print(f"\n⚠️  {len(mismatches)} value(s) differ from ADS:")
+        for line in mismatches:
+            print(f"  - {line}")
+        return 1 if args.check else 0
+    print("\n✓ Local indicators match ADS")
+    return 0
+
+
+if __name__ == "__main__":
+    instrument_run()
+    sys.exit(main())
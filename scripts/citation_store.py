@@ -0,0 +1,213 @@
+"""
+Array-backed store of per-paper, per-year citations, reads and downloads.
+
+One int32 array holds every count, indexed (channel, paper, year), with the
+bibcodes and years kept alongside so a paper or year maps to a row or column:
+
+    store = load_store()
+    store.citations()                       # papers x years, all citations
+    store.by_year("reads")                  # reads summed over papers
+    store.channel(*CITED_REFEREED)[store.refereed]
+    store.paper("2025ApJ...980...70R", "downloads")
+
+Channels are the four ADS citation histograms ("<citing> to <cited>"
+refereed status) plus all reads and all downloads. The store is built from
+the per-paper snapshot (citations_by_paper.json) and cached next to it as
+citation_store.npz. load_store() rebuilds the cache whenever the snapshot's
+digest changes. Reads and downloads are as of each paper's last metrics
+fetch; uncited papers are never fetched, so they have none.
+
+Years run from the earliest publication or citation to the current year (or
+the last year with data, if later).
+
+needs_refresh() and snapshot_entry() are the snapshot's refresh rules, shared
+by fetch_ads_citations_to_data_dir.py and fetch_ads_group.py.
+"""
+
+import hashlib
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils import get_public_data_dir, get_relative_path, write_bytes_atomic
+
+SNAPSHOT_FILENAME = "citations_by_paper.json"
+STORE_FILENAME = "citation_store.npz"
+STORE_VERSION = 1
+
+CITED_REFEREED = ("refereed to refereed", "nonrefereed to refereed")
+CITED_NONREFEREED = ("refereed to nonrefereed", "nonrefereed to nonrefereed")
+CITATION_CHANNELS = CITED_REFEREED + CITED_NONREFEREED
+CHANNELS = CITATION_CHANNELS + ("reads", "downloads")
+
+# Snapshot entries older than this are re-fetched even if citation_count is unchanged,
+# so citing papers that move from non-refereed to refereed are picked up eventually.
+SNAPSHOT_MAX_AGE = timedelta(days=90)
+
+
+class CitationStore:
+    """Counts indexed (channel, paper, year) with bibcode and year lookups."""
+
+    def __init__(self, bibcodes: List[str], years: np.ndarray, counts: np.ndarray,
+                 refereed: np.ndarray, citation_count: np.ndarray, source_digest: str = ""):
+        self.bibcodes = list(bibcodes)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.int32)
+        self.refereed = np.asarray(refereed, dtype=bool)
+        self.citation_count = np.asarray(citation_count, dtype=np.int64)
+        self.source_digest = source_digest
+        self.pub_years = np.array([int(b[:4]) for b in self.bibcodes], dtype=np.int64)
+        self.paper_index: Dict[str, int] = {b: i for i, b in enumerate(self.bibcodes)}
+        self.year_index: Dict[int, int] = {int(y): i for i, y in enumerate(self.years)}
+        self.channel_index: Dict[str, int] = {c: i for i, c in enumerate(CHANNELS)}
+
+    def __len__(self) -> int:
+        return len(self.bibcodes)
+
+    def channel(self, *names: str) -> np.ndarray:
+        """Papers x years counts, summed over the named channels."""
+        return self.counts[[self.channel_index[name] for name in names]].sum(axis=0)
+
+    def citations(self) -> np.ndarray:
+        """Papers x years citations from every citing source."""
+        return self.channel(*CITATION_CHANNELS)
+
+    def by_year(self, *names: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Per-year totals of the named channels over all papers (or a row mask)."""
+        matrix = self.channel(*names)
+        return (matrix if rows is None else matrix[rows]).sum(axis=0)
+
+    def paper(self, bibcode: str, *names: str) -> np.ndarray:
+        """Per-year counts of one paper (all citations if no channel is named)."""
+        return self.channel(*(names or CITATION_CHANNELS))[self.paper_index[bibcode]]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, dict], current_year: Optional[int] = None,
+                      source_digest: str = "") -> "CitationStore":
+        """Build the arrays from citations_by_paper.json entries."""
+        bibcodes = sorted(snapshot)
+        per_paper = [_paper_channels(snapshot[b]) for b in bibcodes]
+        data_years = {int(year) for channels in per_paper for hist in channels.values() for year in hist}
+        pub_years = {int(b[:4]) for b in bibcodes}
+
+        current_year = current_year or datetime.now(timezone.utc).year
+        first = min(pub_years | data_years | {current_year})
+        last = max(data_years | {current_year})
+        years = np.arange(first, last + 1)
+
+        counts = np.zeros((len(CHANNELS), len(bibcodes), len(years)), dtype=np.int32)
+        for i, channels in enumerate(per_paper):
+            for c, name in enumerate(CHANNELS):
+                for year, count in channels.get(name, {}).items():
+                    counts[c, i, int(year) - first] += int(count)
+
+        refereed = [
+            # Entries written before the flag existed: infer it from who the citations went to
+            snapshot[b].get("refereed", any(any(snapshot[b]["histograms"].get(k, {}).values())
+                                             for k in CITED_REFEREED))
+            for b in bibcodes
+        ]
+        citation_count = [snapshot[b].get("citation_count", 0) for b in bibcodes]
+        return cls(bibcodes, years, counts, np.array(refereed, dtype=bool), np.array(citation_count),
+                   source_digest)
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            version=np.array(STORE_VERSION),
+            bibcodes=np.array(self.bibcodes, dtype=str),
+            years=self.years,
+            channels=np.array(CHANNELS, dtype=str),
+            counts=self.counts,
+            refereed=self.refereed,
+            citation_count=self.citation_count,
+            source_digest=np.array(self.source_digest),
+        )
+        return buffer.getvalue()
+
+    def save(self, path: Path) -> bool:
+        """Write the store as .npz; returns False if the file already had these bytes."""
+        return write_bytes_atomic(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["CitationStore"]:
+        """Read a saved store (None if it is from another store version or channel layout)."""
+        with np.load(path) as data:
+            if int(data["version"]) != STORE_VERSION or tuple(data["channels"]) != CHANNELS:
+                return None
+            return cls(data["bibcodes"].tolist(), data["years"], data["counts"], data["refereed"],
+                       data["citation_count"], str(data["source_digest"]))
+
+
+def needs_refresh(entry: Optional[dict], citation_count: int, today: date) -> bool:
+    """Whether a paper's snapshot entry must be re-fetched from the metrics API."""
+    if entry is None or entry["citation_count"] != citation_count:
+        return True
+    return entry["fetched"] < (today - SNAPSHOT_MAX_AGE).isoformat()
+
+
+def snapshot_entry(metrics: Optional[dict], citation_count: int, today: date) -> dict:
+    """
+    Snapshot entry from a single-bibcode metrics response.
+
+    Uncited papers need no request: pass metrics=None for an empty entry.
+    """
+    histograms = (metrics or {}).get("histograms", {})
+    hist = histograms.get("citations", {})
+    entry = {
+        "citation_count": citation_count,
+        "fetched": today.isoformat(),
+        "histograms": {k: hist[k] for k in CITATION_CHANNELS if hist.get(k)},
+    }
+    if metrics is not None:
+        entry["reads"] = histograms.get("reads", {}).get("all reads", {})
+        entry["downloads"] = histograms.get("downloads", {}).get("all downloads", {})
+    return entry
+
+
+def _paper_channels(entry: dict) -> Dict[str, dict]:
+    """{channel: {year: count}} for one snapshot entry."""
+    channels = dict(entry.get("histograms", {}))
+    for name in ("reads", "downloads"):
+        if entry.get(name):
+            channels[name] = entry[name]
+    return channels
+
+
+def snapshot_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_store(data_dir: Optional[Path] = None) -> CitationStore:
+    """
+    Load the citation store, rebuilding it if the snapshot changed since it was written.
+
+    Raises:
+        FileNotFoundError: If citations_by_paper.json has not been fetched yet.
+    """
+    data_dir = data_dir or get_public_data_dir()
+    snapshot_path = data_dir / SNAPSHOT_FILENAME
+    store_path = data_dir / STORE_FILENAME
+    if not snapshot_path.exists():
+        raise FileNotFoundError(
+            f"Per-paper citation snapshot not found at {get_relative_path(snapshot_path)}. "
+            "Run fetch_ads_citations_to_data_dir.py first."
+        )
+
+    raw = snapshot_path.read_bytes()
+    digest = snapshot_digest(raw)
+    if store_path.exists():
+        store = CitationStore.load(store_path)
+        this_year = datetime.now(timezone.utc).year
+        if store is not None and store.source_digest == digest and store.years[-1] >= this_year:
+            return store
+
+    store = CitationStore.from_snapshot(json.loads(raw), source_digest=digest)
+    store.save(store_path)
+    print(f"💾 Citation store rebuilt at {get_relative_path(store_path)}")
+    return store
@@ -0,0 +1,130 @@
+"""
+Reader for the research-corpus submodule.
+
+Every paper directory under research-corpus/papers/ holds a
+paper_metadata.json and, for most papers, the figure PDFs in figures/.
+load_corpus() reads all of them concurrently (the work is file I/O and JSON
+decoding) into CorpusPaper records, keyed and ordered by directory name:
+
+    papers = load_corpus()
+    for paper in papers.values():
+        paper.paper_id, paper.figures, paper.pdf_files, paper.figures_dir
+
+JSON is decoded with orjson or msgspec when one is installed and with the
+standard library otherwise; load_json() exposes the same decoder for the
+other corpus-derived files (figure-registry.json).
+
+Used by generate_figure_registry_from_corpus.py,
+generate_figure_audit_workbook.py and export_topics_to_markdown.py.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from utils import get_repo_root
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+    decode_json: Callable[[bytes], Any] = orjson.loads
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+    decode_json = msgspec.json.decode
+else:
+    JSON_BACKEND = "json"
+    decode_json = json.loads
+
+METADATA_FILENAME = "paper_metadata.json"
+
+# Directories per thread-pool task: one future per paper costs more than reading a small paper
+BATCH_SIZE = 64
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusPaper:
+    """One paper of the corpus: its metadata and the figure PDFs on disk."""
+    paper_id: str               # metadata "paper.id" (the directory name if absent)
+    path: Path                  # research-corpus/papers/<dir>
+    metadata: dict              # paper_metadata.json as decoded
+    pdf_files: tuple[str, ...]  # sorted fig_*.pdf names in figures/
+
+    @property
+    def figures_dir(self) -> Path:
+        return self.path / "figures"
+
+    @property
+    def figures(self) -> list[dict]:
+        return self.metadata.get("figures", [])
+
+
+def get_corpus_dir() -> Path:
+    """research-corpus/ at the repository root (a git submodule; may be empty)."""
+    return get_repo_root() / "research-corpus"
+
+
+def load_json(path: Path) -> Any:
+    """Decode a JSON file with the fastest available backend."""
+    return decode_json(path.read_bytes())
+
+
+def figure_pdf(corpus_dir: Path, paper_id: str, figure_id: str) -> Path:
+    """Path of a figure's source PDF in the corpus (which may not exist)."""
+    return corpus_dir / "papers" / paper_id / "figures" / f"{figure_id}.pdf"
+
+
+def read_paper(paper_dir: Path) -> Optional[CorpusPaper]:
+    """Load one paper directory; None if it has no paper_metadata.json."""
+    try:
+        metadata = load_json(paper_dir / METADATA_FILENAME)
+    except FileNotFoundError:
+        return None
+    figures_dir = paper_dir / "figures"
+    pdf_files = tuple(sorted(p.name for p in figures_dir.glob("fig_*.pdf"))) if figures_dir.is_dir() else ()
+    paper_id = metadata.get("paper", {}).get("id") or paper_dir.name
+    return CorpusPaper(paper_id, paper_dir, metadata, pdf_files)
+
+
+def read_papers(paper_dirs: list[Path]) -> list[Optional[CorpusPaper]]:
+    return [read_paper(paper_dir) for paper_dir in paper_dirs]
+
+
+def load_corpus(corpus_dir: Optional[Path] = None, jobs: Optional[int] = None) -> dict[str, CorpusPaper]:
+    """
+    Load every paper of the corpus, reading batches of directories on a thread pool.
+
+    Args:
+        corpus_dir: Corpus root (default: research-corpus/ in the repository).
+        jobs: Reader threads (default: one per CPU, at most 8; 1 reads serially).
+
+    Returns:
+        {directory name: CorpusPaper}, sorted by directory name. Hidden
+        directories and directories without metadata are skipped.
+    """
+    papers_dir = (corpus_dir or get_corpus_dir()) / "papers"
+    if not papers_dir.is_dir():
+        return {}
+    paper_dirs = [Path(path) for path in sorted(
+        entry.path for entry in os.scandir(papers_dir)
+        if entry.is_dir() and not entry.name.startswith(".")
+    )]
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    batches = [paper_dirs[i:i + BATCH_SIZE] for i in range(0, len(paper_dirs), BATCH_SIZE)]
+    if jobs == 1 or len(batches) == 1:
+        papers = read_papers(paper_dirs)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            papers = [paper for batch in pool.map(read_papers, batches) for paper in batch]
+    return {paper.path.name: paper for paper in papers if paper is not None}
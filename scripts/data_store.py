@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+SQLite store of fetched publications, metrics and their history.
+
+The fetch scripts still write the JSON files under public/data that the
+site and the generators read, but they write them through the store, which
+keeps a dated snapshot of every version it sees:
+
+    with DataStore(source="ads-metrics") as store:
+        store.write_document(output_file, metrics)
+
+A snapshot is the exact bytes of the file (content-addressed and compressed,
+so unchanged files cost nothing) plus indexed tables for querying:
+
+    fetches                 id, source, fetched_at, commit_sha, note
+    documents               fetch_id, name, sha           (one file version)
+    blobs                   sha, body                     (zlib-compressed bytes)
+    publications            bibcode, title, year, month, venue, type, refereed, ...
+    authors / venues        normalized names
+    publication_authors     bibcode, position, author_id
+    publication_snapshots   fetch_id, bibcode, citations  (per-paper trajectory)
+    yearly_metrics          fetch_id, series, year, value (citations_by_year.json
+                                                           and ads_metrics.json series)
+    indicators              fetch_id, name, value         (h, g, i10, ... per fetch)
+
+The JSON files are exports of the latest snapshot of each document, so
+`export` rebuilds public/data byte for byte and `verify` checks that the
+files on disk are the versions the store last saw.
+
+A fetch is recorded only when a document changes: re-running a script on
+unchanged data leaves the database file untouched.
+
+The database lives at data/publications.sqlite (gitignored and outside public/,
+so it is neither committed nor deployed; the fetch workflows keep it in the
+Actions cache and `backfill` rebuilds it from git history); see
+utils.get_data_store_path() for overrides.
+
+Usage:
+    python scripts/data_store.py stats
+    python scripts/data_store.py history 2025ApJ...980...70R
+    python scripts/data_store.py backfill                # import every git revision
+    python scripts/data_store.py import --as-of 2025-07-20 public/data/citations_by_year.json.back
+    python scripts/data_store.py export --out /tmp/data
+    python scripts/data_store.py verify
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import subprocess
+import sys
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from instrumentation import instrument_run, span
+from utils import (
+    get_data_store_path,
+    get_public_data_dir,
+    get_relative_path,
+    get_repo_root,
+    json_bytes,
+    write_bytes_atomic,
+)
+
+# Documents the store tracks, by file name under public/data
+DOCUMENTS = (
+    "ads_publications.json",
+    "ads_metrics.json",
+    "citations_by_year.json",
+    "citations_by_paper.json",
+)
+
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_SECONDS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    id          INTEGER PRIMARY KEY,
+    source      TEXT NOT NULL,
+    fetched_at  TEXT NOT NULL,
+    commit_sha  TEXT,
+    note        TEXT
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha   TEXT PRIMARY KEY,
+    size  INTEGER NOT NULL,
+    body  BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    fetch_id  INTEGER NOT NULL REFERENCES fetches(id),
+    name      TEXT NOT NULL,
+    sha       TEXT NOT NULL REFERENCES blobs(sha),
+    PRIMARY KEY (fetch_id, name)
+);
+CREATE INDEX IF NOT EXISTS documents_by_name ON documents(name, fetch_id);
+
+CREATE TABLE IF NOT EXISTS venues (
+    id    INTEGER PRIMARY KEY,
+    name  TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS authors (
+    id    INTEGER PRIMARY KEY,
+    name  TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS publications (
+    bibcode           TEXT PRIMARY KEY,
+    title             TEXT,
+    year              INTEGER,
+    pubdate           TEXT,
+    month             TEXT,
+    venue_id          INTEGER REFERENCES venues(id),
+    publication_type  TEXT,
+    refereed          INTEGER NOT NULL DEFAULT 0,
+    invited           INTEGER NOT NULL DEFAULT 0,
+    url               TEXT,
+    citations         INTEGER,
+    first_seen        TEXT NOT NULL,
+    last_seen         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS publications_by_year ON publications(year);
+CREATE INDEX IF NOT EXISTS publications_by_venue ON publications(venue_id);
+CREATE TABLE IF NOT EXISTS publication_authors (
+    bibcode    TEXT NOT NULL REFERENCES publications(bibcode),
+    position   INTEGER NOT NULL,
+    author_id  INTEGER NOT NULL REFERENCES authors(id),
+    PRIMARY KEY (bibcode, position)
+);
+CREATE INDEX IF NOT EXISTS publication_authors_by_author ON publication_authors(author_id);
+CREATE TABLE IF NOT EXISTS publication_snapshots (
+    fetch_id   INTEGER NOT NULL REFERENCES fetches(id),
+    bibcode    TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    citations  INTEGER,
+    PRIMARY KEY (fetch_id, bibcode)
+);
+CREATE INDEX IF NOT EXISTS publication_snapshots_by_bibcode ON publication_snapshots(bibcode, fetch_id);
+
+CREATE TABLE IF NOT EXISTS yearly_metrics (
+    fetch_id  INTEGER NOT NULL REFERENCES fetches(id),
+    series    TEXT NOT NULL,
+    year      INTEGER NOT NULL,
+    value     REAL NOT NULL,
+    PRIMARY KEY (fetch_id, series, year)
+);
+CREATE INDEX IF NOT EXISTS yearly_metrics_by_series ON yearly_metrics(series, year);
+CREATE TABLE IF NOT EXISTS indicators (
+    fetch_id  INTEGER NOT NULL REFERENCES fetches(id),
+    name      TEXT NOT NULL,
+    value     REAL NOT NULL,
+    PRIMARY KEY (fetch_id, name)
+);
+"""
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def document_name(path: Path) -> Optional[str]:
+    """Tracked document a file is a version of (backups like *.json.back count), or None."""
+    for name in DOCUMENTS:
+        stem = name[:-len(".json")]
+        if path.name == name or path.name.startswith(stem + "."):
+            return name
+    return None
+
+
+class DataStore:
+    """Connection to the store; use as a context manager so changes are committed."""
+
+    def __init__(self, path: Optional[Path] = None, source: str = "manual",
+                 fetched_at: Optional[str] = None, commit_sha: Optional[str] = None,
+                 note: Optional[str] = None):
+        self.path = Path(path) if path else get_data_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Wait for another writer's transaction instead of failing with "database is locked"
+        self.db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA foreign_keys = ON")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.db.executescript(SCHEMA)
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.db.commit()
+        self.source = source
+        self.fetched_at = fetched_at
+        self.commit_sha = commit_sha
+        self.note = note
+        self._fetch_id: Optional[int] = None
+
+    def __enter__(self) -> "DataStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.db.commit()
+        else:
+            self.db.rollback()
+        self.db.close()
+
+    # -- writing ---------------------------------------------------------
+
+    def fetch_id(self) -> int:
+        """This session's fetch, created the first time a document changes."""
+        if self._fetch_id is None:
+            cursor = self.db.execute(
+                "INSERT INTO fetches (source, fetched_at, commit_sha, note) VALUES (?, ?, ?, ?)",
+                (self.source, self.fetched_at or utc_now(), self.commit_sha, self.note),
+            )
+            self._fetch_id = cursor.lastrowid
+        return self._fetch_id
+
+    def write_document(self, path: Path, data: Any, **json_options) -> bool:
+        """
+        Record data as a new version of a tracked document and write it to path.
+
+        json_options are those of utils.write_json_atomic(), so the file keeps
+        the exact formatting its script always used.
+
+        Returns:
+            bool: True if the file on disk changed.
+        """
+        return self.write_body(path, json_bytes(data, **json_options))
+
+    def write_body(self, path: Path, body: bytes) -> bool:
+        """write_document() for an already encoded document (e.g. records.encode_records())."""
+        self.record(document_name(path) or path.name, body)
+        return write_bytes_atomic(path, body)
+
+    def record(self, name: str, body: bytes) -> bool:
+        """
+        Add body as the latest version of a document; False if it already is.
+
+        Each version is committed on its own, so a script holds the write
+        lock only while recording, not while it fetches.
+        """
+        latest = self.latest(name)
+        if latest is not None and latest[1] == body:
+            return False
+        sha = hashlib.sha256(body).hexdigest()
+        compressed = zlib.compress(body, 9)
+        index = {
+            "ads_publications.json": self._index_publications,
+            "ads_metrics.json": self._index_metrics,
+            "citations_by_year.json": self._index_citations_by_year,
+        }.get(name)
+        data = json.loads(body) if index is not None else None
+        new_fetch = self._fetch_id is None
+        try:
+            with self.db:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO blobs (sha, size, body) VALUES (?, ?, ?)",
+                    (sha, len(body), compressed),
+                )
+                fetch_id = self.fetch_id()
+                self.db.execute("INSERT OR REPLACE INTO documents (fetch_id, name, sha) VALUES (?, ?, ?)",
+                                (fetch_id, name, sha))
+                if index is not None:
+                    index(fetch_id, data)
+        except Exception:
+            if new_fetch:  # the fetch row was rolled back with the version
+                self._fetch_id = None
+            raise
+        return True
+
+    def _named_id(self, table: str, name: str) -> int:
+        self.db.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        return self.db.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+
+    def _fetched_at(self, fetch_id: int) -> str:
+        return self.db.execute("SELECT fetched_at FROM fetches WHERE id = ?", (fetch_id,)).fetchone()[0]
+
+    def _index_publications(self, fetch_id: int, publications: List[dict]) -> None:
+        seen = self._fetched_at(fetch_id)
+        self.db.executemany(
+            "INSERT OR REPLACE INTO publication_snapshots (fetch_id, bibcode, position, citations) "
+            "VALUES (?, ?, ?, ?)",
+            [(fetch_id, pub["bibcode"], i, pub.get("citations"))
+             for i, pub in enumerate(publications) if pub.get("bibcode")],
+        )
+        for pub in publications:
+            bibcode = pub.get("bibcode")
+            if not bibcode:
+                continue
+            newest = self.db.execute("SELECT last_seen FROM publications WHERE bibcode = ?", (bibcode,)).fetchone()
+            if newest is not None and newest[0] > seen:
+                # An older version (backfill): only widen the first_seen date
+                self.db.execute("UPDATE publications SET first_seen = min(first_seen, ?) WHERE bibcode = ?",
+                                (seen, bibcode))
+                continue
+
+            pubdate = pub.get("year") or ""
+            venue = pub.get("journal")
+            self.db.execute(
+                """INSERT INTO publications (bibcode, title, year, pubdate, month, venue_id, publication_type,
+                                             refereed, invited, url, citations, first_seen, last_seen)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(bibcode) DO UPDATE SET
+                       title = excluded.title, year = excluded.year, pubdate = excluded.pubdate,
+                       month = excluded.month, venue_id = excluded.venue_id,
+                       publication_type = excluded.publication_type, refereed = excluded.refereed,
+                       invited = excluded.invited, url = excluded.url, citations = excluded.citations,
+                       first_seen = min(first_seen, excluded.first_seen), last_seen = excluded.last_seen""",
+                (
+                    bibcode, pub.get("title"), int(pubdate[:4]) if pubdate[:4].isdigit() else None, pubdate,
+                    pub.get("month"), self._named_id("venues", venue) if venue else None,
+                    pub.get("publication_type"), "REFEREED" in pub.get("properties", []),
+                    bool(pub.get("invited")), pub.get("url"), pub.get("citations"), seen, seen,
+                ),
+            )
+            self.db.execute("DELETE FROM publication_authors WHERE bibcode = ?", (bibcode,))
+            self.db.executemany(
+                "INSERT INTO publication_authors (bibcode, position, author_id) VALUES (?, ?, ?)",
+                [(bibcode, i, self._named_id("authors", name)) for i, name in enumerate(pub.get("authors", []))],
+            )
+
+    def _index_metrics(self, fetch_id: int, metrics: dict) -> None:
+        rows = []
+        for group, histograms in metrics.get("histograms", {}).items():
+            for name, values in histograms.items():
+                rows += [(f"histograms/{group}/{name}", year, value) for year, value in values.items()]
+        for name, values in metrics.get("time series", {}).items():
+            rows += [(f"time series/{name}", year, value) for year, value in values.items()]
+        self._insert_yearly(fetch_id, rows)
+        self.db.executemany(
+            "INSERT OR REPLACE INTO indicators (fetch_id, name, value) VALUES (?, ?, ?)",
+            [(fetch_id, f"{block}/{name}", value)
+             for block in ("indicators", "indicators refereed")
+             for name, value in metrics.get(block, {}).items() if value is not None],
+        )
+
+    def _index_citations_by_year(self, fetch_id: int, data: dict) -> None:
+        self._insert_yearly(fetch_id, [
+            (f"citations/{kind}", year, value)
+            for kind in ("refereed", "nonrefereed")
+            for year, value in zip(data.get("years", []), data.get(kind, []))
+        ])
+
+    def _insert_yearly(self, fetch_id: int, rows: List[Tuple[str, Any, Any]]) -> None:
+        self.db.executemany(
+            "INSERT OR REPLACE INTO yearly_metrics (fetch_id, series, year, value) VALUES (?, ?, ?, ?)",
+            [(fetch_id, series, int(year), value) for series, year, value in rows if value is not None],
+        )
+
+    # -- reading ---------------------------------------------------------
+
+    def latest(self, name: str, sources: Optional[Tuple[str, ...]] = None,
+               exclude: Tuple[str, ...] = ()) -> Optional[Tuple[str, bytes]]:
+        """
+        (fetched_at, bytes) of the newest version of a document, or None.
+
+        sources/exclude restrict the versions considered to those written by
+        (or not by) the given fetch sources, e.g. the previous raw ADS fetch
+        of ads_publications.json rather than the merged file.
+        """
+        where, params = "d.name = ?", [name]
+        if sources is not None:
+            where += f" AND f.source IN ({', '.join('?' * len(sources))})"
+            params += sources
+        if exclude:
+            where += f" AND f.source NOT IN ({', '.join('?' * len(exclude))})"
+            params += exclude
+        row = self.db.execute(
+            f"""SELECT f.fetched_at, b.body FROM documents d
+                JOIN fetches f ON f.id = d.fetch_id JOIN blobs b ON b.sha = d.sha
+                WHERE {where} ORDER BY f.fetched_at DESC, f.id DESC LIMIT 1""",
+            params,
+        ).fetchone()
+        return None if row is None else (row[0], zlib.decompress(row[1]))
+
+    def export(self, out_dir: Path) -> Dict[str, bool]:
+        """Write the newest version of every document to out_dir; {name: file changed}."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = {}
+        for name in DOCUMENTS:
+            latest = self.latest(name)
+            if latest is not None:
+                written[name] = write_bytes_atomic(out_dir / name, latest[1])
+        return written
+
+    def citation_history(self, bibcode: str) -> List[Tuple[str, str, Optional[int]]]:
+        """[(fetched_at, source, citations)] for one paper, oldest first."""
+        return self.db.execute(
+            """SELECT f.fetched_at, f.source, s.citations FROM publication_snapshots s
+               JOIN fetches f ON f.id = s.fetch_id
+               WHERE s.bibcode = ? ORDER BY f.fetched_at, f.id""",
+            (bibcode,),
+        ).fetchall()
+
+    def imported_commits(self) -> set:
+        return {row[0] for row in self.db.execute("SELECT commit_sha FROM fetches WHERE commit_sha IS NOT NULL")}
+
+
+def git_revisions(relative_path: str) -> Iterator[Tuple[str, str]]:
+    """(commit sha, ISO commit date) of every commit touching a file, oldest first."""
+    log = subprocess.run(
+        ["git", "log", "--reverse", "--format=%H %cI", "--", relative_path],
+        cwd=get_repo_root(), capture_output=True, text=True, check=True,
+    )
+    for line in log.stdout.splitlines():
+        sha, committed = line.split()
+        yield sha, datetime.fromisoformat(committed).astimezone(timezone.utc).isoformat()
+
+
+def backfill(path: Path) -> int:
+    """Import every committed revision of the tracked documents; returns the number of new fetches."""
+    data_dir = get_relative_path(get_public_data_dir())
+    with DataStore(path) as store:
+        done = store.imported_commits()
+    revisions: Dict[Tuple[str, str], List[str]] = {}
+    for name in DOCUMENTS:
+        for sha, committed in git_revisions(f"{data_dir}/{name}"):
+            revisions.setdefault((committed, sha), []).append(name)
+
+    imported = 0
+    for (committed, sha), names in sorted(revisions.items()):
+        if sha in done:
+            continue
+        with DataStore(path, source="git", fetched_at=committed, commit_sha=sha) as store:
+            for name in names:
+                show = subprocess.run(["git", "show", f"{sha}:{data_dir}/{name}"],
+                                      cwd=get_repo_root(), capture_output=True, check=False)
+                if show.returncode == 0:  # deleted in this commit
+                    store.record(name, show.stdout)
+            imported += store._fetch_id is not None
+    return imported
+
+
+def print_stats(store: DataStore) -> None:
+    count = lambda table: store.db.execute(f"SELECT count(*) FROM {table}").fetchone()[0]  # noqa: E731
+    print(f"🗄️  {get_relative_path(store.path)} ({store.path.stat().st_size / 1024:.0f} KiB)")
+    for table in ("fetches", "documents", "blobs", "publications", "authors", "venues",
+                  "publication_snapshots", "yearly_metrics", "indicators"):
+        print(f"   {table:<22} {count(table):>8,}")
+    print("\n   Latest documents:")
+    for name in DOCUMENTS:
+        latest = store.latest(name)
+        print(f"   {name:<26} {latest[0] if latest else '-'}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Publications, metrics and fetch history in SQLite.")
+    parser.add_argument("--db", type=Path, help="Database file (default: data/publications.sqlite)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="Row counts and latest document dates")
+    history = commands.add_parser("history", help="Citation trajectory of one paper")
+    history.add_argument("bibcode")
+    commands.add_parser("backfill", help="Import every git revision of the tracked files")
+    imports = commands.add_parser("import", help="Import files as versions of their documents")
+    imports.add_argument("files", nargs="+", type=Path)
+    imports.add_argument("--as-of", help="Date of the data (default: the file's modification time)")
+    imports.add_argument("--source", default="import")
+    export = commands.add_parser("export", help="Write the latest documents as JSON files")
+    export.add_argument("--out", type=Path, help="Output directory (default: public/data)")
+    commands.add_parser("verify", help="Check that public/data matches the latest documents")
+    args = parser.parse_args()
+
+    path = args.db or get_data_store_path()
+
+    if args.command == "backfill":
+        with span("backfill") as record:
+            record["imported"] = imported = backfill(path)
+        print(f"📥 Imported {imported} git revision(s) into {get_relative_path(path)}")
+        return 0
+
+    if args.command == "import":
+        for file in args.files:
+            name = document_name(file)
+            if name is None:
+                print(f"⚠️  {file} is not a version of {', '.join(DOCUMENTS)}")
+                return 1
+            as_of = args.as_of or datetime.fromtimestamp(file.stat().st_mtime, timezone.utc).isoformat()
+            with DataStore(path, source=args.source, fetched_at=as_of, note=file.name) as store:
+                added = store.record(name, file.read_bytes())
+            print(f"{'📥 Imported' if added else '✓ Already current:'} {file} as {name} ({as_of})")
+        return 0
+
+    with DataStore(path) as store:
+        if args.command == "stats":
+            print_stats(store)
+        elif args.command == "history":
+            rows = store.citation_history(args.bibcode)
+            if not rows:
+                print(f"⚠️  No snapshots of {args.bibcode}")
+                return 1
+            for fetched_at, source, citations in rows:
+                print(f"{fetched_at:<26} {source:<18} {citations if citations is not None else '-':>6}")
+        elif args.command == "export":
+            out_dir = args.out or get_public_data_dir()
+            for name, changed in store.export(out_dir).items():
+                print(f"{'💾' if changed else '✓'} {get_relative_path(out_dir / name)}")
+        elif args.command == "verify":
+            stale = []
+            for name in DOCUMENTS:
+                latest = store.latest(name)
+                file = get_public_data_dir() / name
+                if latest is not None and (not file.exists() or file.read_bytes() != latest[1]):
+                    stale.append(name)
+            if stale:
+                print(f"⚠️  Differs from the store: {', '.join(stale)} (run `import` or `export`)")
+                return 1
+            print("✓ public/data matches the latest stored documents")
+    return 0
+
+
+if __name__ == "__main__":
+    instrument_run()
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Fuzzy duplicate detection for curated publication and talk lists.
+
+Titles are normalized (LaTeX/HTML markup, accents, punctuation and case
+removed), split into character trigram shingles, and summarized with a
+MinHash signature. Signatures are banded into locality-sensitive hash
+buckets per publication year, so a lookup only compares against the few
+entries that share a bucket instead of the whole list. Candidates are
+confirmed with the exact Jaccard similarity of their shingle sets.
+
+Numbered series differ in a single token ("... Abundance. I." vs "II.",
+"Solar Cycle 23" vs "24") and score well above the threshold, so a fuzzy
+match also requires the numeric and roman-numeral tokens of both titles to
+be identical. A pair that is similar enough but numbered differently is a
+near-miss: it does not match, and near_misses() lists it so the caller
+can report it for review (lookups themselves never print).
+
+Used by add_non_ads_publication.py and merge_invited_conferences.py:
+
+    index = DedupIndex(existing_entries)
+    match = index.find(candidate)   # matching entry or None
+    index.add(candidate)
+    match = index.find_or_add(candidate)  # both, hashing the title once
+    match = index.find_exact(candidate)   # same normalized title and year only
+    for other, score in index.near_misses(candidate):
+        print(near_miss_message(candidate, other, score))
+"""
+
+import re
+import unicodedata
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Jaccard similarity of title trigrams at or above which two entries
+# (with the same year) are treated as the same publication.
+DEFAULT_THRESHOLD = 0.8
+
+# 32 bands x 4 rows: pairs at Jaccard 0.8 share a bucket with probability
+# > 0.999, pairs below ~0.35 rarely become candidates at all.
+NUM_BANDS = 32
+ROWS_PER_BAND = 4
+NUM_PERM = NUM_BANDS * ROWS_PER_BAND
+
+# Universal hashes h -> (a*h + b) mod p over 32-bit shingle hashes. a < 2**31
+# keeps a*h + b inside uint64. Fixed seed so signatures are stable across runs.
+_PRIME = np.uint64((1 << 32) + 15)
+_rng = np.random.default_rng(20260101)
+_PERM_A = _rng.integers(1, 1 << 31, size=NUM_PERM, dtype=np.uint64)[:, None]
+_PERM_B = _rng.integers(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)[:, None]
+
+_LATEX_COMMAND = re.compile(r'\\[A-Za-z]+\*?|\\.')
+_HTML_TAG = re.compile(r'<[^>]+>')
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+# Digits, or a roman numeral up to XXXIX (series numbers; longer numerals are
+# also English words: "mix", "dim", "mild")
+_NUMBER_TOKEN = re.compile(r'\d+|x{0,3}(?:ix|iv|v?i{0,3})')
+
+
+def normalize_title(title: str) -> str:
+    """
+    Reduce a title to lowercase ASCII words for comparison.
+
+    Example:
+        'The He$^{++}$ Abundance: {A} Review' -> 'the he abundance a review'
+    """
+    text = _HTML_TAG.sub(' ', title or '')
+    text = _LATEX_COMMAND.sub(' ', text)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    text = _NON_ALNUM.sub(' ', text.lower())
+    return text.strip()
+
+
+def number_tokens(normalized: str) -> Tuple[str, ...]:
+    """
+    Numeric and roman-numeral words of a normalized title, in order.
+
+    Example:
+        'solar wind helium abundance ii cycle 23' -> ('ii', '23')
+    """
+    return tuple(w for w in normalized.split() if _NUMBER_TOKEN.fullmatch(w))
+
+
+def title_shingles(normalized: str, k: int = 3) -> frozenset:
+    """Character k-gram shingles of a normalized title (padded at the ends)."""
+    padded = f" {normalized} "
+    if len(padded) <= k:
+        return frozenset([padded])
+    return frozenset(padded[i:i + k] for i in range(len(padded) - k + 1))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def minhash_signature(shingles: Iterable[str]) -> List[int]:
+    """MinHash signature of a shingle set using NUM_PERM universal hashes."""
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64)
+    return ((_PERM_A * hashes + _PERM_B) % _PRIME).min(axis=1).tolist()
+
+
+def entry_year(entry: Dict[str, Any]) -> str:
+    """Four-character year prefix of an entry ('2017-07-00' -> '2017')."""
+    return str(entry.get('year') or '')[:4]
+
+
+def near_miss_message(entry: Dict[str, Any], other: Dict[str, Any], score: float) -> str:
+    """Warning line for a near-miss reported by DedupIndex.near_misses()."""
+    return (f"  ⚠ Near-duplicate kept (numbering differs, similarity {score:.2f}): "
+            f"'{entry.get('title', '')}' vs '{other.get('title', '')}'")
+
+
+class DedupIndex:
+    """
+    MinHash/LSH index over entry titles, blocked by year.
+
+    Entries without a title or year are never indexed and never match,
+    matching the behaviour of the exact (title, year) keys this replaces.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = (), threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._entries: List[Tuple[Dict[str, Any], frozenset, Tuple[str, ...]]] = []
+        self._exact: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entry: Dict[str, Any]) -> bool:
+        return self.find(entry) is not None
+
+    @staticmethod
+    def _key(entry: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        year = entry_year(entry)
+        normalized = normalize_title(entry.get('title', ''))
+        if not normalized or not year:
+            return None
+        return normalized, year
+
+    @staticmethod
+    def _bands(year: str, shingles: frozenset) -> List[Tuple[str, int, Tuple[int, ...]]]:
+        signature = minhash_signature(shingles)
+        return [
+            (year, band, tuple(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]))
+            for band in range(NUM_BANDS)
+        ]
+
+    def _prepare(self, entry: Dict[str, Any]):
+        key = self._key(entry)
+        if key is None:
+            return None
+        shingles = title_shingles(key[0])
+        return key, shingles, self._bands(key[1], shingles)
+
+    def _insert(self, entry: Dict[str, Any], prepared) -> None:
+        key, shingles, bands = prepared
+        idx = len(self._entries)
+        self._entries.append((entry, shingles, number_tokens(key[0])))
+        self._exact.setdefault(key, idx)
+        for bucket in bands:
+            self._buckets.setdefault(bucket, []).append(idx)
+
+    def _similar(self, prepared) -> Iterator[Tuple[Dict[str, Any], float, bool]]:
+        """(indexed entry, similarity, same numbering) for candidates at or above the threshold."""
+        key, shingles, bands = prepared
+        candidates = set()
+        for bucket in bands:
+            candidates.update(self._buckets.get(bucket, ()))
+
+        numbers = number_tokens(key[0])
+        for idx in sorted(candidates):
+            indexed, indexed_shingles, indexed_numbers = self._entries[idx]
+            score = jaccard(shingles, indexed_shingles)
+            if score >= self.threshold:
+                yield indexed, score, indexed_numbers == numbers
+
+    def _match(self, prepared) -> Optional[Dict[str, Any]]:
+        key = prepared[0]
+        if key in self._exact:
+            return self._entries[self._exact[key]][0]
+
+        best, best_score = None, self.threshold
+        for indexed, score, same_numbers in self._similar(prepared):
+            if same_numbers and score >= best_score:
+                best, best_score = indexed, score
+        return best
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Index an entry so later lookups can match it."""
+        prepared = self._prepare(entry)
+        if prepared is not None:
+            self._insert(entry, prepared)
+
+    def find(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the most similar indexed entry at or above the threshold.
+
+        Returns:
+            The matching indexed entry, or None if there is no duplicate.
+        """
+        prepared = self._prepare(entry)
+        return None if prepared is None else self._match(prepared)
+
+    def near_misses(self, entry: Dict[str, Any]) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Return indexed entries similar enough to match but numbered differently.
+
+        These are kept apart by find(); callers report them for review.
+
+        Returns:
+            (indexed entry, similarity) pairs, most similar first.
+        """
+        prepared = self._prepare(entry)
+        if prepared is None:
+            return []
+        misses = [(indexed, score) for indexed, score, same_numbers in self._similar(prepared)
+                  if not same_numbers]
+        return sorted(misses, key=lambda miss: -miss[1])
+
+    def find_exact(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the indexed entry with the same normalized title and year.
+
+        For decisions that must not rest on similarity alone, such as
+        deleting an entry.
+        """
+        key = self._key(entry)
+        if key is None or key not in self._exact:
+            return None
+        return self._entries[self._exact[key]][0]
+
+    def find_or_add(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the matching indexed entry, or index this one if it is new.
+
+        Equivalent to find() followed by add() when nothing matched, but
+        the title signature is computed once.
+        """
+        prepared = self._prepare(entry)
+        if prepared is None:
+            return None
+        match = self._match(prepared)
+        if match is None:
+            self._insert(entry, prepared)
+        return match
@@ -1,17 +1,20 @@
 #!/usr/bin/env python3
 """Export figure registry to markdown for Word review."""
 
-import json
 from pathlib import Path
 
+from corpus import load_json
+from instrumentation import instrument_run, phase
+
 def export_registry_to_markdown():
     repo_root = Path(__file__).parent.parent
     registry_path = repo_root / "public" / "data" / "figure-registry.json"
     output_path = repo_root / "review-docs" / "figure-registry.md"
 
-    with open(registry_path) as f:
-        registry = json.load(f)
+    phase("load")
+    registry = load_json(registry_path)
 
+    phase("render")
     lines = []
     lines.append("# Figure Registry")
     lines.append("")
@@ -80,6 +83,7 @@ def export_registry_to_markdown():
         lines.append("---")
         lines.append("")
 
+    phase("write")
     output_path.parent.mkdir(exist_ok=True)
     with open(output_path, "w") as f:
         f.write("\n".join(lines))
@@ -88,4 +92,5 @@ def export_registry_to_markdown():
     return output_path
 
 if __name__ == "__main__":
+    instrument_run()
     export_registry_to_markdown()
@@ -2,17 +2,25 @@
 """Export research topic JSON files to markdown for review.
 
 Joins topic JSONs with the centralized figure registry to produce
-complete markdown documents for track-changes review in Word.
+complete markdown documents for track-changes review in Word. Other
+topics that use each figure come from the topic-figure index.
 """
 
 import json
+import sys
 from pathlib import Path
 
+# Add parent dir to path for topic_index import
+sys.path.insert(0, str(Path(__file__).parent))
+from corpus import figure_pdf, load_json
+from instrumentation import instrument_run, phase, span
+from topic_index import update_topic_figure_index
+
 
 def resolve_figure_pdf(ref: str, repo_root: Path) -> str | None:
     """Resolve a figure ref (paper_id/figure_id) to its corpus PDF path."""
     paper_id, figure_id = ref.split("/", 1)
-    pdf_path = repo_root / "research-corpus" / "papers" / paper_id / "figures" / f"{figure_id}.pdf"
+    pdf_path = figure_pdf(repo_root / "research-corpus", paper_id, figure_id)
     if pdf_path.exists():
         return str(pdf_path)
     return None
@@ -20,18 +28,31 @@ def resolve_figure_pdf(ref: str, repo_root: Path) -> str | None:
 
 def load_figure_registry(repo_root: Path) -> dict:
     """Load the centralized figure registry."""
-    registry_path = repo_root / "public" / "data" / "figure-registry.json"
-    with open(registry_path) as f:
-        return json.load(f)
+    return load_json(repo_root / "public" / "data" / "figure-registry.json")
+
+
+def other_topic_usage(ref: str, slug: str, figure_index: dict) -> str | None:
+    """Describe where else a figure is used, e.g. "primary in x; related in y"."""
+    usage = figure_index.get(ref, {})
+    parts = []
+    for role, label in (("primary_in", "primary in"), ("related_in", "related in")):
+        others = [t for t in usage.get(role, []) if t != slug]
+        if others:
+            parts.append(f"{label} {', '.join(others)}")
+    return "; ".join(parts) or None
 
 
 def export_topic_to_markdown(
-    json_path: Path, output_dir: Path, registry: dict, repo_root: Path
+    json_path: Path, output_dir: Path, registry: dict, repo_root: Path,
+    figure_index: dict | None = None,
 ) -> Path:
     """Convert a research topic JSON to a markdown file for review.
 
     Resolves figure refs against the registry to include all metadata.
+    When figure_index (the "figures" view of the topic-figure index) is
+    given, each figure also lists the other topics that use it.
     """
+    figure_index = figure_index or {}
     with open(json_path) as f:
         data = json.load(f)
 
@@ -72,6 +93,11 @@ def export_topic_to_markdown(
         lines.append(f"**Figure:** `{pf_ref}`")
         lines.append("")
 
+        also_used = other_topic_usage(pf_ref, slug, figure_index)
+        if also_used:
+            lines.append(f"**Also used:** {also_used}")
+            lines.append("")
+
         pdf_path = resolve_figure_pdf(pf_ref, repo_root)
         if pdf_path:
             lines.append(f"![{pf_ref}]({pdf_path})")
@@ -149,6 +175,11 @@ def export_topic_to_markdown(
             lines.append(f"**Relevance:** {rf.get('relevance', 'N/A')}")
             lines.append("")
 
+            also_used = other_topic_usage(rf_ref, slug, figure_index)
+            if also_used:
+                lines.append(f"**Also used:** {also_used}")
+                lines.append("")
+
             if rf_entry.get("summary_short"):
                 lines.append(f"**Summary:** {rf_entry['summary_short']}")
                 lines.append("")
@@ -190,18 +221,23 @@ def main():
     output_dir = repo_root / "review-docs"
     output_dir.mkdir(exist_ok=True)
 
+    phase("load")
     registry = load_figure_registry(repo_root)
     print(f"Loaded figure registry: {len(registry)} figures")
+    figure_index = update_topic_figure_index(repo_root / "public" / "data")["figures"]
 
     json_files = sorted(topics_dir.glob("*.json"))
     print(f"Exporting {len(json_files)} topics to markdown...\n")
 
+    phase("export")
     for json_path in json_files:
-        output_path = export_topic_to_markdown(json_path, output_dir, registry, repo_root)
+        with span("topic", file=json_path.name):
+            output_path = export_topic_to_markdown(json_path, output_dir, registry, repo_root, figure_index)
         print(f"  {json_path.name} -> {output_path.name}")
 
     print(f"\nMarkdown files created in: {output_dir}")
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
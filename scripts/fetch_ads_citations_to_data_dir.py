@@ -8,8 +8,13 @@ JSON file to public/data/.
 
 Use generate_citations_timeline.py to create plots from this data.
 
-This script includes a caching mechanism. If the output data file has been modified
-in the last 7 days, it will skip the download and processing steps.
+Histograms are refreshed selectively. The bibcode search also returns each paper's
+citation_count, which is compared with the per-paper snapshot in
+public/data/citations_by_paper.json. Only papers that are new, whose count changed,
+or whose snapshot entry is older than 90 days are fetched from the metrics API;
+papers with no citations need no request at all. Every other paper reuses its cached
+histogram. Pass --full to re-fetch every paper. The yearly totals are sums over the
+citation store (citation_store.py) built from the snapshot.
 
 Raises
 ------
@@ -18,9 +23,10 @@ ValueError
 
 Example
 -------
-$ python scripts/fetch_ads_citations_to_data_dir.py
+$ python scripts/fetch_ads_citations_to_data_dir.py [--full]
 """
 
+import argparse
 import ads
 import requests
 from datetime import datetime, timedelta, timezone
@@ -32,31 +38,34 @@ import sys
 import pandas as pd
 
 from zoneinfo import ZoneInfo
-from utils import get_public_data_dir, get_relative_path
+from citation_store import CITED_NONREFEREED, CITED_REFEREED, load_store, needs_refresh, snapshot_entry
+from data_store import DataStore
+from utils import get_ads_api_url, get_public_data_dir, get_relative_path
+from instrumentation import instrument_run, phase
 
 # Hard code Eastern Time because changing that is a quick update,
 # but it requires a lot of package installs and such to auto-detect.
 local_tz = ZoneInfo("America/New_York")
 
-# === Define output paths and check cache ===
+parser = argparse.ArgumentParser(description="Fetch yearly citation counts from NASA ADS.")
+parser.add_argument("--full", action="store_true", help="Re-fetch every paper's histogram, ignoring the snapshot")
+args = parser.parse_args()
+
+instrument_run()
+
+# === Define output paths and load the per-paper snapshot ===
+phase("cache-check")
 public_data_dir = get_public_data_dir()
 output_filename = "citations_by_year.json"
-cached_json_path = public_data_dir / output_filename
-
-# Caching logic
-if cached_json_path.exists():
-    last_modified_time = datetime.fromtimestamp(cached_json_path.stat().st_mtime, tz=timezone.utc)
-    if datetime.now(timezone.utc) - last_modified_time < timedelta(days=7):
-        print(f"Cached data at {get_relative_path(cached_json_path)} is less than 7 days old. Skipping download.")
-        # Optionally load the data if needed by subsequent steps
-        with open(cached_json_path, "r") as f:
-            cached_data = json.load(f)
-        print("Loaded data from cache.")
-        sys.exit(0) # Exit successfully
-    else:
-        print("Cached data is older than 7 days. Fetching new data.")
+snapshot_path = public_data_dir / "citations_by_paper.json"
+
+snapshot = {}
+if snapshot_path.exists() and not args.full:
+    with open(snapshot_path, "r") as f:
+        snapshot = json.load(f)
+    print(f"Loaded {len(snapshot)} cached histograms from {get_relative_path(snapshot_path)}")
 else:
-    print("No cached data found. Fetching new data.")
+    print("No per-paper snapshot in use. Fetching every histogram.")
 
 
 # === Read ORCID and API token from environment variables ===
@@ -67,27 +76,52 @@ if not ORCID_ID or not ADS_DEV_KEY:
     raise ValueError("Both ADS_ORCID and ADS_DEV_KEY must be set in the environment.")
 
 ads.config.token = ADS_DEV_KEY
+ADS_API_URL = get_ads_api_url()
+ads.SearchQuery.HTTP_ENDPOINT = f"{ADS_API_URL}/search/query"
 
 # === Step 1: Get all bibcodes ===
+phase("ads-search")
 print("Querying NASA ADS for publications...")
 results = ads.SearchQuery(
     orcid=ORCID_ID,
-    fl=["bibcode"],
+    fl=["bibcode", "citation_count", "property"],
     rows=2000,
 )
 # ADS load-sheds the ads-api-client User-Agent during high load;
 # override with a generic UA so requests aren't categorized as bot traffic.
 results.session.headers["User-Agent"] = "python-requests/2.32.3"
-bibcodes = [paper.bibcode for paper in results]
+papers = list(results)
+citation_counts = {paper.bibcode: paper.citation_count or 0 for paper in papers}
+refereed = {paper.bibcode: "REFEREED" in (paper.property or []) for paper in papers}
+bibcodes = list(citation_counts)
 print(f"Found {len(bibcodes)} papers.")
 
+# Decide which papers need a fresh histogram
+today = datetime.now(timezone.utc).date()
+to_fetch = []
+for bibcode, count in citation_counts.items():
+    if count == 0:
+        # Nothing to fetch: an uncited paper has an empty histogram
+        snapshot[bibcode] = snapshot_entry(None, 0, today)
+    elif needs_refresh(snapshot.get(bibcode), count, today):
+        to_fetch.append(bibcode)
+print(f"{len(to_fetch)} of {len(bibcodes)} histograms need refreshing.")
+
 # === Step 2: Query citation histogram by year ===
 headers = {"Authorization": f"Bearer {ADS_DEV_KEY}"}
-refereed_citations = dict()
-nonrefereed_citations = dict()
 
-refereed_keys = ("refereed to refereed", "nonrefereed to refereed")
-nonrefereed_keys = ("refereed to nonrefereed", "nonrefereed to nonrefereed")
+
+def save_snapshot():
+    """Write the snapshot for the current bibcodes (papers dropped from the ORCID are pruned)."""
+    current = {
+        bibcode: {**snapshot[bibcode], "refereed": refereed[bibcode]}
+        for bibcode in sorted(bibcodes) if bibcode in snapshot
+    }
+    public_data_dir.mkdir(parents=True, exist_ok=True)
+    with DataStore(source="ads-citations") as store:
+        written = store.write_document(snapshot_path, current, trailing_newline=True)
+    if written:
+        print(f"💾 Per-paper snapshot saved to {get_relative_path(snapshot_path)}")
 
 
 def print_failure_msg(i, bibcode, response):
@@ -113,40 +147,34 @@ Rate Exceeded at : {(reset_time_utc - reset_dt_td).astimezone(local_tz)}
 Exiting program
 """
     )
+    save_snapshot()  # Keep the histograms fetched so far for the next run
     sys.exit(1)  # Stop making more calls
 
 
+phase("ads-metrics")
 print("Downloading citation data by year...")
-for i, bibcode in enumerate(bibcodes, 1):
+for i, bibcode in enumerate(to_fetch, 1):
     if not (i % 10):
         print(f"Downloading bibcode {i} ({bibcode})")
-        
-    url = f"https://api.adsabs.harvard.edu/v1/metrics/{bibcode}"
+
+    url = f"{ADS_API_URL}/metrics/{bibcode}"
     response = requests.get(url, headers=headers)
     if response.status_code != 200:
         print_failure_msg(i, bibcode, response)
         continue
 
-    data = response.json()
-    hist = data.get("histograms", {}).get("citations", {})
+    snapshot[bibcode] = snapshot_entry(response.json(), citation_counts[bibcode], today)
 
-    for k in refereed_keys:
-        case = hist.get(k, {})
-        for kk, vv in case.items():
-            refereed_citations[(bibcode, k, kk)] = vv
-    for k in nonrefereed_keys:
-        case = hist.get(k, {})
-        for kk, vv in case.items():
-            nonrefereed_citations[(bibcode, k, kk)] = vv
+save_snapshot()
 
 
 # === Step 3: Align years and prepare data ===
-refereed_citations = pd.Series(refereed_citations)
-nonrefereed_citations = pd.Series(nonrefereed_citations)
-
-ref_counts = refereed_citations.groupby(level=-1).sum().sort_index()
-nonref_counts = nonrefereed_citations.groupby(level=-1).sum().sort_index()
-all_counts = pd.concat({"Refereed": ref_counts, "Nonrefereed": nonref_counts}, axis=1).fillna(0).astype(int)
+phase("transform")
+store = load_store(public_data_dir)
+all_counts = pd.DataFrame(
+    {"Refereed": store.by_year(*CITED_REFEREED), "Nonrefereed": store.by_year(*CITED_NONREFEREED)},
+    index=[str(year) for year in store.years],
+)
 
 # Filter to start from first year with non-zero citations
 all_counts = all_counts[(all_counts.Refereed > 0) | (all_counts.Nonrefereed > 0)]
@@ -163,14 +191,17 @@ nonref_counts = all_counts.Nonrefereed.tolist()
 
 
 # === Step 4: Save JSON data ===
+phase("write")
 public_data_dir.mkdir(parents=True, exist_ok=True)
 output_path = public_data_dir / output_filename
 
 data_to_save = {"years": all_years, "refereed": ref_counts, "nonrefereed": nonref_counts}
 
-with open(output_path, "w") as f:
-    json.dump(data_to_save, f, indent=2)
-
-print(f"\n💾 Data saved to {get_relative_path(output_path)}")
+with DataStore(source="ads-citations") as store:
+    written = store.write_document(output_path, data_to_save)
+if written:
+    print(f"\n💾 Data saved to {get_relative_path(output_path)}")
+else:
+    print(f"\n💾 {get_relative_path(output_path)} unchanged")
 print("\n✓ Citations data fetch complete")
 print(f"   Use 'python scripts/generate_citations_timeline.py' to generate plots")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Fetch publications and citation data for a group of ORCIDs (a research group or lab page).
+
+Group mode is built so that N members cost roughly one member's API calls and wall time:
+
+- Members are searched together: one ADS query per ORCID_CHUNK members
+  (orcid:("A" OR "B" ...)), paged until every result is in. Each paper is
+  assigned to the members whose ORCID appears in its orcid_pub, orcid_user or
+  orcid_other field.
+- Co-authored bibcodes are deduplicated before any metrics call, so a paper
+  shared by several members is fetched once.
+- Per-paper histograms go through one shared snapshot (citations_by_paper.json
+  in the output directory, same refresh rules as fetch_ads_citations_to_data_dir.py):
+  only papers that are new, changed citation_count, or are stale are fetched,
+  concurrently with --jobs workers.
+- Per-member and combined indicators (h, g, i10, i100, m and time series) and
+  yearly citation counts are slices of the shared citation store
+  (citation_store.py, citation_indicators.py), not per-member bulk metrics requests.
+
+Outputs (in --out, default public/data/group/):
+    publications.json            deduplicated papers with their members
+    combined.json                group-wide indicators and citations by year
+    members/<orcid>.json         the same for each member
+    citations_by_paper.json      shared per-paper snapshot
+
+ORCIDs come from --orcids, --orcid-file (one per line, # comments allowed) or
+ADS_ORCIDS (comma or whitespace separated). Requires ADS_DEV_KEY.
+
+Usage:
+    python scripts/fetch_ads_group.py --orcids 0000-0002-1825-0097 0000-0001-5109-3700
+    python scripts/fetch_ads_group.py --orcid-file group.txt --jobs 8 [--full]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import ads
+import numpy as np
+import requests
+
+from citation_indicators import compute_indicators
+from citation_store import (CITED_NONREFEREED, CITED_REFEREED, SNAPSHOT_FILENAME, CitationStore,
+                            load_store, needs_refresh, snapshot_entry)
+from instrumentation import instrument_run, span
+from utils import get_ads_api_url, get_public_data_dir, get_relative_path, write_json_atomic
+
+ORCID_PATTERN = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]")
+# Members per search query; keeps the Solr query string well under URL limits
+ORCID_CHUNK = 25
+SEARCH_FIELDS = ["bibcode", "title", "author", "pubdate", "pub", "doctype", "citation_count",
+                 "property", "orcid_pub", "orcid_user", "orcid_other"]
+MAX_ATTEMPTS = 3
+BACKOFF_SECONDS = [60, 180]
+
+
+class RateLimited(Exception):
+    """ADS answered 429; the remaining metrics requests are abandoned."""
+
+    def __init__(self, response: requests.Response):
+        super().__init__(f"rate limited, Retry-After {response.headers.get('Retry-After', '?')}s")
+        self.response = response
+
+
+def read_orcids(args: argparse.Namespace) -> List[str]:
+    """Member ORCIDs in the given order, duplicates removed."""
+    text = " ".join(args.orcids or [])
+    if args.orcid_file:
+        text += "\n" + "\n".join(line.split("#", 1)[0] for line in args.orcid_file.read_text().splitlines())
+    if not text.strip():
+        text = os.getenv("ADS_ORCIDS", "")
+    orcids = list(dict.fromkeys(ORCID_PATTERN.findall(text)))
+    if not orcids:
+        raise ValueError("No ORCIDs given: use --orcids, --orcid-file or ADS_ORCIDS.")
+    return orcids
+
+
+def search_group(orcids: List[str]) -> Dict[str, dict]:
+    """Search every member in as few queries as possible; returns bibcode -> doc with 'members'."""
+    docs: Dict[str, dict] = {}
+    for start in range(0, len(orcids), ORCID_CHUNK):
+        chunk = orcids[start:start + ORCID_CHUNK]
+        query = "orcid:(" + " OR ".join(f'"{orcid}"' for orcid in chunk) + ")"
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                with span("ads-search", members=len(chunk), attempt=attempt + 1) as record:
+                    # max_pages: keep paging until numFound, even if ADS caps rows per page
+                    results = ads.SearchQuery(q=query, fl=SEARCH_FIELDS, rows=2000, max_pages=100)
+                    # ADS load-sheds the ads-api-client User-Agent during high load;
+                    # override with a generic UA so requests aren't categorized as bot traffic.
+                    results.session.headers["User-Agent"] = "python-requests/2.32.3"
+                    papers = list(results)
+                    record["papers"] = len(papers)
+                break
+            except ads.exceptions.APIResponseError as e:
+                if attempt < MAX_ATTEMPTS - 1:
+                    wait = BACKOFF_SECONDS[attempt]
+                    print(f"⚠️  ADS API error on attempt {attempt + 1}/{MAX_ATTEMPTS}: {e}")
+                    print(f"   Retrying in {wait}s...")
+                    time.sleep(wait)
+                else:
+                    print(f"✗ ADS API failed after {MAX_ATTEMPTS} attempts: {e}")
+                    raise
+
+        for paper in papers:
+            ids = set((paper.orcid_pub or []) + (paper.orcid_user or []) + (paper.orcid_other or []))
+            members = [orcid for orcid in chunk if orcid in ids]
+            doc = docs.setdefault(paper.bibcode, {
+                "bibcode": paper.bibcode,
+                "title": (paper.title or [""])[0],
+                "authors": paper.author or [],
+                "year": (paper.pubdate or "")[:4],  # ADS pubdate is "YYYY-MM-00"
+                "journal": paper.pub or "",
+                "publication_type": paper.doctype or "",
+                "citations": paper.citation_count or 0,
+                "refereed": "REFEREED" in (paper.property or []),
+                "members": [],
+            })
+            doc["members"].extend(m for m in members if m not in doc["members"])
+    return docs
+
+
+def fetch_histograms(bibcodes: List[str], snapshot: Dict[str, dict], counts: Dict[str, int],
+                     token: str, api_url: str, jobs: int) -> Optional[RateLimited]:
+    """Fetch single-bibcode metrics concurrently into the snapshot; returns the 429 that stopped it, if any."""
+    today = datetime.now(timezone.utc).date()
+    stop = threading.Event()
+    local = threading.local()
+    done = [0]
+    lock = threading.Lock()
+
+    def fetch(bibcode: str) -> Optional[RateLimited]:
+        if stop.is_set():
+            return None
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.session.headers["Authorization"] = f"Bearer {token}"
+        response = local.session.get(f"{api_url}/metrics/{bibcode}")
+        if response.status_code == 429:
+            stop.set()
+            return RateLimited(response)
+        if response.status_code != 200:
+            print(f"Failed to get metrics for {bibcode} ({response.status_code})")
+            return None
+        entry = snapshot_entry(response.json(), counts[bibcode], today)
+        with lock:
+            snapshot[bibcode] = entry
+            done[0] += 1
+            if not done[0] % 50:
+                print(f"   {done[0]}/{len(bibcodes)} histograms")
+        return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        failures = [result for result in pool.map(fetch, bibcodes) if result is not None]
+    return failures[0] if failures else None
+
+
+def summarize(store: CitationStore, rows: np.ndarray) -> dict:
+    """Indicators, time series and citations by year for the papers in rows."""
+    local = compute_indicators(store, rows=rows)
+    refereed = compute_indicators(store, refereed_only=True, rows=rows)
+    ref = store.by_year(*CITED_REFEREED, rows=rows)
+    nonref = store.by_year(*CITED_NONREFEREED, rows=rows)
+    keep = (ref > 0) | (nonref > 0)
+    return {
+        "papers": int(rows.sum()),
+        "refereed_papers": int((rows & store.refereed).sum()),
+        "total_citations": int(ref.sum() + nonref.sum()),
+        "indicators": local["indicators"],
+        "indicators refereed": refereed["indicators"],
+        "time series": local["time series"],
+        "citations_by_year": {
+            "years": [str(year) for year in store.years[keep]],
+            "refereed": ref[keep].tolist(),
+            "nonrefereed": nonref[keep].tolist(),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fetch ADS data for a group of ORCIDs.")
+    parser.add_argument("--orcids", nargs="+", help="Member ORCIDs")
+    parser.add_argument("--orcid-file", type=Path, help="File with one ORCID per line")
+    parser.add_argument("--out", type=Path, help="Output directory (default: public/data/group)")
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent metrics requests (default 4)")
+    parser.add_argument("--full", action="store_true", help="Re-fetch every paper's histogram, ignoring the snapshot")
+    args = parser.parse_args()
+
+    token = os.getenv("ADS_DEV_KEY")
+    if not token:
+        raise EnvironmentError("ADS_DEV_KEY environment variable not set.")
+    orcids = read_orcids(args)
+    out_dir = args.out or get_public_data_dir() / "group"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    ads.config.token = token
+    api_url = get_ads_api_url()
+    ads.SearchQuery.HTTP_ENDPOINT = f"{api_url}/search/query"
+
+    # === Step 1: Search all members and deduplicate ===
+    print(f"Querying NASA ADS for {len(orcids)} members...")
+    docs = search_group(orcids)
+    pairs = sum(len(doc["members"]) for doc in docs.values())
+    print(f"Found {pairs} member-paper pairs: {len(docs)} unique bibcodes "
+          f"({pairs - len(docs)} co-authored duplicates skipped)")
+
+    # === Step 2: Refresh per-paper histograms through the shared snapshot ===
+    snapshot_path = out_dir / SNAPSHOT_FILENAME
+    snapshot = {}
+    if snapshot_path.exists() and not args.full:
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    today = datetime.now(timezone.utc).date()
+    counts = {bibcode: doc["citations"] for bibcode, doc in docs.items()}
+    to_fetch = []
+    for bibcode, count in counts.items():
+        if count == 0:
+            snapshot[bibcode] = snapshot_entry(None, 0, today)
+        elif needs_refresh(snapshot.get(bibcode), count, today):
+            to_fetch.append(bibcode)
+    print(f"{len(to_fetch)} of {len(docs)} histograms need refreshing ({args.jobs} workers)")
+
+    with span("ads-metrics", bibcodes=len(to_fetch), jobs=args.jobs):
+        limited = fetch_histograms(to_fetch, snapshot, counts, token, api_url, args.jobs)
+
+    current = {
+        bibcode: {**snapshot[bibcode], "refereed": docs[bibcode]["refereed"]}
+        for bibcode in sorted(docs) if bibcode in snapshot
+    }
+    if write_json_atomic(snapshot_path, current, trailing_newline=True):
+        print(f"💾 Shared snapshot saved to {get_relative_path(snapshot_path)}")
+    if limited is not None:
+        print(f"✗ ADS metrics {limited}. Histograms fetched so far are kept; rerun later.")
+        return 1
+
+    # === Step 3: Per-member and combined outputs ===
+    with span("write"):
+        store = load_store(out_dir)
+        members_dir = out_dir / "members"
+        members_dir.mkdir(exist_ok=True)
+        membership = {orcid: np.zeros(len(store), dtype=bool) for orcid in orcids}
+        for bibcode, doc in docs.items():
+            if bibcode in store.paper_index:
+                for orcid in doc["members"]:
+                    membership[orcid][store.paper_index[bibcode]] = True
+
+        for orcid, rows in membership.items():
+            summary = {"orcid": orcid, **summarize(store, rows)}
+            write_json_atomic(members_dir / f"{orcid}.json", summary, trailing_newline=True)
+            print(f"   {orcid}: {summary['papers']} papers, h={summary['indicators']['h']}")
+
+        combined = {
+            "members": orcids,
+            "co_authored_papers": sum(1 for doc in docs.values() if len(doc["members"]) > 1),
+            **summarize(store, np.isin(store.bibcodes, list(docs))),
+        }
+        write_json_atomic(out_dir / "combined.json", combined, trailing_newline=True)
+        publications = sorted(docs.values(), key=lambda doc: (doc["year"], doc["bibcode"]), reverse=True)
+        write_json_atomic(out_dir / "publications.json", publications, ensure_ascii=False, trailing_newline=True)
+
+    print(f"\n✓ Group of {len(orcids)}: {combined['papers']} papers, h={combined['indicators']['h']}, "
+          f"{combined['total_citations']} citations")
+    print(f"💾 Outputs written to {get_relative_path(out_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    instrument_run()
+    sys.exit(main())
@@ -1,11 +1,12 @@
 import ads
 import requests
 import os
-import json
 import argparse
 import time
 from pathlib import Path
-from utils import get_public_data_dir, get_relative_path
+from utils import get_ads_api_url, get_public_data_dir, get_relative_path
+from data_store import DataStore
+from instrumentation import instrument_run, span
 
 
 def fetch_ads_metrics(orcid: str):
@@ -14,6 +15,8 @@ def fetch_ads_metrics(orcid: str):
         raise EnvironmentError("ADS_DEV_KEY environment variable not set.")
 
     ads.config.token = token
+    api_url = get_ads_api_url()
+    ads.SearchQuery.HTTP_ENDPOINT = f"{api_url}/search/query"
 
     print(f"Fetching publications for ORCID: {orcid}")
     MAX_ATTEMPTS = 3
@@ -21,11 +24,12 @@ def fetch_ads_metrics(orcid: str):
     bibcodes = None
     for attempt in range(MAX_ATTEMPTS):
         try:
-            results = ads.SearchQuery(orcid=orcid, fl=["bibcode"], rows=2000)
-            # ADS load-sheds the ads-api-client User-Agent during high load;
-            # override with a generic UA so requests aren't categorized as bot traffic.
-            results.session.headers["User-Agent"] = "python-requests/2.32.3"
-            bibcodes = [article.bibcode for article in results]
+            with span("ads-search", attempt=attempt + 1):
+                results = ads.SearchQuery(orcid=orcid, fl=["bibcode"], rows=2000)
+                # ADS load-sheds the ads-api-client User-Agent during high load;
+                # override with a generic UA so requests aren't categorized as bot traffic.
+                results.session.headers["User-Agent"] = "python-requests/2.32.3"
+                bibcodes = [article.bibcode for article in results]
             break
         except ads.exceptions.APIResponseError as e:
             if attempt < MAX_ATTEMPTS - 1:
@@ -41,14 +45,15 @@ def fetch_ads_metrics(orcid: str):
         raise ValueError("No bibcodes found for this ORCID.")
 
     print(f"Found {len(bibcodes)} bibcodes. Requesting metrics...")
-    response = requests.post(
-        "https://api.adsabs.harvard.edu/v1/metrics",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-        json={"bibcodes": bibcodes},
-    )
+    with span("ads-metrics", bibcodes=len(bibcodes)):
+        response = requests.post(
+            f"{api_url}/metrics",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            json={"bibcodes": bibcodes},
+        )
 
     if response.status_code != 200:
         raise RuntimeError(f"ADS API error: {response.status_code} {response.text}")
@@ -60,10 +65,12 @@ def fetch_ads_metrics(orcid: str):
     public_data_dir.mkdir(parents=True, exist_ok=True)
     output_file = public_data_dir / "ads_metrics.json"
 
-    with open(output_file, "w") as f:
-        json.dump(metrics, f, indent=2)
-
-    print(f"Metrics written to {get_relative_path(output_file)}")
+    with span("write"), DataStore(source="ads-metrics") as store:
+        written = store.write_document(output_file, metrics)
+    if written:
+        print(f"Metrics written to {get_relative_path(output_file)}")
+    else:
+        print(f"Metrics unchanged in {get_relative_path(output_file)}")
 
 
 if __name__ == "__main__":
@@ -75,4 +82,5 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
+    instrument_run()
     fetch_ads_metrics(args.orcid)
@@ -1,37 +1,17 @@
 import ads
 import os
-import json
-import re
 import time
 from datetime import datetime
-from pathlib import Path
-from utils import get_public_data_dir, get_relative_path
+from utils import get_ads_api_url, get_public_data_dir, get_relative_path, json_bytes
+from data_store import DataStore
+from publication_changes import summary_line, write_changes
+from author_names import standardize_author_name
 from html_to_unicode import convert_html_to_unicode
+from instrumentation import instrument_run, phase
 
 import pdb
 
-def load_author_standardization_config():
-    """Load author name standardization rules from config file."""
-    config_path = Path(__file__).parent / "author_name_config.json"
-
-    if not config_path.exists():
-        print(f"⚠️  Warning: {config_path.name} not found, using no standardization rules")
-        return {}
-
-    with open(config_path, 'r') as f:
-        data = json.load(f)
-
-    # Convert to dictionary keyed by last name for fast lookup
-    rules = {}
-    for rule in data.get('standardization_rules', []):
-        if rule.get('enabled', True):
-            rules[rule['last_name']] = rule
-
-    print(f"✓ Loaded {len(rules)} author standardization rule(s)")
-    return rules
-
-# Load configuration at module level
-AUTHOR_STANDARDIZATION_CONFIG = load_author_standardization_config()
+instrument_run()
 
 # Venue name standardization mappings for conference publications
 # Groups mappings by conference series for easy maintenance and extension
@@ -67,87 +47,8 @@ if not ORCID or not token:
 ADS_ORCID   : {ORCID}
 ADS_DEV_KEY : {token}""")
 
-def standardize_author_name(author_name: str) -> str:
-    """
-    Standardize author names using configuration-based rules.
-
-    Handles multiple format variants for configured authors:
-    - Reverse format: "Lastname, Firstname..." (most common from ADS)
-    - Forward format: "Firstname Lastname" (some publishers)
-    - Initials vs full names: "Benjamin" vs "Ben" vs "B."
-    - Spacing variations: "B.L." vs "B. L."
-
-    Falls through to original name if no standardization rule matches.
-
-    Args:
-        author_name: Raw author name from ADS API
-
-    Returns:
-        Standardized author name (or original if no rule matches)
-    """
-    name = author_name.strip()
-
-    # Check each configured author
-    for last_name, config in AUTHOR_STANDARDIZATION_CONFIG.items():
-        canonical = config['canonical']
-
-        # Already canonical - return immediately
-        if name == canonical:
-            return name
-
-        # Extract configuration
-        last = config['last_name']
-        first_initial = config['first_initial']
-        middle_initial = config.get('middle_initial', '')
-        first_names = config.get('first_names', [])
-
-        # PATTERN GROUP 1: REVERSE FORMAT (Lastname, Firstname...)
-        # Most common format from ADS API
-
-        # Match: "Alterman, Benjamin L." or "Alterman, Benjamin"
-        for first_name in first_names:
-            # With optional middle initial (with/without period)
-            pattern = rf'^{last},\s*{first_name}(\s+{middle_initial}\.?)?$'
-            if re.match(pattern, name, re.IGNORECASE):
-                return canonical
-
-        # Match: "Alterman, B." (first initial only, missing middle)
-        if re.match(rf'^{last},\s*{first_initial}\.$', name, re.IGNORECASE):
-            return canonical
-
-        # Match: "Alterman, B.L." (no space between initials)
-        if middle_initial:
-            if re.match(rf'^{last},\s*{first_initial}\.{middle_initial}\.$', name, re.IGNORECASE):
-                return canonical
-
-        # Match: "Alterman, B. L. L." (triple initial - data error)
-        if middle_initial:
-            if re.match(rf'^{last},\s*{first_initial}\.\s*{middle_initial}\.\s*{middle_initial}\.$', name, re.IGNORECASE):
-                return canonical
-
-        # PATTERN GROUP 2: FORWARD FORMAT (Firstname Lastname)
-        # Less common but appears in some datasets (user-reported)
-
-        # Match: "Benjamin L. Alterman" or "Benjamin Alterman"
-        for first_name in first_names:
-            # With optional middle initial
-            pattern = rf'^{first_name}(\s+{middle_initial}\.?)?\s+{last}$'
-            if re.match(pattern, name, re.IGNORECASE):
-                return canonical
-
-        # Match: "B. L. Alterman" or "B. Alterman"
-        if middle_initial:
-            # With optional middle initial
-            pattern = rf'^{first_initial}\.(\s*{middle_initial}\.?)?\s+{last}$'
-            if re.match(pattern, name, re.IGNORECASE):
-                return canonical
-        else:
-            # Just first initial
-            if re.match(rf'^{first_initial}\.\s+{last}$', name, re.IGNORECASE):
-                return canonical
-
-    # No standardization rule matched - return original name unchanged
-    return name
+# ADS_API_URL redirects the client (e.g. to the offline stand-in server)
+ads.SearchQuery.HTTP_ENDPOINT = f"{get_ads_api_url()}/search/query"
 
 # Fields to request from ADS.
 # 'property' carries ADS's curated tags including REFEREED/NOT REFEREED;
@@ -169,6 +70,7 @@ fields = [
 MAX_ATTEMPTS = 3
 BACKOFFS_SECONDS = [60, 180]  # waits between attempts 1->2 and 2->3
 
+phase("ads-query")
 results = None
 for attempt in range(MAX_ATTEMPTS):
     try:
@@ -189,6 +91,7 @@ for attempt in range(MAX_ATTEMPTS):
             raise
 
 # Build structured JSON data
+phase("transform")
 publications = []
 for pub in results:
     title = pub.title[0] if pub.title else "(No title)"
@@ -256,11 +159,18 @@ if len(publications) < 100:
     )
 
 # Save to public/data directory
+phase("write")
 public_data_dir = get_public_data_dir()
 public_data_dir.mkdir(parents=True, exist_ok=True)
 output_file = public_data_dir / "ads_publications.json"
 
-with open(output_file, "w") as f:
-    json.dump(publications, f, indent=2)
-
-print(f"Saved {len(publications)} publications to {get_relative_path(output_file)}")
+with DataStore(source="ads-publications") as store:
+    # Diff against the previous raw fetch (the file on disk has been merged since)
+    previous = store.latest(output_file.name, sources=(store.source,)) or store.latest(output_file.name)
+    written = store.write_document(output_file, publications)
+changes = write_changes(public_data_dir, store.source, previous and previous[1], json_bytes(publications))
+if written:
+    print(f"Saved {len(publications)} publications to {get_relative_path(output_file)}")
+else:
+    print(f"{get_relative_path(output_file)} unchanged ({len(publications)} publications)")
+print(summary_line(changes))
@@ -16,6 +16,7 @@ import itertools
 import json
 import matplotlib.pyplot as plt
 from utils import get_public_data_dir, get_public_plots_dir, get_relative_path
+from instrumentation import instrument_run, span
 from plot_config import COLORS, FIGURE, FONTS, LINES, GRID, LEGEND, LAYOUT, OUTPUT, THEMES, get_theme_config, get_data_colors
 
 
@@ -116,25 +117,29 @@ def generate_citations_timeline(theme_name='light'):
     plots_dir = get_public_plots_dir()
 
     plot_path_svg = plots_dir / f"citations_by_year{suffix}.svg"
-    plt.savefig(plot_path_svg,
-                format='svg',
-                dpi=OUTPUT['svg_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="svg"):
+        plt.savefig(plot_path_svg,
+                    format='svg',
+                    dpi=OUTPUT['svg_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_svg)}")
 
     plot_path_png = plots_dir / f"citations_by_year{suffix}.png"
-    plt.savefig(plot_path_png,
-                format='png',
-                dpi=OUTPUT['png_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="png"):
+        plt.savefig(plot_path_png,
+                    format='png',
+                    dpi=OUTPUT['png_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_png)}")
 
     plt.close()
 
 
 if __name__ == '__main__':
+    instrument_run()
     for theme_name in THEMES:
-        generate_citations_timeline(theme_name)
+        with span("plot", theme=theme_name):
+            generate_citations_timeline(theme_name)
     print("\n✓ Citations timeline plot generation complete")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Write compact, build-time variants of the JSON files the frontend loads.
+
+Reads: public/data/*.json (the pretty-printed files the scripts maintain)
+Writes: public/data/compact/<name>.min.json (+ .gz, and .br when brotli is installed)
+
+The pretty-printed files stay the source of truth for review and diffs.
+Each compact variant is minified and projected down to the fields the
+pages actually render (see PROJECTIONS), which shrinks both the build-time
+parse and the props serialized into client components such as
+PublicationFilters and PublicationStatistics. Precompressed gzip/brotli
+siblings let a static host serve them without compressing on the fly.
+
+src/lib/data-loader.ts reads the compact variant when it is at least as
+new as its source and falls back to the pretty file otherwise. The
+directory is a build artifact (gitignored); deploy.yaml regenerates it
+before `npm run build`.
+
+Usage:
+    python scripts/generate_compact_data.py
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from instrumentation import instrument_run, span
+from utils import get_public_data_dir, get_relative_path, write_bytes_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPACT_DIRNAME = "compact"
+
+# Fields read by publication-filters.tsx, publication-utils.ts and
+# scholarly-metadata.ts. ADS "properties" and the presentation-only
+# month/day/invited_url are never rendered.
+PUBLICATION_FIELDS = (
+    "bibcode", "title", "authors", "year", "journal", "publication_type",
+    "citations", "url", "invited", "keywords", "booktitle", "location",
+)
+
+# data-loader.ts joins only path/version; license and source are provenance notes
+PDF_FIELDS = ("path", "version")
+
+# publication-statistics.tsx, the category cards and the facet lookups
+# (src/lib/facet-cube.ts) read only these sections
+STATISTICS_SECTIONS = ("summary", "category_counts", "facet_cube")
+
+
+def project_records(fields: tuple) -> Callable[[Any], Any]:
+    """Projection keeping `fields` (in source order) of every record in a list."""
+    keep = frozenset(fields)
+
+    def project(records: list) -> list:
+        return [{k: v for k, v in record.items() if k in keep} for record in records]
+
+    return project
+
+
+def project_mapping_records(fields: tuple) -> Callable[[Any], Any]:
+    """Projection keeping `fields` of every value in a {key: record} mapping."""
+    keep = frozenset(fields)
+
+    def project(mapping: dict) -> dict:
+        return {key: {k: v for k, v in record.items() if k in keep}
+                for key, record in mapping.items()}
+
+    return project
+
+
+def project_sections(sections: tuple) -> Callable[[Any], Any]:
+    """Projection keeping the named top-level sections of an object."""
+    def project(data: dict) -> dict:
+        return {k: data[k] for k in sections if k in data}
+
+    return project
+
+
+# Every file the frontend reads through loadJSONData(). None = minify only.
+PROJECTIONS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    "ads_publications.json": project_records(PUBLICATION_FIELDS),
+    "non_ads_publications.json": project_records(PUBLICATION_FIELDS),
+    "invited_presentations.json": project_records(PUBLICATION_FIELDS),
+    "publication-pdfs.json": project_mapping_records(PDF_FIELDS),
+    "publication_statistics.json": project_sections(STATISTICS_SECTIONS),
+    "publications-categories.json": None,
+    "ben-page.json": None,
+    "biography-homepage.json": None,
+    "education.json": None,
+    "experience-page.json": None,
+    "honors.json": None,
+    "positions.json": None,
+}
+
+
+def compact_name(filename: str) -> str:
+    """'ads_publications.json' -> 'ads_publications.min.json'"""
+    return filename[:-len(".json")] + ".min.json"
+
+
+def encode_compact(data: Any) -> bytes:
+    """Minified UTF-8 JSON (no indentation, no spaces after separators)."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_variants(path: Path, payload: bytes) -> Dict[str, int]:
+    """
+    Write a compact file and its precompressed siblings.
+
+    An unchanged compact file is not rewritten, but its mtime is refreshed so
+    the loader's freshness check still prefers it over a newer source whose
+    change was projected away (e.g. a reshuffled ADS "properties" list).
+
+    Returns:
+        Byte sizes keyed by variant ("min", "gz", "br").
+    """
+    if not write_bytes_atomic(path, payload):
+        os.utime(path)
+    sizes = {"min": len(payload)}
+
+    # mtime=0 keeps the gzip header, and so the file, reproducible
+    gz = gzip.compress(payload, compresslevel=9, mtime=0)
+    write_bytes_atomic(path.with_name(path.name + ".gz"), gz)
+    sizes["gz"] = len(gz)
+
+    br_path = path.with_name(path.name + ".br")
+    if brotli is not None:
+        br = brotli.compress(payload, quality=11)
+        write_bytes_atomic(br_path, br)
+        sizes["br"] = len(br)
+    elif br_path.exists():
+        # Don't leave a brotli sibling that no longer matches the payload
+        br_path.unlink()
+
+    return sizes
+
+
+def generate_compact_data(data_dir: Path) -> Dict[str, Dict[str, int]]:
+    """
+    Write the compact variant of every file in PROJECTIONS that exists.
+
+    Returns:
+        Sizes per source file: {"pretty": ..., "min": ..., "gz": ..., "br": ...}
+    """
+    out_dir = data_dir / COMPACT_DIRNAME
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    report = {}
+    for filename, project in PROJECTIONS.items():
+        source = data_dir / filename
+        if not source.exists():
+            print(f"⚠️  Skipping {filename}: not found")
+            continue
+
+        with span(filename):
+            raw = source.read_bytes()
+            data = json.loads(raw)
+            if project is not None:
+                data = project(data)
+
+            sizes = write_variants(out_dir / compact_name(filename), encode_compact(data))
+        report[filename] = {"pretty": len(raw), **sizes}
+
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Write minified, field-projected JSON variants for the frontend."
+    )
+    parser.parse_args()
+    instrument_run()
+
+    data_dir = get_public_data_dir()
+    print(f"📦 Writing compact data variants to {get_relative_path(data_dir / COMPACT_DIRNAME)}")
+    if brotli is None:
+        print("   ℹ️  brotli not installed; writing gzip siblings only")
+
+    report = generate_compact_data(data_dir)
+
+    columns = ("pretty", "min", "gz", "br")
+    totals = {key: 0 for key in columns}
+
+    def row(label: str, sizes: Dict[str, int]) -> str:
+        cells = (f"{sizes[key]:,}" if sizes.get(key) else "-" for key in columns)
+        return f"{label:<32} " + " ".join(f"{cell:>9}" for cell in cells)
+
+    print(f"\n{'file':<32} " + " ".join(f"{key:>9}" for key in columns))
+    for filename, sizes in report.items():
+        for key in columns:
+            totals[key] += sizes.get(key, 0)
+        print(row(filename, sizes))
+    print(row("total", totals))
+
+    print(f"\n✓ {len(report)} compact files written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
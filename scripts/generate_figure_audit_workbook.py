@@ -14,23 +14,43 @@ Creates one sheet per paper with columns for:
 - notes: User comments (manual entry)
 
 Output: review-docs/figure-audit.xlsx
+
+Thumbnails are rasterized once per (PDF content, thumbnail size) into
+review-docs/.thumbnail-cache/ by a process pool. Re-running after a
+metadata-only change rebuilds the workbook from cached images without
+invoking poppler at all.
+
+Use --streaming for large corpora: the workbook is written in openpyxl
+write-only mode, flushing rows per sheet instead of holding every cell in
+memory (see scripts/benchmarks/bench_audit_workbook.py).
+
+Usage:
+    python scripts/generate_figure_audit_workbook.py [--jobs N] [--streaming]
 """
 
-import json
+import argparse
+import hashlib
+import inspect
+import os
+import re
 import sys
-import tempfile
-import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
 
 # Add parent dir to path for utils import
 sys.path.insert(0, str(Path(__file__).parent))
+from corpus import CorpusPaper, get_corpus_dir, load_corpus, load_json
+from instrumentation import instrument_run, phase, span
 from utils import get_repo_root, get_public_data_dir
 
 try:
+    import openpyxl
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
     from openpyxl.drawing.image import Image as XLImage
+    from openpyxl.writer.excel import ExcelWriter
 except ImportError:
     print("Error: openpyxl is required. Install with: conda install openpyxl")
     sys.exit(1)
@@ -47,10 +67,23 @@ except ImportError:
 THUMB_WIDTH = 150  # pixels
 THUMB_HEIGHT = 120  # pixels
 ROW_HEIGHT = 95  # Excel row height (points)
+HEADER_ROW_HEIGHT = 15  # Excel's default row height, which create_audit_workbook() leaves the header at
+
+# Persistent thumbnail cache (relative to repo root)
+THUMB_CACHE_DIR = Path("review-docs") / ".thumbnail-cache"
+
+
+def thumbnail_cache_key(pdf_path: Path) -> str:
+    """Cache key for a thumbnail: PDF content hash plus thumbnail size."""
+    digest = hashlib.sha256(pdf_path.read_bytes()).hexdigest()
+    return f"{digest}_{THUMB_WIDTH}x{THUMB_HEIGHT}"
 
 
-def create_thumbnail(pdf_path: Path, temp_dir: Path, paper_id: str) -> Path | None:
-    """Convert first page of PDF to thumbnail image."""
+def create_thumbnail(pdf_path: Path, thumb_path: Path) -> Path | None:
+    """Convert first page of PDF to a thumbnail image at thumb_path.
+
+    Runs in a worker process, so it must stay a top-level function.
+    """
     if not PDF_SUPPORT or not pdf_path.exists():
         return None
 
@@ -72,9 +105,11 @@ def create_thumbnail(pdf_path: Path, temp_dir: Path, paper_id: str) -> Path | No
         # Create thumbnail
         img.thumbnail((THUMB_WIDTH, THUMB_HEIGHT), Image.Resampling.LANCZOS)
 
-        # Save to temp file - include paper_id to avoid collisions
-        thumb_path = temp_dir / f"{paper_id}_{pdf_path.stem}_thumb.png"
-        img.save(thumb_path, "PNG")
+        # Write to a temp name then rename, so an interrupted run never
+        # leaves a truncated image in the cache
+        tmp_path = thumb_path.with_suffix(f".{os.getpid()}.tmp")
+        img.save(tmp_path, "PNG")
+        tmp_path.replace(thumb_path)
 
         return thumb_path
 
@@ -83,37 +118,40 @@ def create_thumbnail(pdf_path: Path, temp_dir: Path, paper_id: str) -> Path | No
         return None
 
 
-def load_corpus_data(repo_root: Path) -> dict:
-    """Load paper metadata from research-corpus."""
-    corpus_dir = repo_root / "research-corpus" / "papers"
-    papers = {}
+def build_thumbnail_cache(pdf_paths: list[Path], cache_dir: Path, jobs: int | None = None) -> dict[Path, Path]:
+    """
+    Ensure a cached thumbnail exists for every PDF, rasterizing misses in parallel.
+
+    Cache entries no longer referenced by any PDF are pruned.
 
-    for paper_dir in sorted(corpus_dir.iterdir()):
-        if not paper_dir.is_dir() or paper_dir.name.startswith('.'):
-            continue
+    Args:
+        pdf_paths: Figure PDFs that need thumbnails.
+        cache_dir: Directory holding cached PNG thumbnails.
+        jobs: Worker process count (defaults to CPU count).
 
-        metadata_file = paper_dir / "paper_metadata.json"
-        if not metadata_file.exists():
-            continue
+    Returns:
+        Mapping of PDF path -> cached thumbnail path (PDFs that failed
+        to rasterize are omitted).
+    """
+    if not PDF_SUPPORT:
+        return {}
 
-        with open(metadata_file, 'r') as f:
-            data = json.load(f)
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
-        paper_id = paper_dir.name
-        figures_dir = paper_dir / "figures"
+    wanted = {pdf: cache_dir / f"{thumbnail_cache_key(pdf)}.png" for pdf in pdf_paths}
+    missing = [(pdf, thumb) for pdf, thumb in wanted.items() if not thumb.exists()]
 
-        # Get list of actual PDF files
-        pdf_files = []
-        if figures_dir.exists():
-            pdf_files = sorted([f.name for f in figures_dir.glob("fig_*.pdf")])
+    print(f"  Thumbnails: {len(wanted) - len(missing)} cached, {len(missing)} to rasterize")
+    if missing:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(create_thumbnail, *zip(*missing)))
 
-        papers[paper_id] = {
-            "metadata": data,
-            "pdf_files": pdf_files,
-            "figures_dir": figures_dir
-        }
+    referenced = {thumb.name for thumb in wanted.values()}
+    for stale in cache_dir.glob("*.png"):
+        if stale.name not in referenced:
+            stale.unlink()
 
-    return papers
+    return {pdf: thumb for pdf, thumb in wanted.items() if thumb.exists()}
 
 
 def load_figure_registry(repo_root: Path) -> dict:
@@ -123,11 +161,8 @@ def load_figure_registry(repo_root: Path) -> dict:
     if not registry_file.exists():
         return {}
 
-    with open(registry_file, 'r') as f:
-        registry = json.load(f)
-
     # Registry is already indexed by "paper_id/figure_id"
-    return registry
+    return load_json(registry_file)
 
 
 def check_svg_exists(repo_root: Path, paper_id: str, figure_id: str) -> bool:
@@ -136,40 +171,122 @@ def check_svg_exists(repo_root: Path, paper_id: str, figure_id: str) -> bool:
     return svg_path.exists()
 
 
-def create_audit_workbook(papers: dict, registry: dict, repo_root: Path, temp_dir: Path) -> Workbook:
-    """Create Excel workbook with one sheet per paper."""
+# Column layout: (column letter, header, width). Thumbnail column first.
+HEADERS = [
+    ("A", "thumbnail", 22),  # ~150 pixels
+    ("B", "corpus_figure_id", 18),
+    ("C", "correct_figure_id", 18),
+    ("D", "pdf_exists", 10),
+    ("E", "svg_exists", 10),
+    ("F", "in_registry", 10),
+    ("G", "multi_panel", 10),
+    ("H", "panel_count", 10),
+    ("I", "technical_caption", 50),
+    ("J", "notes", 30)
+]
+
+# Columns that get YES/NO conditional fills
+STATUS_COLUMNS = {"D", "E", "F"}
+
+
+def make_styles() -> dict:
+    """Shared cell styles for both the in-memory and streaming writers."""
+    return {
+        "header_font": Font(bold=True, color="FFFFFF"),
+        "header_fill": PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        "issue_fill": PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+        "ok_fill": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+        "thin_border": Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        ),
+    }
+
+
+def sort_figure_id(fig_id: str) -> tuple:
+    """Sort fig_1, fig_2, ... fig_10, then non-standard names."""
+    match = re.match(r'fig_(\d+)$', fig_id)
+    if match:
+        return (0, int(match.group(1)), "")
+    # Non-standard names sort after standard ones
+    return (1, 0, fig_id)
+
+
+def iter_audit_rows(paper_id: str, paper: CorpusPaper, registry: dict, repo_root: Path, thumbnails: dict[Path, Path]):
+    """
+    Yield one audit row per figure of a paper.
+
+    Yields:
+        (values, thumb_path) where values holds the cell values for columns
+        A..J (column A is blank; the thumbnail is anchored there) and
+        thumb_path is the cached thumbnail or None.
+    """
+    # Get metadata figures
+    metadata_figures = {
+        fig["figure_id"]: fig
+        for fig in paper.figures
+    }
+
+    # Combine metadata figures and PDF files to catch mismatches
+    all_figure_ids = set(metadata_figures.keys())
+    for pdf_file in paper.pdf_files:
+        fig_id = pdf_file.replace(".pdf", "")
+        all_figure_ids.add(fig_id)
+
+    pdf_files = set(paper.pdf_files)
+
+    for fig_id in sorted(all_figure_ids, key=sort_figure_id):
+        fig_meta = metadata_figures.get(fig_id, {})
+        registry_id = f"{paper_id}/{fig_id}"
+
+        pdf_exists = f"{fig_id}.pdf" in pdf_files
+        svg_exists = check_svg_exists(repo_root, paper_id, fig_id)
+        in_registry = registry_id in registry
+
+        thumb_path = None
+        if pdf_exists:
+            thumb_path = thumbnails.get(paper.figures_dir / f"{fig_id}.pdf")
+
+        caption = fig_meta.get("technical_caption", "") or ""
+        values = [
+            None,
+            fig_id,
+            "",  # User fills in if correction needed
+            "YES" if pdf_exists else "NO",
+            "YES" if svg_exists else "NO",
+            "YES" if in_registry else "NO",
+            "YES" if fig_meta.get("multi_panel") else "NO" if fig_meta.get("multi_panel") is not None else "",
+            fig_meta.get("panel_count", ""),
+            caption[:300] + "..." if len(caption) > 300 else caption,
+            "",  # User notes
+        ]
+        yield values, thumb_path
+
+
+def make_thumbnail_image(thumb_path: Path, fig_id: str) -> "XLImage | None":
+    """Load a cached thumbnail as an openpyxl image sized for column A."""
+    try:
+        img = XLImage(str(thumb_path))
+        img.width = THUMB_WIDTH
+        img.height = THUMB_HEIGHT
+        return img
+    except Exception as e:
+        print(f"    Warning: Could not add image for {fig_id}: {e}")
+        return None
+
+
+def create_audit_workbook(papers: dict[str, CorpusPaper], registry: dict, repo_root: Path, thumbnails: dict[Path, Path]) -> Workbook:
+    """Create Excel workbook with one sheet per paper, using pre-built thumbnails."""
     wb = Workbook()
 
     # Remove default sheet
     default_sheet = wb.active
 
-    # Styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    issue_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-    ok_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-
-    # Headers with thumbnail column first
-    headers = [
-        ("A", "thumbnail", 22),  # ~150 pixels
-        ("B", "corpus_figure_id", 18),
-        ("C", "correct_figure_id", 18),
-        ("D", "pdf_exists", 10),
-        ("E", "svg_exists", 10),
-        ("F", "in_registry", 10),
-        ("G", "multi_panel", 10),
-        ("H", "panel_count", 10),
-        ("I", "technical_caption", 50),
-        ("J", "notes", 30)
-    ]
+    styles = make_styles()
 
-    for paper_id, paper_data in sorted(papers.items()):
+    for paper_id, paper in sorted(papers.items()):
         print(f"  Processing {paper_id}...")
 
         # Create sheet (truncate name if needed, Excel limit is 31 chars)
@@ -177,88 +294,37 @@ def create_audit_workbook(papers: dict, registry: dict, repo_root: Path, temp_di
         ws = wb.create_sheet(title=sheet_name)
 
         # Add headers
-        for col, header, width in headers:
+        for col, header, width in HEADERS:
             cell = ws[f"{col}1"]
             cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
+            cell.font = styles["header_font"]
+            cell.fill = styles["header_fill"]
             cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = thin_border
+            cell.border = styles["thin_border"]
             ws.column_dimensions[col].width = width
 
-        # Get metadata figures
-        metadata_figures = {
-            fig["figure_id"]: fig
-            for fig in paper_data["metadata"].get("figures", [])
-        }
-
-        # Combine metadata figures and PDF files to catch mismatches
-        all_figure_ids = set(metadata_figures.keys())
-        for pdf_file in paper_data["pdf_files"]:
-            fig_id = pdf_file.replace(".pdf", "")
-            all_figure_ids.add(fig_id)
-
-        def sort_key(fig_id: str) -> tuple:
-            """Sort fig_1, fig_2, ... fig_10, then non-standard names."""
-            import re
-            match = re.match(r'fig_(\d+)$', fig_id)
-            if match:
-                return (0, int(match.group(1)), "")
-            # Non-standard names sort after standard ones
-            return (1, 0, fig_id)
-
         row = 2
-        for fig_id in sorted(all_figure_ids, key=sort_key):
-            fig_meta = metadata_figures.get(fig_id, {})
-            registry_id = f"{paper_id}/{fig_id}"
-
-            pdf_exists = f"{fig_id}.pdf" in paper_data["pdf_files"]
-            svg_exists = check_svg_exists(repo_root, paper_id, fig_id)
-            in_registry = registry_id in registry
-
+        for values, thumb_path in iter_audit_rows(paper_id, paper, registry, repo_root, thumbnails):
             # Set row height to accommodate thumbnail
             ws.row_dimensions[row].height = ROW_HEIGHT
 
-            # Try to add thumbnail
-            if pdf_exists and PDF_SUPPORT:
-                pdf_path = paper_data["figures_dir"] / f"{fig_id}.pdf"
-                thumb_path = create_thumbnail(pdf_path, temp_dir, paper_id)
-                if thumb_path:
-                    try:
-                        img = XLImage(str(thumb_path))
-                        img.width = THUMB_WIDTH
-                        img.height = THUMB_HEIGHT
-                        # Anchor to cell
-                        ws.add_image(img, f"A{row}")
-                    except Exception as e:
-                        print(f"    Warning: Could not add image for {fig_id}: {e}")
-
-            # Write data
-            ws[f"B{row}"] = fig_id
-            ws[f"C{row}"] = ""  # User fills in if correction needed
-            ws[f"D{row}"] = "YES" if pdf_exists else "NO"
-            ws[f"E{row}"] = "YES" if svg_exists else "NO"
-            ws[f"F{row}"] = "YES" if in_registry else "NO"
-            ws[f"G{row}"] = "YES" if fig_meta.get("multi_panel") else "NO" if fig_meta.get("multi_panel") is not None else ""
-            ws[f"H{row}"] = fig_meta.get("panel_count", "")
-            caption = fig_meta.get("technical_caption", "") or ""
-            ws[f"I{row}"] = caption[:300] + "..." if len(caption) > 300 else caption
-            ws[f"J{row}"] = ""  # User notes
-
-            # Apply conditional formatting
-            for col in ["D", "E", "F"]:
+            if thumb_path:
+                img = make_thumbnail_image(thumb_path, values[1])
+                if img:
+                    # Anchor to cell
+                    ws.add_image(img, f"A{row}")
+
+            # Write data, then apply formatting
+            for (col, _, _), value in zip(HEADERS, values):
                 cell = ws[f"{col}{row}"]
-                if cell.value == "NO":
-                    cell.fill = issue_fill
+                if value is not None:
+                    cell.value = value
+                cell.border = styles["thin_border"]
+                if col in STATUS_COLUMNS:
+                    cell.fill = styles["issue_fill"] if value == "NO" else styles["ok_fill"]
+                    cell.alignment = Alignment(horizontal="center", vertical="center")
                 else:
-                    cell.fill = ok_fill
-                cell.border = thin_border
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-
-            # Apply borders and alignment to other cells
-            for col in ["A", "B", "C", "G", "H", "I", "J"]:
-                ws[f"{col}{row}"].border = thin_border
-                ws[f"{col}{row}"].alignment = Alignment(vertical="center", wrap_text=(col == "I"))
+                    cell.alignment = Alignment(vertical="center", wrap_text=(col == "I"))
 
             row += 1
 
@@ -272,34 +338,181 @@ def create_audit_workbook(papers: dict, registry: dict, repo_root: Path, temp_di
     return wb
 
 
+class _StreamingExcelWriter(ExcelWriter):
+    """ExcelWriter that releases each sheet's drawing anchors once written.
+
+    openpyxl keeps every anchor (and the picture frame built for it) alive
+    until the whole package is saved. The drawing XML is already in the
+    archive at this point and image bytes are re-read from img.ref later,
+    so the anchors can be dropped per sheet.
+
+    There is no public hook for this, so it overrides the private
+    ExcelWriter._write_drawing(). openpyxl is pinned to the 3.1 series in
+    requirements.txt, and check_streaming_support() fails before anything is
+    written if the hook is missing or changes shape.
+    """
+
+    def _write_drawing(self, drawing):
+        super()._write_drawing(drawing)
+        if getattr(drawing, "_id", None) is None:
+            raise RuntimeError(
+                f"openpyxl {openpyxl.__version__}: ExcelWriter._write_drawing() no longer "
+                "registers drawings; --streaming needs the 3.1 series (see requirements.txt)"
+            )
+        drawing.twoCellAnchor = []
+        drawing.oneCellAnchor = []
+        drawing.absoluteAnchor = []
+        for img in drawing.images:
+            img.anchor = None
+
+
+def check_streaming_support() -> None:
+    """Fail loudly if the openpyxl internals _StreamingExcelWriter relies on have changed."""
+    hook = getattr(ExcelWriter, "_write_drawing", None)
+    if hook is None or list(inspect.signature(hook).parameters) != ["self", "drawing"]:
+        raise RuntimeError(
+            f"openpyxl {openpyxl.__version__}: ExcelWriter._write_drawing(drawing) not found; "
+            "--streaming needs the 3.1 series (see requirements.txt)"
+        )
+
+
+def write_audit_workbook_streaming(
+    papers: dict[str, CorpusPaper],
+    registry: dict,
+    repo_root: Path,
+    thumbnails: dict[Path, Path],
+    output_path: Path,
+) -> None:
+    """
+    Write the audit workbook in openpyxl write-only mode.
+
+    Each sheet's rows are flushed to its temp file and the sheet is closed
+    as soon as the paper is done; thumbnails are referenced by path and
+    their drawing anchors released after the sheet's drawing is written.
+    Memory therefore stays flat as the corpus grows. Output matches
+    create_audit_workbook().
+    """
+    check_streaming_support()
+    wb = Workbook(write_only=True)
+    styles = make_styles()
+
+    def styled(ws, value, **style):
+        cell = WriteOnlyCell(ws, value=value)
+        for attr, val in style.items():
+            setattr(cell, attr, val)
+        return cell
+
+    for paper_id, paper in sorted(papers.items()):
+        print(f"  Processing {paper_id}...")
+        ws = wb.create_sheet(title=paper_id[:31])
+
+        # Dimensions and panes must be set before the first append. A
+        # sheet-level default row height replaces one RowDimension per data
+        # row; the header row keeps Excel's default height explicitly.
+        for col, _, width in HEADERS:
+            ws.column_dimensions[col].width = width
+        ws.freeze_panes = "B2"
+        ws.sheet_format.defaultRowHeight = ROW_HEIGHT
+        ws.sheet_format.customHeight = True
+        ws.row_dimensions[1].height = HEADER_ROW_HEIGHT
+
+        ws.append([
+            styled(
+                ws, header,
+                font=styles["header_font"],
+                fill=styles["header_fill"],
+                alignment=Alignment(horizontal="center", vertical="center"),
+                border=styles["thin_border"],
+            )
+            for _, header, _ in HEADERS
+        ])
+
+        row = 2
+        for values, thumb_path in iter_audit_rows(paper_id, paper, registry, repo_root, thumbnails):
+            if thumb_path:
+                img = make_thumbnail_image(thumb_path, values[1])
+                if img:
+                    ws.add_image(img, f"A{row}")
+
+            cells = []
+            for (col, _, _), value in zip(HEADERS, values):
+                if col in STATUS_COLUMNS:
+                    cells.append(styled(
+                        ws, value,
+                        border=styles["thin_border"],
+                        fill=styles["issue_fill"] if value == "NO" else styles["ok_fill"],
+                        alignment=Alignment(horizontal="center", vertical="center"),
+                    ))
+                else:
+                    cells.append(styled(
+                        ws, value,
+                        border=styles["thin_border"],
+                        alignment=Alignment(vertical="center", wrap_text=(col == "I")),
+                    ))
+            ws.append(cells)
+            row += 1
+
+        # Flush rows and release the sheet's XML writer now, not at save
+        ws.close()
+
+    output_path.parent.mkdir(exist_ok=True)
+    with ZipFile(output_path, "w", ZIP_DEFLATED, allowZip64=True) as archive:
+        _StreamingExcelWriter(wb, archive).save()
+
+
 def main():
     """Generate the figure audit workbook."""
+    parser = argparse.ArgumentParser(description="Generate the figure audit workbook.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for thumbnail rasterization (default: CPU count).",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Write in openpyxl write-only mode (flat memory for large corpora).",
+    )
+    args = parser.parse_args()
+
     repo_root = get_repo_root()
 
+    phase("load")
     print("Loading corpus data...")
-    papers = load_corpus_data(repo_root)
+    papers = load_corpus(get_corpus_dir())
     print(f"  Found {len(papers)} papers")
 
     print("Loading figure registry...")
     registry = load_figure_registry(repo_root)
     print(f"  Found {len(registry)} registered figures")
 
-    print("Creating audit workbook with thumbnails...")
-
-    # Create temp directory for thumbnails
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        wb = create_audit_workbook(papers, registry, repo_root, temp_path)
+    phase("thumbnails")
+    print("Building thumbnail cache...")
+    pdf_paths = [
+        paper.figures_dir / pdf_file
+        for paper in papers.values()
+        for pdf_file in paper.pdf_files
+    ]
+    thumbnails = build_thumbnail_cache(pdf_paths, repo_root / THUMB_CACHE_DIR, args.jobs)
 
-        output_path = repo_root / "review-docs" / "figure-audit.xlsx"
+    phase("workbook")
+    print("Creating audit workbook with thumbnails...")
+    output_path = repo_root / "review-docs" / "figure-audit.xlsx"
+    if args.streaming:
+        write_audit_workbook_streaming(papers, registry, repo_root, thumbnails, output_path)
+    else:
+        with span("build"):
+            wb = create_audit_workbook(papers, registry, repo_root, thumbnails)
         output_path.parent.mkdir(exist_ok=True)
-        wb.save(output_path)
+        with span("save"):
+            wb.save(output_path)
 
     print(f"\n{output_path}")
     print("\nWorkbook created with sheets:")
     for paper_id in sorted(papers.keys()):
-        fig_count = len(papers[paper_id]["pdf_files"])
-        meta_count = len(papers[paper_id]["metadata"].get("figures", []))
+        fig_count = len(papers[paper_id].pdf_files)
+        meta_count = len(papers[paper_id].figures)
         mismatch = " (MISMATCH)" if fig_count != meta_count else ""
         print(f"  - {paper_id}: {fig_count} PDFs, {meta_count} in metadata{mismatch}")
 
@@ -313,4 +526,5 @@ def main():
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
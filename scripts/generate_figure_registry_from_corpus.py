@@ -2,36 +2,48 @@
 """
 Generate figure-registry.json from the research-corpus submodule.
 
-This script reads paper_metadata.json from each paper in the corpus,
-extracts figure descriptions (summaries, keywords, technical captions),
+This script reads paper_metadata.json from each paper in the corpus
+(concurrently, see corpus.py), extracts figure descriptions (summaries, keywords, technical captions),
 and produces a centralized registry keyed by "paper_id/figure_id".
 
 The corpus figure_id is used directly as the registry key, matching
 the SVG filenames produced by convert-pdfs.yml. No ID translation needed.
 
+Alongside the monolithic figure-registry.json (kept for review tooling),
+a sharded copy is written to public/data/figure-registry/:
+
+    index.json              key -> paper_id, figure_id, src, short_title,
+                            width, height (small; safe to load everywhere)
+    papers/<paper_id>.json  full registry entries for one paper (summaries,
+                            keywords, technical captions)
+
+Pages that render a handful of figures load the index plus only the paper
+shards they reference instead of parsing every figure's text.
+
+Registry entries are Figure records (see records.py); they encode to the
+same JSON objects, in the same key order, as the dicts they replace.
+
 Usage:
     python scripts/generate_figure_registry_from_corpus.py [--dry-run]
+    python scripts/generate_figure_registry_from_corpus.py --shards-only
 """
 
-import json
+import re
+import struct
 import sys
 from collections import OrderedDict
 from pathlib import Path
 
+from corpus import CorpusPaper, load_corpus
+from instrumentation import instrument_run, phase
+from records import Figure, FigureSummary, encode_records, load_records, write_records
+from topic_index import update_topic_figure_index
 from utils import get_repo_root, get_public_data_dir
 
 
-def load_corpus_metadata(corpus_dir: Path) -> dict[str, dict]:
-    """Load paper_metadata.json from all papers in the corpus."""
-    papers = {}
-    for paper_dir in sorted(corpus_dir.glob("papers/*")):
-        meta_path = paper_dir / "paper_metadata.json"
-        if meta_path.exists():
-            with open(meta_path) as f:
-                data = json.load(f)
-            paper_id = data["paper"]["id"]
-            papers[paper_id] = data
-    return papers
+def load_corpus_metadata(corpus_dir: Path) -> dict[str, CorpusPaper]:
+    """Load all papers in the corpus, keyed by their metadata paper ID."""
+    return {paper.paper_id: paper for paper in load_corpus(corpus_dir).values()}
 
 
 def determine_extension(paper_id: str, figure_id: str, repo_root: Path) -> str:
@@ -42,52 +54,69 @@ def determine_extension(paper_id: str, figure_id: str, repo_root: Path) -> str:
     return "svg"
 
 
-def load_topic_refs(data_dir: Path) -> dict[str, dict]:
+def read_image_dimensions(image_path: Path) -> tuple[int, int] | None:
     """
-    Load topic JSONs and extract figure usage information.
+    Read the intrinsic (width, height) of an SVG or PNG figure.
 
-    Returns:
-        {ref_key: {"primary_in": [slugs], "related_in": [slugs]}}
+    SVGs use the root viewBox (falling back to numeric width/height
+    attributes); PNGs use the IHDR chunk. Returns None if the file is
+    missing or the size cannot be determined.
     """
-    topics_dir = data_dir / "research-topics"
-    usage = {}
-
-    for json_path in sorted(topics_dir.glob("*.json")):
-        with open(json_path) as f:
-            topic = json.load(f)
-
-        slug = topic["slug"]
-
-        # Primary figure (optional — some topics have no primary yet)
-        pf = topic.get("primary_figure")
-        if pf:
-            ref = pf["ref"]
-            if ref not in usage:
-                usage[ref] = {"primary_in": [], "related_in": []}
-            usage[ref]["primary_in"].append(slug)
+    if not image_path.exists():
+        return None
+
+    if image_path.suffix == ".png":
+        with open(image_path, "rb") as f:
+            header = f.read(24)
+        if header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+            return None
+        width, height = struct.unpack(">II", header[16:24])
+        return width, height
+
+    # The <svg> root element is always within the first few hundred bytes
+    with open(image_path, "rb") as f:
+        head = f.read(4096).decode("utf-8", errors="ignore")
+    root = re.search(r"<svg\b[^>]*>", head)
+    if not root:
+        return None
+    attrs = root.group(0)
+
+    view_box = re.search(r'viewBox="([^"]+)"', attrs)
+    if view_box:
+        parts = view_box.group(1).replace(",", " ").split()
+        if len(parts) == 4:
+            return round(float(parts[2])), round(float(parts[3]))
+
+    width = re.search(r'\bwidth="([\d.]+)', attrs)
+    height = re.search(r'\bheight="([\d.]+)', attrs)
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+    return None
+
+
+def load_topic_refs(data_dir: Path, write: bool = True) -> dict[str, dict]:
+    """
+    Load figure usage from the topic-figure index, refreshing it first.
 
-        # Related figures
-        for rf in topic.get("related_figures", []):
-            ref = rf["ref"]
-            if ref not in usage:
-                usage[ref] = {"primary_in": [], "related_in": []}
-            usage[ref]["related_in"].append(slug)
+    Only topic files changed since the last run are re-parsed (see
+    topic_index.py). With write=False the refreshed index is not persisted.
 
-    return usage
+    Returns:
+        {ref_key: {"paper_id": ..., "primary_in": [slugs], "related_in": [slugs]}}
+    """
+    return update_topic_figure_index(data_dir, write=write)["figures"]
 
 
 def generate_registry(
-    papers: dict[str, dict],
+    papers: dict[str, CorpusPaper],
     topic_usage: dict[str, dict],
     repo_root: Path,
-) -> OrderedDict:
+) -> dict[str, Figure]:
     """Generate the figure registry from corpus data."""
-    registry = OrderedDict()
+    registry = {}
 
     for paper_id in sorted(papers.keys()):
-        paper_data = papers[paper_id]
-
-        for fig in paper_data["figures"]:
+        for fig in papers[paper_id].figures:
             figure_id = fig["figure_id"]
             registry_key = f"{paper_id}/{figure_id}"
 
@@ -98,11 +127,11 @@ def generate_registry(
             # Extract summary fields
             summary_data = fig.get("summary")
             if summary_data and isinstance(summary_data, dict):
-                summary = {
-                    "what_we_see": summary_data.get("what_we_see", ""),
-                    "the_finding": summary_data.get("the_finding", ""),
-                    "why_it_matters": summary_data.get("why_it_matters", ""),
-                }
+                summary = FigureSummary(
+                    what_we_see=summary_data.get("what_we_see", ""),
+                    the_finding=summary_data.get("the_finding", ""),
+                    why_it_matters=summary_data.get("why_it_matters", ""),
+                )
             else:
                 summary = None
 
@@ -113,41 +142,101 @@ def generate_registry(
             short_title = fig.get("short_title", "")
 
             # Build alt text (use first sentence of what_we_see, or short_title)
-            if summary and summary["what_we_see"]:
-                first_sentence = summary["what_we_see"].split(". ")[0] + "."
+            if summary and summary.what_we_see:
+                first_sentence = summary.what_we_see.split(". ")[0] + "."
                 alt = first_sentence
             else:
                 alt = short_title
 
             # Build summary_short (first sentence of the_finding)
-            if summary and summary["the_finding"]:
-                summary_short = summary["the_finding"].split(". ")[0] + "."
+            if summary and summary.the_finding:
+                summary_short = summary.the_finding.split(". ")[0] + "."
             else:
                 summary_short = None
 
             # Get usage from topic refs
             usage = topic_usage.get(registry_key, {"primary_in": [], "related_in": []})
 
-            entry = OrderedDict([
-                ("paper_id", paper_id),
-                ("figure_id", figure_id),
-                ("src", src),
-                ("short_title", short_title),
-                ("alt", alt),
-                ("summary", summary),
-                ("summary_short", summary_short),
-                ("keywords", keywords),
-                ("technical_caption", fig.get("technical_caption", "")),
-                ("used_as_primary_in", usage["primary_in"]),
-                ("used_as_related_in", usage["related_in"]),
-            ])
-
-            registry[registry_key] = entry
+            registry[registry_key] = Figure(
+                paper_id=paper_id,
+                figure_id=figure_id,
+                src=src,
+                short_title=short_title,
+                alt=alt,
+                summary=summary,
+                summary_short=summary_short,
+                keywords=tuple(keywords),
+                technical_caption=fig.get("technical_caption", ""),
+                used_as_primary_in=tuple(usage["primary_in"]),
+                used_as_related_in=tuple(usage["related_in"]),
+            )
 
     return registry
 
 
-def verify_topic_refs(registry: OrderedDict, topic_usage: dict[str, dict]) -> list[str]:
+def as_figures(registry: dict) -> dict[str, Figure]:
+    """Registry entries as Figure records (callers may pass decoded dicts)."""
+    return {
+        key: entry if isinstance(entry, Figure) else Figure.from_dict(entry)
+        for key, entry in registry.items()
+    }
+
+
+def build_registry_index(registry: dict[str, Figure], repo_root: Path) -> OrderedDict:
+    """Build the lightweight key -> {src, short_title, dimensions} index."""
+    index = OrderedDict()
+    for key, entry in registry.items():
+        dims = read_image_dimensions(repo_root / "public" / entry.src.lstrip("/"))
+        index[key] = OrderedDict([
+            ("paper_id", entry.paper_id),
+            ("figure_id", entry.figure_id),
+            ("src", entry.src),
+            ("short_title", entry.short_title),
+            ("width", dims[0] if dims else None),
+            ("height", dims[1] if dims else None),
+        ])
+    return index
+
+
+def split_registry_shards(registry: dict[str, Figure]) -> OrderedDict:
+    """Group full registry entries into one shard per paper."""
+    shards: OrderedDict = OrderedDict()
+    for key, entry in registry.items():
+        shards.setdefault(entry.paper_id, OrderedDict())[key] = entry
+    return shards
+
+
+def write_sharded_registry(registry: dict, data_dir: Path, repo_root: Path) -> Path:
+    """
+    Write the registry index and per-paper shards under data_dir/figure-registry/.
+
+    Shards for papers no longer in the registry are removed so stale
+    figures cannot be resolved by the frontend. Entries may be Figure
+    records or registry dicts.
+
+    Returns:
+        Path to the shard directory.
+    """
+    shard_dir = data_dir / "figure-registry"
+    papers_dir = shard_dir / "papers"
+    papers_dir.mkdir(parents=True, exist_ok=True)
+
+    registry = as_figures(registry)
+    shards = split_registry_shards(registry)
+    for paper_id, entries in shards.items():
+        write_records(papers_dir / f"{paper_id}.json", entries, ensure_ascii=False, trailing_newline=True)
+
+    for stale in papers_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+
+    index = build_registry_index(registry, repo_root)
+    write_records(shard_dir / "index.json", index, ensure_ascii=False, trailing_newline=True)
+
+    return shard_dir
+
+
+def verify_topic_refs(registry: dict[str, Figure], topic_usage: dict[str, dict]) -> list[str]:
     """Verify that all topic JSON refs resolve against the registry."""
     errors = []
     for ref_key in topic_usage:
@@ -156,11 +245,11 @@ def verify_topic_refs(registry: OrderedDict, topic_usage: dict[str, dict]) -> li
     return errors
 
 
-def verify_src_paths(registry: OrderedDict, repo_root: Path) -> list[str]:
+def verify_src_paths(registry: dict[str, Figure], repo_root: Path) -> list[str]:
     """Verify that all src paths point to existing files."""
     errors = []
     for key, entry in registry.items():
-        src = entry["src"]
+        src = entry.src
         file_path = repo_root / "public" / src.lstrip("/")
         if not file_path.exists():
             errors.append(f"Missing file for '{key}': {src}")
@@ -175,18 +264,30 @@ def main():
     data_dir = get_public_data_dir()
     output_path = data_dir / "figure-registry.json"
 
+    if "--shards-only" in sys.argv:
+        # Re-shard the existing registry (e.g. after a hand edit or
+        # apply_figure_topic_mappings.py) without needing the corpus.
+        phase("shard")
+        registry = load_records(output_path, Figure)
+        shard_dir = write_sharded_registry(registry, data_dir, repo_root)
+        print(f"Wrote {len(registry)} entries as sharded registry to {shard_dir}")
+        return 0
+
+    phase("load")
     print("Loading corpus metadata...")
     papers = load_corpus_metadata(corpus_dir)
     print(f"  Found {len(papers)} papers")
 
     print("Loading topic JSON refs...")
-    topic_usage = load_topic_refs(data_dir)
+    topic_usage = load_topic_refs(data_dir, write=not dry_run)
     print(f"  Found {len(topic_usage)} unique figure refs across topics")
 
+    phase("generate")
     print("Generating registry...")
     registry = generate_registry(papers, topic_usage, repo_root)
     print(f"  Generated {len(registry)} registry entries")
 
+    phase("verify")
     # Verify all topic refs resolve
     ref_errors = verify_topic_refs(registry, topic_usage)
     if ref_errors:
@@ -206,27 +307,33 @@ def main():
             print(f"  ⚠ {err}")
 
     # Print summary
-    primary_count = sum(1 for e in registry.values() if e["used_as_primary_in"])
-    related_count = sum(1 for e in registry.values() if e["used_as_related_in"])
+    primary_count = sum(1 for e in registry.values() if e.used_as_primary_in)
+    related_count = sum(1 for e in registry.values() if e.used_as_related_in)
     print(f"\nRegistry summary:")
     print(f"  Total entries: {len(registry)}")
     print(f"  Used as primary: {primary_count}")
     print(f"  Used as related: {related_count}")
-    print(f"  Papers covered: {len(set(e['paper_id'] for e in registry.values()))}")
+    print(f"  Papers covered: {len(set(e.paper_id for e in registry.values()))}")
 
+    phase("write")
     if dry_run:
         print(f"\nDry run — would write to {output_path}")
         # Print first entry as sample
         first_key = next(iter(registry))
         print(f"\nSample entry ({first_key}):")
-        print(json.dumps(registry[first_key], indent=2)[:500])
+        print(encode_records(registry[first_key]).decode()[:500])
     else:
-        with open(output_path, "w") as f:
-            json.dump(registry, f, indent=2, ensure_ascii=False)
-        print(f"\nWrote registry to {output_path}")
+        if write_records(output_path, registry, ensure_ascii=False):
+            print(f"\nWrote registry to {output_path}")
+        else:
+            print(f"\nRegistry unchanged: {output_path}")
+
+        shard_dir = write_sharded_registry(registry, data_dir, repo_root)
+        print(f"Wrote sharded registry to {shard_dir}")
 
     return 0
 
 
 if __name__ == "__main__":
+    instrument_run()
     sys.exit(main())
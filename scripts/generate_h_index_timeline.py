@@ -3,21 +3,27 @@
 Generate h-index timeline plot from ADS metrics data.
 
 Reads h-index time series from ads_metrics.json and generates
-styled plot matching other timeline visualizations.
+styled plot matching other timeline visualizations. With --indicators local
+the series is computed from the per-paper citation snapshot instead
+(see citation_indicators.py), so it can be refreshed without a bulk
+metrics request.
 
 Usage:
-    python scripts/generate_h_index_timeline.py
+    python scripts/generate_h_index_timeline.py [--indicators local]
 """
 
+import argparse
 import json
 import matplotlib.pyplot as plt
 from pathlib import Path
 from utils import get_repo_root, get_public_data_dir, get_public_plots_dir, get_relative_path
+from instrumentation import instrument_run, span
+from citation_indicators import local_indicators_or_ads
 from plot_config import COLORS, FIGURE, FONTS, LINES, GRID, AXES, LAYOUT, OUTPUT, THEMES, get_theme_config, get_data_colors
 
 
-def load_h_index_data():
-    """Load h-index time series from ads_metrics.json."""
+def load_h_index_data(indicators='ads'):
+    """Load h-index time series from ads_metrics.json (or computed locally)."""
     data_file = get_public_data_dir() / "ads_metrics.json"
 
     if not data_file.exists():
@@ -30,6 +36,9 @@ def load_h_index_data():
 
     with open(data_file, 'r') as f:
         metrics = json.load(f)
+    if indicators == 'local':
+        print("   Computing h-index time series from per-paper citations")
+        metrics = local_indicators_or_ads(metrics)
 
     h_index_series = metrics.get("time series", {}).get("h", {})
 
@@ -61,13 +70,13 @@ def load_h_index_data():
     return years, h_values
 
 
-def generate_h_index_plot(theme_name='light'):
+def generate_h_index_plot(theme_name='light', indicators='ads'):
     """Generate and save h-index timeline plot."""
     theme = get_theme_config(theme_name)
     data_colors = get_data_colors(theme_name)
     suffix = '' if theme_name == 'light' else f'_{theme_name}'
 
-    years, h_values = load_h_index_data()
+    years, h_values = load_h_index_data(indicators)
 
     # Create figure with configured settings
     fig, ax = plt.subplots(figsize=FIGURE['figsize'], dpi=FIGURE['dpi'])
@@ -128,25 +137,34 @@ def generate_h_index_plot(theme_name='light'):
     plots_dir = get_public_plots_dir()
 
     plot_path_svg = plots_dir / f"h_index_timeline{suffix}.svg"
-    plt.savefig(plot_path_svg,
-                format='svg',
-                dpi=OUTPUT['svg_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="svg"):
+        plt.savefig(plot_path_svg,
+                    format='svg',
+                    dpi=OUTPUT['svg_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_svg)}")
 
     plot_path_png = plots_dir / f"h_index_timeline{suffix}.png"
-    plt.savefig(plot_path_png,
-                format='png',
-                dpi=OUTPUT['png_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="png"):
+        plt.savefig(plot_path_png,
+                    format='png',
+                    dpi=OUTPUT['png_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_png)}")
 
     plt.close()
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate the h-index timeline plot.")
+    parser.add_argument('--indicators', choices=['ads', 'local'], default='ads',
+                        help="Take the h-index series from ads_metrics.json or compute it from citations_by_paper.json")
+    args = parser.parse_args()
+
+    instrument_run()
     for theme_name in THEMES:
-        generate_h_index_plot(theme_name)
+        with span("plot", theme=theme_name):
+            generate_h_index_plot(theme_name, args.indicators)
     print("\n✓ H-index timeline generation complete")
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Build the inverted index used to search and filter the publications pages.
+
+Reads: public/data/ads_publications.json, non_ads_publications.json,
+       invited_presentations.json
+Writes: public/data/publication-search-index.json
+
+The publications pages filter the merged ADS, non-ADS and invited list on
+the client. Instead of scanning every title, author list and venue per
+keystroke, the page slices this index down to its own publications
+(src/lib/publication-search.ts) and answers searches and facet filters
+with set intersections:
+
+    {
+      "version": 2,
+      "analyzer": {"min_length": 2, "min_stem": 3, "stopwords": [...], "stem_rules": [[suffix, replacement], ...]},
+      "docs": [doc_key, ...],                          # doc id = position
+      "terms": {"title" | "author" | "venue": {stem: [doc ids]}},
+      "facets": {"year" | "type" | "journal" | "invited" | "first_author": {value: bitmap}}
+    }
+
+Doc keys are the bibcode, or "<source>#<position>" for entries without one
+(invited presentations), e.g. "invited_presentations#3": the same talk given
+at two venues has the same title and year but is two docs. Posting lists are sorted doc ids; facet bitmaps
+are base64 bit arrays with bit i (little-endian within each byte) set for
+doc i. The analyzer settings travel with the index so the TypeScript query
+side tokenizes and stems exactly as this script did.
+
+Like the compact variants, the index is a build artifact (gitignored) that
+deploy.yaml regenerates before `npm run build`. A missing or stale index
+makes the pages fall back to the linear filters.
+
+Usage:
+    python scripts/generate_publication_search_index.py
+"""
+
+import argparse
+import base64
+import html
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from generate_compact_data import encode_compact
+from instrumentation import instrument_run, span
+from utils import get_public_data_dir, get_relative_path, write_bytes_atomic
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "publication-search-index.json"
+
+SOURCE_FILES = [
+    "ads_publications.json",
+    "non_ads_publications.json",
+    "invited_presentations.json",
+]
+
+# Entry fields the venue terms are built from
+VENUE_FIELDS = ("journal", "booktitle", "location")
+
+# Every entry field the index reads (pipeline.py skips the stage when only others change)
+PUBLICATION_FIELDS = (
+    "bibcode", "title", "authors", *VENUE_FIELDS, "year", "publication_type", "invited",
+)
+
+# Tokens shorter than this (initials, "a") are not indexed
+MIN_TOKEN_LENGTH = 2
+
+STOPWORDS = sorted({
+    "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into",
+    "is", "it", "of", "on", "or", "the", "to", "via", "with",
+})
+
+# Light suffix stripping, first matching rule wins. Identity rules guard
+# endings ("ss", "us", "is") that the plural "s" rule would otherwise eat.
+STEM_RULES = [
+    ("sses", "ss"),
+    ("ies", "y"),
+    ("ations", "ate"),
+    ("ation", "ate"),
+    ("ness", ""),
+    ("ing", ""),
+    ("ed", ""),
+    ("ss", "ss"),
+    ("us", "us"),
+    ("is", "is"),
+    ("s", ""),
+]
+MIN_STEM_LENGTH = 3
+
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def stem(token: str) -> str:
+    """Strip one suffix per STEM_RULES, keeping at least MIN_STEM_LENGTH characters."""
+    if token.isdigit():
+        return token
+    for suffix, replacement in STEM_RULES:
+        if token.endswith(suffix):
+            stemmed = token[:len(token) - len(suffix)] + replacement
+            return stemmed if len(stemmed) >= MIN_STEM_LENGTH else token
+    return token
+
+
+def analyze(text: str) -> List[str]:
+    """
+    Tokenize and stem text the way publication-search.ts analyzes queries.
+
+    Example:
+        'Helium Abundances in the Solar Wind' -> ['helium', 'abundance', 'solar', 'wind']
+    """
+    text = unicodedata.normalize("NFKD", html.unescape(text or ""))
+    text = _COMBINING.sub("", text).lower()
+    stopwords = frozenset(STOPWORDS)
+    return [
+        stem(token) for token in _TOKEN.findall(text)
+        if len(token) >= MIN_TOKEN_LENGTH and token not in stopwords
+    ]
+
+
+def doc_key(pub: Dict[str, Any], source: str, position: int) -> str:
+    """
+    Stable key matching publicationSearchKey() in publication-search.ts.
+
+    Args:
+        pub: The entry.
+        source: Stem of the file it comes from ("invited_presentations").
+        position: Its index in that file.
+    """
+    return pub.get("bibcode") or f"{source}#{position}"
+
+
+def is_first_author(pub: Dict[str, Any]) -> bool:
+    """Same test as isFirstAuthor() in publication-utils.ts."""
+    authors = pub.get("authors") or []
+    return bool(authors) and "alterman" in authors[0].lower()
+
+
+def encode_bitmap(doc_ids: Iterable[int], size: int) -> str:
+    """Base64 bit array of `size` bits with the given doc ids set."""
+    bits = bytearray((size + 7) // 8)
+    for i in doc_ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(bits)).decode("ascii")
+
+
+def load_publications(data_dir: Path) -> List[Tuple[str, Dict[str, Any]]]:
+    """The merged list the publications pages draw from, in loader order, as (doc key, entry)."""
+    publications = []
+    for filename in SOURCE_FILES:
+        path = data_dir / filename
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                source = Path(filename).stem
+                publications.extend(
+                    (doc_key(pub, source, position), pub) for position, pub in enumerate(json.load(f))
+                )
+        else:
+            print(f"⚠️  {filename} not found, skipping")
+    return publications
+
+
+def build_search_index(publications: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Build the inverted index and facet bitmaps for (doc key, publication) pairs."""
+    docs: List[str] = []
+    seen = set()
+    terms: Dict[str, Dict[str, List[int]]] = {"title": {}, "author": {}, "venue": {}}
+    facets: Dict[str, Dict[str, List[int]]] = {
+        "year": {}, "type": {}, "journal": {}, "invited": {}, "first_author": {},
+    }
+
+    for key, pub in publications:
+        if key in seen:
+            # Same publication listed twice (e.g. ADS and invited); first wins
+            continue
+        seen.add(key)
+        doc_id = len(docs)
+        docs.append(key)
+
+        fields = {
+            "title": pub.get("title", ""),
+            "author": " ".join(pub.get("authors") or []),
+            "venue": " ".join(pub.get(k) or "" for k in VENUE_FIELDS),
+        }
+        for field, text in fields.items():
+            postings = terms[field]
+            for term in dict.fromkeys(analyze(text)):
+                postings.setdefault(term, []).append(doc_id)
+
+        for facet, value in (
+            ("year", str(pub.get("year", ""))[:4]),
+            ("type", pub.get("publication_type", "")),
+            ("journal", pub.get("journal", "")),
+            ("invited", "true" if pub.get("invited") else "false"),
+            ("first_author", "true" if is_first_author(pub) else "false"),
+        ):
+            facets[facet].setdefault(value, []).append(doc_id)
+
+    return {
+        "version": INDEX_VERSION,
+        "analyzer": {
+            "min_length": MIN_TOKEN_LENGTH,
+            "min_stem": MIN_STEM_LENGTH,
+            "stopwords": STOPWORDS,
+            "stem_rules": [list(rule) for rule in STEM_RULES],
+        },
+        "docs": docs,
+        "terms": {field: dict(sorted(postings.items())) for field, postings in terms.items()},
+        "facets": {
+            facet: {value: encode_bitmap(ids, len(docs)) for value, ids in sorted(values.items())}
+            for facet, values in facets.items()
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the publication search index.")
+    parser.parse_args()
+    instrument_run()
+
+    data_dir = get_public_data_dir()
+    with span("load"):
+        publications = load_publications(data_dir)
+    print(f"📖 Indexing {len(publications)} publications")
+
+    with span("build", publications=len(publications)):
+        index = build_search_index(publications)
+    output_path = data_dir / INDEX_FILENAME
+    with span("write"):
+        write_bytes_atomic(output_path, encode_compact(index))
+
+    vocabulary = sum(len(postings) for postings in index["terms"].values())
+    print(f"   {len(index['docs'])} docs, {vocabulary} terms, "
+          f"{sum(len(v) for v in index['facets'].values())} facet values")
+    print(f"✓ Search index written to {get_relative_path(output_path)} "
+          f"({output_path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,9 @@
 Generate integrated publication statistics file.
 
 Merges ads_metrics.json, invited_presentations.json, and invited_conferences.json
-into a single comprehensive statistics file.
+into a single comprehensive statistics file. With --indicators local, h/g/i10/i100/m
+and their time series are computed from citations_by_paper.json instead
+(see citation_indicators.py).
 
 Output: /public/data/publication_statistics.json
 
@@ -11,10 +13,14 @@ Author: Claude
 Date: 2025-12-26
 """
 
+import argparse
 import json
+from math import prod
 from pathlib import Path
-from collections import defaultdict
-from utils import get_public_data_dir
+from collections import Counter, defaultdict
+from instrumentation import instrument_run, phase
+from citation_indicators import local_indicators_or_ads
+from utils import get_public_data_dir, write_json_atomic
 
 
 def load_json(filepath):
@@ -98,6 +104,55 @@ def compute_category_counts(ads_pubs, invited_pres, invited_conf):
     }
 
 
+FACET_DIMENSIONS = ('type', 'year', 'invited', 'refereed')
+
+
+def publication_facets(pub):
+    """Facet values of one publication, in FACET_DIMENSIONS order."""
+    return (
+        pub.get('publication_type', ''),
+        str(pub.get('year', ''))[:4],
+        bool(pub.get('invited')),
+        'REFEREED' in pub.get('properties', []),
+    )
+
+
+def compute_facet_cube(publications):
+    """
+    Count publications for every type x year x invited x refereed combination.
+
+    The cube is dense: one dictionary of sorted values per dimension and a
+    flat, row-major list of counts (last dimension varies fastest), so the
+    cell for value indices (t, y, i, r) is counts[((t*Y + y)*2 + i)*2 + r].
+    src/lib/facet-cube.ts sums cells for any filter combination instead of
+    recounting publications.
+    """
+    cells = Counter(publication_facets(pub) for pub in publications)
+
+    values = {
+        dim: sorted({key[axis] for key in cells})
+        for axis, dim in enumerate(FACET_DIMENSIONS)
+    }
+    values['invited'] = [False, True]
+    values['refereed'] = [False, True]
+
+    positions = [{v: i for i, v in enumerate(values[dim])} for dim in FACET_DIMENSIONS]
+    shape = [len(values[dim]) for dim in FACET_DIMENSIONS]
+
+    counts = [0] * prod(shape)
+    for key, count in cells.items():
+        index = 0
+        for axis, value in enumerate(key):
+            index = index * shape[axis] + positions[axis][value]
+        counts[index] = count
+
+    return {
+        'dimensions': list(FACET_DIMENSIONS),
+        'values': values,
+        'counts': counts,
+    }
+
+
 def merge_publications_by_year(ads_pubs_by_year, invited_by_year):
     """Merge ADS publications and invited presentations by year."""
     all_years = set(ads_pubs_by_year.keys()) | set(invited_by_year.keys())
@@ -111,14 +166,22 @@ def merge_publications_by_year(ads_pubs_by_year, invited_by_year):
     return merged
 
 
-def main():
+def main(indicators='ads'):
     """Generate integrated publication statistics file."""
     data_dir = get_public_data_dir()
 
+    phase("load")
     print("Loading source files...")
 
     # Load source files
     ads_metrics = load_json(data_dir / 'ads_metrics.json')
+    if indicators == 'local':
+        local_metrics = local_indicators_or_ads(ads_metrics, data_dir)
+        if local_metrics is ads_metrics:
+            indicators = 'ads'
+        else:
+            ads_metrics = local_metrics
+            print("  Indicators: computed from per-paper citations")
     ads_pubs = load_json(data_dir / 'ads_publications.json')
     non_ads_pubs_path = data_dir / 'non_ads_publications.json'
     if non_ads_pubs_path.exists():
@@ -134,6 +197,7 @@ def main():
     print(f"  Invited conferences: {len(invited_conf)}")
 
     # Compute invited breakdown
+    phase("compute")
     invited_breakdown = compute_invited_breakdown(invited_pres, invited_conf)
 
     # Build integrated statistics
@@ -191,20 +255,31 @@ def main():
             'normalized_refereed': ads_metrics['histograms']['downloads']['refereed downloads normalized'],
         },
 
-        'category_counts': compute_category_counts(ads_pubs, invited_pres, invited_conf)
+        'category_counts': compute_category_counts(ads_pubs, invited_pres, invited_conf),
+
+        # Same publication set as the publications pages and timeline plot
+        'facet_cube': compute_facet_cube(ads_pubs + invited_pres),
     }
 
     # Write output
+    phase("write")
     output_file = data_dir / 'publication_statistics.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    write_json_atomic(output_file, stats, ensure_ascii=False)
 
     print(f"\n✓ Generated {output_file.name}")
     print(f"  Total papers: {stats['summary']['total_papers']}")
-    print(f"  h-index: {stats['summary']['h_index']} (from ADS only - correct!)")
+    source = "local, from ADS per-paper citations" if indicators == 'local' else "from ADS only - correct!"
+    print(f"  h-index: {stats['summary']['h_index']} ({source})")
     print(f"  Total citations: {stats['summary']['total_citations']}")
+    print(f"  Facet cube: {' x '.join(str(len(v)) for v in stats['facet_cube']['values'].values())} cells")
     print(f"  Invited talks: {stats['summary']['invited_total']} ({stats['summary']['invited_conferences']} conferences + {stats['summary']['invited_presentations']} presentations)")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate integrated publication statistics.")
+    parser.add_argument('--indicators', choices=['ads', 'local'], default='ads',
+                        help="Take h/g/i10/i100/m from ads_metrics.json or compute them from citations_by_paper.json")
+    args = parser.parse_args()
+
+    instrument_run()
+    main(args.indicators)
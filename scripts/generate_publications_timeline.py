@@ -21,10 +21,14 @@ import json
 import matplotlib.pyplot as plt
 import pandas as pd
 from pathlib import Path
-from utils import get_public_data_dir, get_public_plots_dir, get_relative_path
+from utils import get_public_data_dir, get_public_plots_dir, get_relative_path, write_json_atomic
+from instrumentation import instrument_run, phase, span
 from plot_config import COLORS, FIGURE, FONTS, LINES, GRID, LEGEND, LAYOUT, OUTPUT, THEMES, get_theme_config, get_data_colors
 
+instrument_run()
+
 # === SECTION 1: Load Publications Data ===
+phase("load")
 public_data_dir = get_public_data_dir()
 ads_file = public_data_dir / "ads_publications.json"
 invited_file = public_data_dir / "invited_presentations.json"
@@ -64,6 +68,7 @@ else:
     print(f"   No invited presentations file found, using ADS only")
 
 # === SECTION 2: Data Processing ===
+phase("transform")
 # Convert to DataFrame
 df = pd.DataFrame(publications)
 
@@ -122,6 +127,7 @@ print(f"  • Conference Contributions: {cum_conferences[-1]}")
 print(f"  • Other Publications: {cum_other[-1]}")
 
 # === SECTION 3: Save JSON Data ===
+phase("write")
 output_filename = "publications_timeline.json"
 output_path = public_data_dir / output_filename
 
@@ -132,8 +138,7 @@ data_to_save = {
     "other_publications": other
 }
 
-with open(output_path, 'w') as f:
-    json.dump(data_to_save, f, indent=2)
+write_json_atomic(output_path, data_to_save)
 
 print(f"\n💾 Data saved to {get_relative_path(output_path)}")
 
@@ -209,25 +214,29 @@ def generate_plot(theme_name='light'):
 
     # Save plots
     plot_path_svg = image_output_dir / f"publications_timeline{suffix}.svg"
-    plt.savefig(plot_path_svg,
-                format='svg',
-                dpi=OUTPUT['svg_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="svg"):
+        plt.savefig(plot_path_svg,
+                    format='svg',
+                    dpi=OUTPUT['svg_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_svg)}")
 
     plot_path_png = image_output_dir / f"publications_timeline{suffix}.png"
-    plt.savefig(plot_path_png,
-                format='png',
-                dpi=OUTPUT['png_dpi'],
-                bbox_inches=OUTPUT['bbox_inches'],
-                transparent=(theme_name == 'dark'))
+    with span("savefig", format="png"):
+        plt.savefig(plot_path_png,
+                    format='png',
+                    dpi=OUTPUT['png_dpi'],
+                    bbox_inches=OUTPUT['bbox_inches'],
+                    transparent=(theme_name == 'dark'))
     print(f"📈 Plot saved to {get_relative_path(plot_path_png)}")
 
     plt.close()
 
 
+phase("plots")
 for theme_name in THEMES:
-    generate_plot(theme_name)
+    with span("plot", theme=theme_name):
+        generate_plot(theme_name)
 
 print("\n✓ Publications timeline generation complete")
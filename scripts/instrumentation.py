@@ -0,0 +1,239 @@
+"""
+Timing, memory and profiling instrumentation shared by the data scripts.
+
+A script calls instrument_run() once at startup and wraps its stages in spans:
+
+    from instrumentation import instrument_run, span
+
+    instrument_run("generate_publication_statistics")
+    with span("load"):
+        ...
+    with span("write"):
+        ...
+
+Flat, top-to-bottom scripts can mark their sections with phase("name")
+instead, which closes the previous phase and opens the next.
+
+At exit the run writes a JSON report to timing-reports/<script>.json at the
+repository root (override the directory with PIPELINE_TIMING_DIR) with wall
+and CPU time plus the peak-RSS high-water mark for the run and for every span.
+Run wall time starts at instrument_run(); CPU time covers the whole process,
+imports included.
+
+Set PIPELINE_PROFILE=cprofile (or pyinstrument, if installed) to also capture
+a profile of the whole run next to the report.
+"""
+import atexit
+import cProfile
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils import get_relative_path, get_repo_root, write_json_atomic
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+TIMING_DIR_ENV = "PIPELINE_TIMING_DIR"
+PROFILE_ENV = "PIPELINE_PROFILE"
+REPORT_VERSION = 1
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / scale, 1)
+
+
+def get_timing_dir() -> Path:
+    """Directory timing reports and profiles are written to."""
+    override = os.getenv(TIMING_DIR_ENV)
+    return Path(override) if override else get_repo_root() / "timing-reports"
+
+
+class _Run:
+    """Spans recorded for one script invocation."""
+
+    def __init__(self, script: str, profile: Optional[str]):
+        self.script = script
+        self.started = datetime.now(timezone.utc)
+        self.wall_start = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.open_phase: Optional[Any] = None
+        self.profiler = None
+        self.profile_kind = None
+        self.error: Optional[str] = None
+
+        if profile == "pyinstrument" and pyinstrument is None:
+            print("⚠️  pyinstrument not installed; falling back to cProfile")
+            profile = "cprofile"
+        if profile == "cprofile":
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+            self.profile_kind = profile
+        elif profile == "pyinstrument":
+            self.profiler = pyinstrument.Profiler()
+            self.profiler.start()
+            self.profile_kind = profile
+        elif profile:
+            print(f"⚠️  Unknown {PROFILE_ENV}={profile!r}; expected 'cprofile' or 'pyinstrument'")
+
+    def stack(self) -> List[str]:
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        stack = self.stack()
+        record: Dict[str, Any] = {
+            "name": name,
+            "path": "/".join(stack + [name]),
+            "depth": len(stack),
+            "start_seconds": round(time.perf_counter() - self.wall_start, 4),
+        }
+        if threading.current_thread() is not threading.main_thread():
+            record["thread"] = threading.current_thread().name
+        record.update(attrs)
+
+        rss_before = peak_rss_mb()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        stack.append(name)
+        try:
+            yield record
+        except BaseException as exc:
+            record["error"] = type(exc).__name__
+            raise
+        finally:
+            stack.pop()
+            record["wall_seconds"] = round(time.perf_counter() - wall, 4)
+            record["cpu_seconds"] = round(time.thread_time() - cpu, 4)
+            record["peak_rss_mb"] = peak_rss_mb()
+            if rss_before is not None:
+                record["peak_rss_growth_mb"] = round(record["peak_rss_mb"] - rss_before, 1)
+            with self.lock:
+                self.spans.append(record)
+
+    def phase(self, name: str) -> None:
+        self.end_phase()
+        self.open_phase = self.span(name)
+        self.open_phase.__enter__()
+
+    def end_phase(self) -> None:
+        if self.open_phase is not None:
+            phase, self.open_phase = self.open_phase, None
+            phase.__exit__(None, None, None)
+
+    def stop_profiler(self, timing_dir: Path) -> Optional[Path]:
+        if self.profiler is None:
+            return None
+        if self.profile_kind == "cprofile":
+            self.profiler.disable()
+            path = timing_dir / f"{self.script}.prof"
+            self.profiler.dump_stats(str(path))
+        else:
+            self.profiler.stop()
+            path = timing_dir / f"{self.script}.profile.html"
+            path.write_text(self.profiler.output_html())
+        return path
+
+    def report(self, profile_path: Optional[Path]) -> Dict[str, Any]:
+        return {
+            "version": REPORT_VERSION,
+            "script": self.script,
+            "started": self.started.isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "wall_seconds": round(time.perf_counter() - self.wall_start, 4),
+            # Process CPU time since startup, so it includes import cost
+            "cpu_seconds": round(time.process_time(), 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "error": self.error,
+            "profile": str(get_relative_path(profile_path)) if profile_path else None,
+            "spans": sorted(self.spans, key=lambda s: (s["start_seconds"], s["depth"])),
+        }
+
+    def finish(self) -> None:
+        self.end_phase()
+        timing_dir = get_timing_dir()
+        timing_dir.mkdir(parents=True, exist_ok=True)
+        profile_path = self.stop_profiler(timing_dir)
+        report = self.report(profile_path)
+        report_path = timing_dir / f"{self.script}.json"
+        write_json_atomic(report_path, report, trailing_newline=True)
+
+        peak = report["peak_rss_mb"]
+        memory = f", peak RSS {peak:.0f} MiB" if peak is not None else ""
+        print(f"⏱️  {report['wall_seconds']:.2f}s{memory} — timing report {get_relative_path(report_path)}")
+        if profile_path:
+            print(f"   Profile saved to {get_relative_path(profile_path)}")
+
+
+_run: Optional[_Run] = None
+
+
+def instrument_run(script: Optional[str] = None) -> None:
+    """
+    Start recording this script's run; the report is written at interpreter exit.
+
+    Args:
+        script: Report name; defaults to the running script's file stem.
+    """
+    global _run
+    if _run is not None:
+        return
+    name = script or Path(sys.argv[0]).stem or "interactive"
+    _run = _Run(name, os.getenv(PROFILE_ENV, "").strip().lower() or None)
+    atexit.register(_run.finish)
+
+    # Uncaught exceptions skip the spans' normal exit; note them in the report
+    previous_hook = sys.excepthook
+
+    def record_error(exc_type, exc, tb):
+        _run.error = exc_type.__name__
+        previous_hook(exc_type, exc, tb)
+
+    sys.excepthook = record_error
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block of work as a (possibly nested) span.
+
+    Extra keyword arguments are stored on the span, and the yielded dict can
+    be updated inside the block (e.g. with item counts). A no-op recorder is
+    used when instrument_run() has not been called, so library code can
+    carry spans unconditionally.
+    """
+    if _run is None:
+        yield dict(attrs)
+        return
+    with _run.span(name, **attrs) as record:
+        yield record
+
+
+def phase(name: str) -> None:
+    """Close the current top-level phase (if any) and start a new one."""
+    if _run is not None:
+        _run.phase(name)
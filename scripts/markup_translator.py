@@ -0,0 +1,126 @@
+"""
+Single-pass markup translation for publication titles and BibTeX fields.
+
+Each translator compiles its rules into one regex alternation and rewrites
+a string in a single scan, instead of chaining several re.sub passes.
+Super/subscripts map through str.translate tables rather than per-character
+dict lookups, and warnings are printed after the scan, not from inside it.
+Results are memoized, since the same titles, venues and author names recur
+across fetches and imports.
+
+- html_to_unicode(): ADS titles. <SUP>/<sub> become Unicode super/subscripts
+  (via str.translate), <i> tags are dropped.
+- strip_latex(): BibTeX fields. LaTeX formatting macros, braces, ~ and escapes
+  are removed while the text content is kept.
+
+html_to_unicode.convert_html_to_unicode() and
+add_non_ads_publication.strip_latex_formatting() delegate here.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+SUPERSCRIPT_MAP = {
+    '0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+    '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
+    '+': '⁺', '-': '⁻', '=': '⁼', '(': '⁽', ')': '⁾',
+    'n': 'ⁿ', 'i': 'ⁱ'
+}
+
+SUBSCRIPT_MAP = {
+    '0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
+    '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉',
+    '+': '₊', '-': '₋', '=': '₌', '(': '₍', ')': '₎',
+    'a': 'ₐ', 'e': 'ₑ', 'o': 'ₒ', 'x': 'ₓ', 'h': 'ₕ',
+    'k': 'ₖ', 'l': 'ₗ', 'm': 'ₘ', 'n': 'ₙ', 'p': 'ₚ',
+    's': 'ₛ', 't': 'ₜ'
+}
+
+SUPERSCRIPT_TABLE = str.maketrans(SUPERSCRIPT_MAP)
+SUBSCRIPT_TABLE = str.maketrans(SUBSCRIPT_MAP)
+
+# ---------------------------------------------------------------------------
+# HTML (ADS titles)
+# ---------------------------------------------------------------------------
+
+# <SUP>..</SUP> / <sub>..</sub> (closing tag must match the opening one), or
+# an <i>/</i> tag to drop
+_HTML_TOKEN = re.compile(
+    r"<(?P<tag>sup|sub)>(?P<content>[^<]+)</(?P=tag)>|</?i>",
+    re.IGNORECASE,
+)
+
+_SCRIPTS = {
+    "sup": (SUPERSCRIPT_TABLE, "superscript"),
+    "sub": (SUBSCRIPT_TABLE, "subscript"),
+}
+
+
+@lru_cache(maxsize=8192)
+def _html_to_unicode(text: str) -> Tuple[str, Tuple[str, ...]]:
+    """Translate HTML markup in one scan; returns (text, warnings)."""
+    warnings: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        tag = match.group("tag")
+        if tag is None:
+            return ""
+        table, kind = _SCRIPTS[tag.lower()]
+        content = match.group("content")
+        unconverted = [c for c in content if ord(c) not in table and not c.isspace()]
+        if unconverted:
+            warnings.append(f"⚠️  Warning: No {kind} mapping for: {unconverted} in '{content}'")
+        return content.translate(table)
+
+    return _HTML_TOKEN.sub(replace, text), tuple(warnings)
+
+
+def html_to_unicode(text: str) -> str:
+    """
+    Convert HTML <SUP>/<sub>/<i> markup to Unicode (memoized).
+
+    Warnings for characters without a super/subscript form are collected
+    during the scan and printed afterwards, on every call, cached or not.
+    """
+    if not text or "<" not in text:
+        return text
+    result, warnings = _html_to_unicode(text)
+    for warning in warnings:
+        print(warning)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# LaTeX (BibTeX fields)
+# ---------------------------------------------------------------------------
+
+_FORMAT_COMMANDS = r"textbf|emph|textit|textsc|textrm"
+
+# Every alternative is deleted except an escaped special character, which
+# is replaced by the character itself via the \g<char> template (unmatched
+# groups substitute as ""). No Python callback runs per match.
+_LATEX_TOKEN = re.compile(
+    rf"\\(?:textsuperscript|{_FORMAT_COMMANDS}|text)\{{"    # macro with argument: keep content
+    r"|[{}]+"                                               # grouping braces
+    rf"|\\(?:{_FORMAT_COMMANDS})"                           # macro without braces
+    r"|\\(?P<char>[&$%#_])"                                 # escaped special character
+    r"|\\"                                                  # any other backslash
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=8192)
+def strip_latex(text: str) -> str:
+    r"""
+    Strip LaTeX formatting from text while preserving content (memoized).
+
+    Removes \textbf{}, \emph{}, \textit{}, \textsuperscript{} and similar
+    macros, curly braces, non-breaking spaces (~), and backslashes before
+    special characters, then collapses whitespace.
+    """
+    if not text:
+        return ""
+    text = _LATEX_TOKEN.sub(r"\g<char>", text.replace("~", " "))
+    return _WHITESPACE.sub(" ", text).strip()
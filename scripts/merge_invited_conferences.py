@@ -9,19 +9,33 @@ as new entries.
 
 This script can be run repeatedly - it's safe to re-run after ADS data updates.
 
+Matching uses hash indexes built once per run (bibcode -> position in the
+merged list, and a fuzzy title/year index for non-ADS entries, see
+dedup.py), so the merge is O(n + m) in the number of publications and
+invited entries. Entries are immutable Publication/InvitedTalk records (see
+records.py): they are shared with the inputs until enriched, and enrichment
+builds a new record.
+
 Author: Claude
 Date: 2025-12-26
 """
 
 import hashlib
-import json
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 
+from data_store import DataStore
+from dedup import DedupIndex, near_miss_message
+from instrumentation import instrument_run, phase
+from publication_changes import summary_line, write_changes
+from records import InvitedTalk, Publication, encode_records, load_records, write_records
 from utils import get_public_data_dir
 
+# Pattern to match ADS bibcodes (e.g., 2019AGUFM.U21B..14A)
+BIBCODE_PATTERN = re.compile(r'(?:ui\.adsabs\.harvard\.edu/abs/)?([12][0-9]{3}[A-Za-z0-9&.]+)')
+
 
 def make_synthetic_citation_key(title: str, year: str) -> str:
     """Generate a deterministic citation key for a bibcodeless invited entry.
@@ -37,54 +51,36 @@ def make_synthetic_citation_key(title: str, year: str) -> str:
     return f"{significant}{year_4}{hash_suffix}"
 
 
-def get_dedup_key(entry: Dict[str, Any]) -> tuple:
-    """Build a (lowered-title, year-prefix-4) dedup key for one entry.
-
-    Mirrors the convention in scripts/add_non_ads_publication.py:305-323.
-    """
-    title = (entry.get('title') or '').lower().strip()
-    year = (entry.get('year') or '')[:4]
-    return (title, year)
-
-
-def build_dedup_keys(entries: List[Dict[str, Any]]) -> set:
-    """Build a set of dedup keys from a list of entries (skips empty titles/years)."""
-    return {get_dedup_key(e) for e in entries if e.get('title') and e.get('year')}
-
-
-def extract_bibcode_from_entry(entry: Dict[str, Any]) -> Optional[str]:
+def extract_bibcode_from_entry(entry: Publication) -> Optional[str]:
     """
     Extract bibcode from invited entry, checking multiple fields.
 
     Checks (in priority order):
-    1. entry['bibcode']
-    2. Bibcode pattern in entry['invited_url']
-    3. Bibcode pattern in entry['url']
+    1. entry.bibcode
+    2. Bibcode pattern in entry.invited_url
+    3. Bibcode pattern in entry.url
 
     Args:
-        entry: Invited conference entry dictionary
+        entry: Invited conference record
 
     Returns:
         Bibcode string or None if not found
     """
     # Check bibcode field first
-    if entry.get('bibcode'):
-        return entry['bibcode']
-
-    # Pattern to match ADS bibcodes (e.g., 2019AGUFM.U21B..14A)
-    bibcode_pattern = r'(?:ui\.adsabs\.harvard\.edu/abs/)?([12][0-9]{3}[A-Za-z0-9&.]+)'
+    if entry.bibcode:
+        return entry.bibcode
 
     # Check invited_url field
-    if 'invited_url' in entry and entry['invited_url']:
-        match = re.search(bibcode_pattern, entry['invited_url'])
+    if entry.invited_url:
+        match = BIBCODE_PATTERN.search(entry.invited_url)
         if match:
             bibcode = match.group(1)
             print(f"  ⚠ Found bibcode in invited_url instead of bibcode field: {bibcode}")
             return bibcode
 
     # Check url field
-    if 'url' in entry and entry['url']:
-        match = re.search(bibcode_pattern, entry['url'])
+    if entry.url:
+        match = BIBCODE_PATTERN.search(entry.url)
         if match:
             bibcode = match.group(1)
             print(f"  ⚠ Found bibcode in url instead of bibcode field: {bibcode}")
@@ -93,54 +89,55 @@ def extract_bibcode_from_entry(entry: Dict[str, Any]) -> Optional[str]:
     return None
 
 
-def find_publication_by_bibcode(publications: List[Dict[str, Any]], bibcode: str) -> int:
+def build_bibcode_index(publications: Sequence[Publication]) -> Dict[str, int]:
     """
-    Find the index of a publication in the list by bibcode.
+    Map each bibcode to the index of its first publication in the list.
 
     Args:
-        publications: List of publication dictionaries
-        bibcode: Bibcode to search for
+        publications: List of publication records
 
     Returns:
-        Index of matching publication, or -1 if not found
+        Dictionary of bibcode -> list index (entries without a bibcode are skipped)
     """
+    index: Dict[str, int] = {}
     for idx, pub in enumerate(publications):
-        if pub.get('bibcode') == bibcode:
-            return idx
-    return -1
+        bibcode = pub.bibcode
+        if bibcode:
+            index.setdefault(bibcode, idx)
+    return index
 
 
-def enrich_ads_entry(ads_entry: Dict[str, Any], invited_entry: Dict[str, Any]) -> Dict[str, Any]:
+def enrich_ads_entry(ads_entry: Publication, invited_entry: InvitedTalk) -> Publication:
     """
     Enrich an ADS publication entry with invited-specific metadata.
 
     Args:
-        ads_entry: Original ADS publication dictionary
-        invited_entry: Invited conference dictionary with enrichment data
+        ads_entry: Original ADS publication record
+        invited_entry: Invited conference record with enrichment data
 
     Returns:
-        Enriched publication dictionary
+        Enriched publication record (ads_entry itself is unchanged)
     """
-    # Start with ADS entry (preserves all ADS fields like citations, url, etc.)
-    enriched = ads_entry.copy()
-
-    # Update invited flag
-    enriched['invited'] = True
-
-    # Add optional enrichment fields from invited entry if present
+    # Optional enrichment fields from the invited entry, if present
     enrichment_fields = ['location', 'day', 'booktitle', 'invited_url', 'keywords']
 
-    for field in enrichment_fields:
-        if field in invited_entry:
-            enriched[field] = invited_entry[field]
+    # Keeps all ADS fields (citations, url, etc.); new fields follow them
+    return ads_entry.replace(
+        invited=True,
+        **{field: getattr(invited_entry, field) for field in enrichment_fields if field in invited_entry},
+    )
+
 
-    return enriched
+def report_near_misses(entry: Publication, index: DedupIndex) -> None:
+    """Print indexed entries that resemble entry but are numbered differently (kept apart)."""
+    for other, score in index.near_misses(entry):
+        print(near_miss_message(entry, other, score))
 
 
 def merge_conferences(
-    ads_pubs: List[Dict[str, Any]],
-    invited_confs: List[Dict[str, Any]],
-    non_ads_pubs: List[Dict[str, Any]],
+    ads_pubs: List[Publication],
+    invited_confs: List[InvitedTalk],
+    non_ads_pubs: List[Publication],
 ) -> Dict[str, Any]:
     """
     Merge invited conferences with ADS publications.
@@ -150,10 +147,12 @@ def merge_conferences(
     entries are routed to non_ads_publications.json with synthetic
     NOADS-{citation_key} bibcodes per the convention in
     scripts/add_non_ads_publication.py:288. Per-run idempotence is preserved
-    by deduping against existing non_ads entries by (title, year). When an
+    by fuzzy-deduping against existing non_ads entries (similar title, same
+    year, same numbering). When an
     invited entry that previously had no bibcode gains a real ADS bibcode,
     the synthetic-bibcoded version is removed from non_ads to prevent
-    double-counting.
+    double-counting, but only if its normalized title and year match
+    exactly; similar titles are kept and reported as warnings.
 
     Args:
         ads_pubs: List of ADS publications (all with invited: false)
@@ -177,43 +176,54 @@ def merge_conferences(
         'warnings': []
     }
 
-    merged_pubs = [pub.copy() for pub in ads_pubs]
-    updated_non_ads = [pub.copy() for pub in non_ads_pubs]
+    # The lists are new, but records are shared with the inputs until
+    # enrich_ads_entry() replaces one with an enriched record.
+    merged_pubs = list(ads_pubs)
+    updated_non_ads = list(non_ads_pubs)
+    bibcode_index = build_bibcode_index(merged_pubs)
+
+    # Resolve each invited entry's bibcode exactly once
+    resolved = [(invited, extract_bibcode_from_entry(invited)) for invited in invited_confs]
 
     # Mitigation 2: reverse-dedup. If an invited entry now has a real bibcode,
     # any prior synthetic-bibcoded NOADS-* version of the same talk should be
     # removed from non_ads_publications.json to avoid double-counting.
-    bibcoded_invited_keys = {
-        get_dedup_key(e) for e in invited_confs
-        if extract_bibcode_from_entry(e)
-    }
-    if bibcoded_invited_keys:
+    bibcoded_invited = DedupIndex(invited for invited, bibcode in resolved if bibcode)
+    if len(bibcoded_invited):
+        # Only an exact (normalized title, year) match deletes an entry; a
+        # merely similar one is kept and reported for review.
         before = len(updated_non_ads)
-        updated_non_ads = [
-            e for e in updated_non_ads
-            if not (
-                str(e.get('bibcode', '')).startswith('NOADS-')
-                and get_dedup_key(e) in bibcoded_invited_keys
-            )
-        ]
+        kept = []
+        for e in updated_non_ads:
+            if str(e.bibcode or '').startswith('NOADS-'):
+                if bibcoded_invited.find_exact(e) is not None:
+                    continue
+                similar = bibcoded_invited.find(e)
+                if similar is not None:
+                    warning = (f"{e.bibcode} resembles bibcoded talk '{similar.title}' "
+                               f"({similar.year}); kept, remove it by hand if it is the same talk")
+                    stats['warnings'].append(warning)
+                    print(f"  ⚠ {warning}")
+                else:
+                    report_near_misses(e, bibcoded_invited)
+            kept.append(e)
+        updated_non_ads = kept
         removed = before - len(updated_non_ads)
         if removed:
             stats['reconciled_to_bibcode'] = removed
             print(f"  Reconciled {removed} synthetic-bibcoded entry(ies) "
                   f"that now have real ADS bibcodes")
 
-    # Mitigation 1: idempotence. Build dedup keys from current non_ads so
-    # repeat runs on the same input produce zero diff.
-    non_ads_dedup_keys = build_dedup_keys(updated_non_ads)
+    # Mitigation 1: idempotence. Index current non_ads so repeat runs on
+    # the same input produce zero diff.
+    non_ads_index = DedupIndex(updated_non_ads)
 
     print("\nProcessing invited conferences:")
     print("-" * 60)
 
-    for invited in invited_confs:
+    for invited, bibcode in resolved:
         title = invited.get('title', 'Unknown')
-        year = invited.get('year', '')
-
-        bibcode = extract_bibcode_from_entry(invited)
+        year = invited.year
 
         if not bibcode:
             # Route to non_ads_publications.json with synthetic bibcode.
@@ -222,25 +232,25 @@ def merge_conferences(
             stats['warnings'].append(warning)
             print(f"  ⚠ {warning}")
 
-            dedup_key = get_dedup_key(invited)
-            if dedup_key in non_ads_dedup_keys:
+            if invited in non_ads_index:
                 stats['skipped_non_ads_duplicate'] += 1
                 print(f"    → already in non_ads_publications.json, skipping")
                 continue
+            report_near_misses(invited, non_ads_index)
 
             citation_key = make_synthetic_citation_key(title, year)
             synthetic_bibcode = f"NOADS-{citation_key}"
-            invited_with_bibcode = {**invited, 'bibcode': synthetic_bibcode}
+            invited_with_bibcode = invited.replace(bibcode=synthetic_bibcode)
             updated_non_ads.append(invited_with_bibcode)
-            non_ads_dedup_keys.add(dedup_key)
+            non_ads_index.add(invited_with_bibcode)
             stats['added_to_non_ads'] += 1
             print(f"    → added to non_ads_publications.json as {synthetic_bibcode}")
             continue
 
         # Bibcoded path (unchanged behavior for ads_publications.json)
-        idx = find_publication_by_bibcode(merged_pubs, bibcode)
+        idx = bibcode_index.get(bibcode)
 
-        if idx != -1:
+        if idx is not None:
             stats['matched_via_bibcode'] += 1
             merged_pubs[idx] = enrich_ads_entry(merged_pubs[idx], invited)
             print(f"  ✓ Matched: {title}")
@@ -251,6 +261,7 @@ def merge_conferences(
             print(f"  + New entry: {title}")
             print(f"    Bibcode: {bibcode} (not found in ADS data)")
             print(f"    → Added to publications")
+            bibcode_index[bibcode] = len(merged_pubs)
             merged_pubs.append(invited)
 
     return {
@@ -268,6 +279,7 @@ def main():
 
     # Get data directory
     data_dir = get_public_data_dir()
+    phase("load")
 
     # Load ADS publications
     ads_file = data_dir / "ads_publications.json"
@@ -277,8 +289,7 @@ def main():
         sys.exit(1)
 
     print(f"\nLoading ADS publications from {ads_file.name}...")
-    with open(ads_file, 'r', encoding='utf-8') as f:
-        ads_pubs = json.load(f)
+    ads_pubs = load_records(ads_file, Publication)
     print(f"  Loaded {len(ads_pubs)} ADS publications")
 
     # Load invited conferences
@@ -289,31 +300,39 @@ def main():
         sys.exit(1)
 
     print(f"\nLoading invited conferences from {invited_file.name}...")
-    with open(invited_file, 'r', encoding='utf-8') as f:
-        invited_confs = json.load(f)
+    invited_confs = load_records(invited_file, InvitedTalk)
     print(f"  Loaded {len(invited_confs)} invited conferences")
 
     # Load non_ads publications (destination for bibcodeless invited entries)
     non_ads_file = data_dir / "non_ads_publications.json"
     if non_ads_file.exists():
-        with open(non_ads_file, 'r', encoding='utf-8') as f:
-            non_ads_pubs = json.load(f)
+        non_ads_pubs = load_records(non_ads_file, Publication)
         print(f"  Loaded {len(non_ads_pubs)} non-ADS publications")
     else:
         non_ads_pubs = []
         print(f"  non_ads_publications.json not found — will be created if needed")
 
     # Perform merge
+    phase("merge")
     result = merge_conferences(ads_pubs, invited_confs, non_ads_pubs)
     merged_pubs = result['publications']
     updated_non_ads = result['non_ads']
     stats = result['stats']
 
     # Save merged data back to ads_publications.json
+    phase("write")
     print(f"\nSaving merged data to {ads_file.name}...")
-    with open(ads_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_pubs, f, indent=2, ensure_ascii=False)
-    print(f"  ✓ Saved {len(merged_pubs)} publications")
+    with DataStore(source="merge-invited") as store:
+        # Diff against the previous merged version, not the raw fetch just written
+        previous = store.latest(ads_file.name, exclude=("ads-publications",))
+        body = encode_records(merged_pubs, ensure_ascii=False)
+        written = store.write_body(ads_file, body)
+    if written:
+        print(f"  ✓ Saved {len(merged_pubs)} publications")
+    else:
+        print(f"  ✓ Unchanged ({len(merged_pubs)} publications)")
+    changes = write_changes(data_dir, store.source, previous and previous[1], body)
+    print(f"  {summary_line(changes)}")
 
     # Save updated non_ads_publications.json only if it changed
     non_ads_changed = (
@@ -322,11 +341,11 @@ def main():
     )
     if non_ads_changed:
         print(f"\nSaving updated non-ADS data to {non_ads_file.name}...")
-        with open(non_ads_file, 'w', encoding='utf-8') as f:
-            json.dump(updated_non_ads, f, indent=2, ensure_ascii=False)
+        write_records(non_ads_file, updated_non_ads, ensure_ascii=False)
         print(f"  ✓ Saved {len(updated_non_ads)} non-ADS publications")
 
     # Print statistics
+    phase("report")
     print("\n" + "=" * 60)
     print("Merge Complete!")
     print("=" * 60)
@@ -349,11 +368,12 @@ def main():
             print(f"  - {warning}")
 
     # Verify invited field distribution
-    invited_count = sum(1 for pub in merged_pubs if pub.get('invited', False))
+    invited_count = sum(1 for pub in merged_pubs if pub.invited)
     print(f"\nVerification:")
     print(f"  Publications with invited=true:         {invited_count}")
     print(f"  Publications with invited=false:        {len(merged_pubs) - invited_count}")
 
 
 if __name__ == "__main__":
+    instrument_run()
     main()
@@ -4,6 +4,8 @@
 import json
 from pathlib import Path
 
+from utils import write_json_atomic
+
 def migrate_topics():
     repo_root = Path(__file__).parent.parent
     topics_dir = repo_root / "public" / "data" / "research-topics"
@@ -36,8 +38,7 @@ def migrate_topics():
         topic["related_figures"] = new_related
 
         # Write updated topic
-        with open(json_path, "w") as f:
-            json.dump(topic, f, indent=2)
+        write_json_atomic(json_path, topic)
 
         print(f"  Primary: {topic['primary_figure']['ref']}")
         print(f"  Related: {len(new_related)} figures")
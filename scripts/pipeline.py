@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Run the site data build as a dependency graph.
+
+Each stage is one script with declared inputs and outputs (repository-relative,
+mostly under public/data and public/plots). Dependencies are derived from
+those declarations: a stage depends on the latest earlier stage that writes
+one of its inputs (so an in-place rewrite such as merge_invited_conferences.py
+on ads_publications.json chains correctly). Files several stages update in
+place without reading them as inputs (the citation store cache) are
+declared as shared: their writers run one at a time, in declaration order.
+The fetch history database needs no such declaration: data_store.py opens
+it in WAL mode with a busy timeout and commits each document on its own, so
+the fetch stages can run concurrently. Stages whose dependencies are met
+run concurrently, longest remaining path first.
+
+A stage is skipped when its script, shared modules, arguments and input
+files hash the same as after its last successful run and its outputs are
+still what that run produced. Hashes live in .pipeline-state.json at the
+repository root (gitignored).
+
+Stages that declare the publication fields they read are also skipped when
+ads_publications.json is the only changed input and publication_changes.json
+(publication_changes.py) shows that exactly the version they last read
+changed, in other fields only: a citations-only update does not rebuild the
+publications timeline or the search index.
+
+Stages that call the ADS API only run with --fetch (they need ADS_DEV_KEY
+and ADS_ORCID); otherwise their committed outputs are used as sources.
+
+Usage:
+    python scripts/pipeline.py                     # rebuild everything derived, skipping up-to-date stages
+    python scripts/pipeline.py --fetch             # also refresh ADS data first
+    python scripts/pipeline.py statistics          # one stage plus whatever it depends on
+    python scripts/pipeline.py --list              # show stages and dependencies
+    python scripts/pipeline.py --dry-run --force   # show what would run
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from generate_compact_data import PROJECTIONS, PUBLICATION_FIELDS, compact_name
+from generate_publication_search_index import PUBLICATION_FIELDS as SEARCH_INDEX_FIELDS
+from instrumentation import instrument_run, span
+from publication_changes import affects, load_changes
+from utils import get_repo_root, write_json_atomic
+
+STATE_FILENAME = ".pipeline-state.json"
+
+DATA = "public/data"
+PLOTS = "public/plots"
+
+
+def plots(name: str) -> List[str]:
+    """Light and dark SVG/PNG outputs of a plot script."""
+    return [f"{PLOTS}/{name}{suffix}.{ext}" for suffix in ("", "_dark") for ext in ("svg", "png")]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One pipeline step: a script plus the files it reads and writes."""
+    name: str
+    script: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    args: Tuple[str, ...] = ()
+    # Extra local modules whose changes invalidate the stage (utils.py is implicit)
+    code: Tuple[str, ...] = ()
+    # Calls the ADS API; runs only with --fetch
+    network: bool = False
+    env: Tuple[str, ...] = field(default=())
+    # Fields of ads_publications.json records the stage reads (empty: treat any change as relevant)
+    fields: Tuple[str, ...] = ()
+    # Files other stages also write (not hashed); writers of one file never run concurrently
+    shared: Tuple[str, ...] = ()
+
+
+PUBLICATIONS = f"{DATA}/ads_publications.json"
+
+# Array cache of citations_by_paper.json (citation_store.py)
+CITATION_STORE = f"{DATA}/citation_store.npz"
+
+PUBLICATION_SOURCES = (
+    PUBLICATIONS,
+    f"{DATA}/non_ads_publications.json",
+    f"{DATA}/invited_presentations.json",
+)
+
+# Declaration order matters only for files rewritten in place: an input is
+# produced by the closest earlier stage that lists it as an output, and
+# writers of a shared file run in the order they are declared.
+STAGES: List[Stage] = [
+    Stage(
+        name="fetch-publications",
+        script="fetch_ads_publications_to_data_dir.py",
+        inputs=("scripts/author_name_config.json",),
+        outputs=(f"{DATA}/ads_publications.json", f"{DATA}/publication_changes.json"),
+        code=("author_names.py", "html_to_unicode.py", "markup_translator.py", "data_store.py",
+              "publication_changes.py"),
+        network=True, env=("ADS_DEV_KEY", "ADS_ORCID"),
+    ),
+    Stage(
+        name="fetch-metrics",
+        script="fetch_ads_metrics_to_data_dir.py",
+        outputs=(f"{DATA}/ads_metrics.json",),
+        args=("--orcid", "${ADS_ORCID}"),
+        code=("data_store.py",),
+        network=True, env=("ADS_DEV_KEY", "ADS_ORCID"),
+    ),
+    Stage(
+        name="fetch-citations",
+        script="fetch_ads_citations_to_data_dir.py",
+        outputs=(f"{DATA}/citations_by_year.json", f"{DATA}/citations_by_paper.json"),
+        code=("citation_store.py", "data_store.py"),
+        network=True, env=("ADS_DEV_KEY", "ADS_ORCID"),
+    ),
+    Stage(
+        name="merge-invited",
+        script="merge_invited_conferences.py",
+        inputs=(
+            f"{DATA}/ads_publications.json",
+            f"{DATA}/invited_conferences.json",
+            f"{DATA}/non_ads_publications.json",
+        ),
+        outputs=(
+            f"{DATA}/ads_publications.json",
+            f"{DATA}/non_ads_publications.json",
+            f"{DATA}/publication_changes.json",
+        ),
+        code=("dedup.py", "data_store.py", "publication_changes.py", "records.py", "corpus.py"),
+    ),
+    Stage(
+        name="statistics",
+        script="generate_publication_statistics.py",
+        inputs=(
+            f"{DATA}/ads_metrics.json",
+            f"{DATA}/ads_publications.json",
+            f"{DATA}/non_ads_publications.json",
+            f"{DATA}/invited_presentations.json",
+            f"{DATA}/invited_conferences.json",
+            f"{DATA}/citations_by_paper.json",
+        ),
+        outputs=(f"{DATA}/publication_statistics.json",),
+        code=("citation_indicators.py", "citation_store.py"),
+        shared=(CITATION_STORE,),
+    ),
+    Stage(
+        name="publications-timeline",
+        script="generate_publications_timeline.py",
+        inputs=PUBLICATION_SOURCES,
+        outputs=(f"{DATA}/publications_timeline.json", *plots("publications_timeline")),
+        code=("plot_config.py",),
+        fields=("year", "publication_type"),
+    ),
+    Stage(
+        name="citations-timeline",
+        script="generate_citations_timeline.py",
+        inputs=(f"{DATA}/citations_by_year.json",),
+        outputs=tuple(plots("citations_by_year")),
+        code=("plot_config.py",),
+    ),
+    Stage(
+        name="h-index-timeline",
+        script="generate_h_index_timeline.py",
+        inputs=(f"{DATA}/ads_metrics.json", f"{DATA}/citations_by_paper.json"),
+        outputs=tuple(plots("h_index_timeline")),
+        code=("plot_config.py", "citation_indicators.py", "citation_store.py"),
+        shared=(CITATION_STORE,),
+    ),
+    Stage(
+        name="topic-index",
+        script="topic_index.py",
+        inputs=(f"{DATA}/research-topics/*.json",),
+        outputs=(f"{DATA}/topic-figure-index.json",),
+        code=("records.py", "corpus.py"),
+    ),
+    Stage(
+        name="search-index",
+        script="generate_publication_search_index.py",
+        inputs=PUBLICATION_SOURCES,
+        outputs=(f"{DATA}/publication-search-index.json",),
+        code=("generate_compact_data.py",),
+        fields=SEARCH_INDEX_FIELDS,
+    ),
+    Stage(
+        name="compact-data",
+        script="generate_compact_data.py",
+        inputs=tuple(f"{DATA}/{name}" for name in PROJECTIONS),
+        outputs=tuple(f"{DATA}/compact/{compact_name(name)}" for name in PROJECTIONS),
+        fields=PUBLICATION_FIELDS,
+    ),
+]
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+def resolve_dependencies(stages: List[Stage]) -> Dict[str, Set[str]]:
+    """
+    Map each stage to the stages producing its inputs (closest earlier writer).
+
+    A stage also depends on the previous writer of each of its shared files,
+    so those writers form a chain instead of running concurrently.
+    """
+    deps: Dict[str, Set[str]] = {}
+    latest_writer: Dict[str, str] = {}
+    for stage in stages:
+        deps[stage.name] = {latest_writer[p] for p in (*stage.inputs, *stage.shared) if p in latest_writer}
+        for path in (*stage.outputs, *stage.shared):
+            latest_writer[path] = stage.name
+    return deps
+
+
+def select_stages(stages: List[Stage], deps: Dict[str, Set[str]], targets: List[str]) -> List[Stage]:
+    """Targets plus everything upstream of them (all stages if no targets)."""
+    by_name = {s.name: s for s in stages}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"❌ Unknown stage(s): {', '.join(unknown)} (see --list)")
+    if not targets:
+        return list(stages)
+
+    wanted: Set[str] = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(deps[name])
+    return [s for s in stages if s.name in wanted]
+
+
+def critical_paths(plan: List[Stage], deps: Dict[str, Set[str]], durations: Dict[str, float]) -> Dict[str, float]:
+    """Longest duration-weighted path from each stage to the end of the plan."""
+    names = {s.name for s in plan}
+    children: Dict[str, List[str]] = {name: [] for name in names}
+    for name in names:
+        for dep in deps[name] & names:
+            children[dep].append(name)
+
+    lengths: Dict[str, float] = {}
+    for stage in reversed(plan):  # declaration order is a topological order
+        tail = max((lengths[c] for c in children[stage.name]), default=0.0)
+        lengths[stage.name] = durations.get(stage.name, 1.0) + tail
+    return lengths
+
+
+# ---------------------------------------------------------------------------
+# Freshness
+# ---------------------------------------------------------------------------
+
+def expand(root: Path, pattern: str) -> List[str]:
+    """Repository-relative paths matching a pattern (the pattern itself if plain)."""
+    if any(ch in pattern for ch in "*?["):
+        return sorted(os.path.relpath(p, root) for p in glob.glob(str(root / pattern)))
+    return [pattern]
+
+
+def file_hash(path: Path) -> Optional[str]:
+    """sha256 of a file, or None if it does not exist."""
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def fingerprint(root: Path, stage: Stage) -> Dict[str, Optional[str]]:
+    """Hashes of everything that determines a stage's outputs."""
+    code = [f"scripts/{stage.script}", "scripts/utils.py", *(f"scripts/{c}" for c in stage.code)]
+    files = code + [p for pattern in stage.inputs for p in expand(root, pattern)]
+    prints = {path: file_hash(root / path) for path in files}
+    prints["args"] = hashlib.sha256(json.dumps(stage.args).encode()).hexdigest()
+    return prints
+
+
+def output_hashes(root: Path, stage: Stage) -> Dict[str, Optional[str]]:
+    return {path: file_hash(root / path) for path in stage.outputs}
+
+
+def is_up_to_date(root: Path, stage: Stage, record: Optional[dict]) -> bool:
+    """Inputs unchanged since the last successful run, and outputs untouched since."""
+    if not record:
+        return False
+    outputs = output_hashes(root, stage)
+    return (
+        record.get("fingerprint") == fingerprint(root, stage)
+        and None not in outputs.values()
+        and record.get("outputs") == outputs
+    )
+
+
+def unaffected_by_changes(root: Path, stage: Stage, record: Optional[dict]) -> bool:
+    """
+    Only ads_publications.json changed since the last run, and not in any field the stage reads.
+
+    publication_changes.json must describe exactly that change (from the
+    version the stage last read to the current file).
+    """
+    if not stage.fields or not record or PUBLICATIONS not in stage.inputs:
+        return False
+    before = record.get("fingerprint", {})
+    now = fingerprint(root, stage)
+    if {key for key in before.keys() | now.keys() if before.get(key) != now.get(key)} != {PUBLICATIONS}:
+        return False
+    if record.get("outputs") != output_hashes(root, stage):
+        return False
+    changes = load_changes(root / DATA)
+    return (
+        changes is not None
+        and changes["from_sha256"] == before[PUBLICATIONS]
+        and changes["to_sha256"] == now[PUBLICATIONS]
+        and not affects(changes, stage.fields)
+    )
+
+
+def load_state(path: Path) -> dict:
+    if path.exists():
+        with open(path) as f:
+            return json.load(f)
+    return {"stages": {}}
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+def run_stage(root: Path, stage: Stage) -> Tuple[bool, float, str]:
+    """Run a stage's script; returns (ok, seconds, combined output)."""
+    missing = [var for var in stage.env if not os.environ.get(var)]
+    if missing:
+        return False, 0.0, f"missing environment variable(s): {', '.join(missing)}\n"
+
+    command = [sys.executable, str(root / "scripts" / stage.script),
+               *(os.path.expandvars(arg) for arg in stage.args)]
+    start = time.perf_counter()
+    with span(stage.name, script=stage.script) as record:
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        record["returncode"] = result.returncode
+    return result.returncode == 0, time.perf_counter() - start, result.stdout + result.stderr
+
+
+def run_pipeline(
+    stages: List[Stage],
+    targets: List[str],
+    fetch: bool = False,
+    force: bool = False,
+    jobs: Optional[int] = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+) -> Dict[str, str]:
+    """
+    Run the selected stages in dependency order, in parallel where possible.
+
+    Returns:
+        Final status per planned stage: ran, skipped, source, failed, blocked
+        (or would-run/skipped in a dry run).
+    """
+    root = get_repo_root()
+    state_path = root / STATE_FILENAME
+    state = load_state(state_path)
+    records = state["stages"]
+
+    deps = resolve_dependencies(stages)
+    plan = select_stages(stages, deps, targets)
+    planned = {s.name for s in plan}
+    durations = {name: rec.get("seconds", 1.0) for name, rec in records.items()}
+    priority = critical_paths(plan, deps, durations)
+    jobs = jobs or os.cpu_count() or 1
+
+    status: Dict[str, str] = {}
+    timings: Dict[str, float] = {}
+    pending = {s.name: s for s in plan}
+    running = {}
+    wall_start = time.perf_counter()
+
+    def settle(name: str, result: str) -> None:
+        status[name] = result
+        pending.pop(name, None)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            progressed = False
+            ready = []
+            for name, stage in list(pending.items()):
+                upstream = deps[name] & planned
+                if any(status.get(d) in ("failed", "blocked") for d in upstream):
+                    print(f"⏭️  {name}: blocked by failed dependency")
+                    settle(name, "blocked")
+                    progressed = True
+                elif all(d in status for d in upstream):
+                    ready.append(stage)
+
+            for stage in sorted(ready, key=lambda s: -priority[s.name]):
+                if stage.network and not fetch:
+                    settle(stage.name, "source")
+                elif not force and is_up_to_date(root, stage, records.get(stage.name)):
+                    print(f"✓  {stage.name}: up to date")
+                    settle(stage.name, "skipped")
+                elif not force and unaffected_by_changes(root, stage, records.get(stage.name)):
+                    print(f"✓  {stage.name}: publication changes do not touch its fields")
+                    if not dry_run:
+                        records[stage.name]["fingerprint"] = fingerprint(root, stage)
+                        write_json_atomic(state_path, state, trailing_newline=True)
+                    settle(stage.name, "skipped")
+                elif dry_run:
+                    print(f"▶️  {stage.name}: would run")
+                    settle(stage.name, "would-run")
+                elif len(running) < jobs:
+                    print(f"▶️  {stage.name}: running {stage.script}")
+                    running[pool.submit(run_stage, root, stage)] = stage
+                    pending.pop(stage.name)
+                else:
+                    continue
+                progressed = True
+
+            if not running:
+                if not progressed and pending:
+                    raise RuntimeError(f"Pipeline stalled with pending stages: {sorted(pending)}")
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                ok, seconds, output = future.result()
+                timings[stage.name] = seconds
+                if verbose or not ok:
+                    for line in output.rstrip().splitlines():
+                        print(f"   [{stage.name}] {line}")
+                if ok:
+                    print(f"✅ {stage.name}: done in {seconds:.1f}s")
+                    status[stage.name] = "ran"
+                    records[stage.name] = {
+                        "fingerprint": fingerprint(root, stage),
+                        "outputs": output_hashes(root, stage),
+                        "seconds": round(seconds, 3),
+                    }
+                    # Persist after every stage so an interrupted run keeps its progress
+                    write_json_atomic(state_path, state, trailing_newline=True)
+                else:
+                    print(f"❌ {stage.name}: failed after {seconds:.1f}s")
+                    status[stage.name] = "failed"
+
+    wall = time.perf_counter() - wall_start
+    if timings:
+        print(f"\n⏱️  Wall time {wall:.1f}s for {sum(timings.values()):.1f}s of stage time "
+              f"({len(timings)} stages, {jobs} workers)")
+    return status
+
+
+def print_graph(stages: List[Stage]) -> None:
+    deps = resolve_dependencies(stages)
+    for stage in stages:
+        flags = " [network, --fetch]" if stage.network else ""
+        after = ", ".join(sorted(deps[stage.name])) or "-"
+        print(f"{stage.name:<24} {stage.script:<42} after: {after}{flags}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the site data build as a dependency graph.")
+    parser.add_argument("targets", nargs="*", help="Stages to build (with their dependencies); default all")
+    parser.add_argument("--fetch", action="store_true", help="Also run the ADS fetch stages")
+    parser.add_argument("--force", action="store_true", help="Run stages even if they look up to date")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Parallel stages (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would run without running it")
+    parser.add_argument("--list", action="store_true", help="List stages and their dependencies")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show output of successful stages too")
+    args = parser.parse_args()
+
+    if args.list:
+        print_graph(STAGES)
+        return 0
+
+    instrument_run()
+    status = run_pipeline(STAGES, args.targets, fetch=args.fetch, force=args.force,
+                          jobs=args.jobs, dry_run=args.dry_run, verbose=args.verbose)
+    failed = [name for name, result in status.items() if result in ("failed", "blocked")]
+    if failed:
+        print(f"\n❌ {len(failed)} stage(s) did not complete: {', '.join(failed)}")
+        return 1
+    print("\n✓ Pipeline complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
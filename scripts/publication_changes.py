@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Keyed diff between two versions of ads_publications.json.
+
+fetch_ads_publications_to_data_dir.py and merge_invited_conferences.py both
+rewrite ads_publications.json. Each now also writes
+public/data/publication_changes.json, which describes how the file differs
+from what the same writer produced last time (the previous version comes from
+the data store, see data_store.py):
+
+    {
+      "document": "ads_publications.json",
+      "source": "merge-invited",
+      "from_sha256": "...",                  # file bytes the diff starts from
+      "to_sha256": "...",                    # file bytes the diff produces
+      "summary": {"added": 1, "removed": 0, "changed": 12, "unchanged": 144},
+      "added": {bibcode: title},
+      "removed": {bibcode: title},
+      "changed": {bibcode: {field: [old, new]}},
+      "fields": ["citations"]                # every field in "changed"
+    }
+
+Both versions are indexed by bibcode with a digest of each record, so only
+records whose digest differs are compared field by field.
+
+Consumers check from_sha256/to_sha256 against the bytes they last processed
+and the file they are about to read, so a diff is never applied to the wrong
+version. pipeline.py uses it to skip stages whose declared publication fields
+did not change (a citations-only update does not rebuild the timeline or the
+search index), and the publications workflow puts the changelog in its commit
+message.
+
+Usage:
+    python scripts/publication_changes.py              # changelog of the latest diff
+    python scripts/publication_changes.py --limit 0    # summary line only
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from utils import get_public_data_dir, get_relative_path, write_json_atomic
+
+CHANGES_FILENAME = "publication_changes.json"
+DOCUMENT = "ads_publications.json"
+
+
+def record_digest(record: dict) -> str:
+    """Digest of a record's content, independent of key order."""
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def index_records(records: Iterable[dict], key: str = "bibcode") -> Dict[str, tuple]:
+    """{key: (record, digest)}; records without the key are not tracked."""
+    return {r[key]: (r, record_digest(r)) for r in records if r.get(key)}
+
+
+def diff_records(old: List[dict], new: List[dict], key: str = "bibcode") -> dict:
+    """Added, removed and changed records (per field) between two record lists."""
+    before = index_records(old, key)
+    after = index_records(new, key)
+
+    changed = {}
+    for bibcode, (record, digest) in after.items():
+        previous = before.get(bibcode)
+        if previous is None or previous[1] == digest:
+            continue
+        old_record = previous[0]
+        changed[bibcode] = {
+            field: [old_record.get(field), record.get(field)]
+            for field in sorted(set(old_record) | set(record))
+            if old_record.get(field) != record.get(field)
+        }
+
+    added = {b: after[b][0].get("title", "") for b in after if b not in before}
+    removed = {b: before[b][0].get("title", "") for b in before if b not in after}
+    return {
+        "summary": {
+            "added": len(added),
+            "removed": len(removed),
+            "changed": len(changed),
+            "unchanged": len(after) - len(added) - len(changed),
+        },
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "fields": sorted({field for fields in changed.values() for field in fields}),
+    }
+
+
+def write_changes(data_dir: Path, source: str, old_body: Optional[bytes], new_body: bytes) -> dict:
+    """
+    Diff two versions of ads_publications.json and save it as publication_changes.json.
+
+    A run that changed nothing keeps the saved diff, so re-running a script
+    does not erase the description of the last real update.
+    """
+    old = json.loads(old_body) if old_body else []
+    changes = {
+        "document": DOCUMENT,
+        "source": source,
+        "from_sha256": hashlib.sha256(old_body).hexdigest() if old_body else None,
+        "to_sha256": hashlib.sha256(new_body).hexdigest(),
+        **diff_records(old, json.loads(new_body)),
+    }
+    if old_body != new_body:
+        write_json_atomic(data_dir / CHANGES_FILENAME, changes, ensure_ascii=False, trailing_newline=True)
+    return changes
+
+
+def load_changes(data_dir: Optional[Path] = None) -> Optional[dict]:
+    path = (data_dir or get_public_data_dir()) / CHANGES_FILENAME
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def affects(changes: dict, fields: Iterable[str]) -> bool:
+    """Whether a consumer reading only these fields sees any difference."""
+    if changes["added"] or changes["removed"]:
+        return True
+    return not set(fields).isdisjoint(changes["fields"])
+
+
+def summary_line(changes: dict) -> str:
+    counts = changes["summary"]
+    return (f"ADS publications: {counts['added']} added, {counts['removed']} removed, "
+            f"{counts['changed']} changed")
+
+
+def format_changelog(changes: dict, limit: int = 50) -> List[str]:
+    """Human-readable lines: one per added, removed and changed publication."""
+    lines = [summary_line(changes)]
+    entries = [f"+ {b} {title}" for b, title in changes["added"].items()]
+    entries += [f"- {b} {title}" for b, title in changes["removed"].items()]
+    for bibcode, fields in changes["changed"].items():
+        parts = []
+        for field, (old, new) in fields.items():
+            if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+                parts.append(f"{field} {old} → {new}")
+            else:
+                parts.append(field)
+        entries.append(f"~ {bibcode} {', '.join(parts)}")
+    if limit:
+        lines += entries[:limit]
+        if len(entries) > limit:
+            lines.append(f"... and {len(entries) - limit} more")
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show what the last ADS publications update changed.")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum entries to list (0: summary only)")
+    args = parser.parse_args()
+
+    changes = load_changes()
+    if changes is None:
+        path = get_relative_path(get_public_data_dir() / CHANGES_FILENAME)
+        print(f"No {path} yet: run fetch_ads_publications_to_data_dir.py first.", file=sys.stderr)
+        return 1
+    print("\n".join(format_changelog(changes, args.limit)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+"""
+Typed records for publications, invited talks, figures and research topics.
+
+The data scripts used to pass plain dicts around, copying one whenever a
+field changed. The record types here are frozen, __slots__-backed
+dataclasses with one attribute per schema field. They need a fraction of a
+dict's memory, can't be mutated in place, and still encode to exactly the
+JSON the scripts always wrote:
+
+    pubs = load_records(data_dir / "ads_publications.json", Publication)
+    pub = pubs[0].replace(invited=True)   # new record; pubs[0] is unchanged
+    write_records(path, pubs, ensure_ascii=False)
+
+Each record remembers the key order of the object it was decoded from
+(`layout`, shared between records with the same order) and keeps keys its
+type doesn't declare in `extra`, so from_dict(d).to_dict() == d, key order
+included. Absent keys read as the field default and are not written back.
+Records built in code use the type's DEFAULT_LAYOUT. List values are held
+as tuples, and nested objects as their record type (Figure.summary, Topic.paper,
+...). get() and `in` work as they do on the dicts, so code shared with dict
+callers (dedup.py) accepts records unchanged.
+
+JSON is decoded with the fastest available backend (see corpus.py). Output
+is byte-identical to utils.json_bytes() on the same data as dicts: the
+indent=2, ensure_ascii=False files the scripts write go through orjson when
+it is installed and the data holds no floats, everything else through
+json_bytes(). Records cost time to build (decoding is slower than with plain
+dicts) and save it on the way out; scripts/benchmarks/bench_records.py
+measures both.
+
+Used by merge_invited_conferences.py, generate_figure_registry_from_corpus.py and
+topic_index.py.
+"""
+
+import dataclasses
+import sys
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Optional
+
+from corpus import decode_json
+from utils import json_bytes, write_bytes_atomic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_MISSING = object()
+_FLOAT_FREE_TYPES = frozenset({str, int, bool, type(None), list, dict})
+
+# Interned key orders: every record decoded from an object with the same keys shares one tuple
+_LAYOUTS: dict[tuple, tuple] = {}
+
+
+def _intern_layout(keys: tuple) -> tuple:
+    return _LAYOUTS.setdefault(keys, keys)
+
+
+def _encode(value: Any) -> Any:
+    """A field value as JSON data: records to dicts, tuples to lists."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if type(value) is tuple:
+        return [_encode(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Record:
+    """Base of the record types: key order and undeclared keys of the source object."""
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = ()
+    NESTED: ClassVar[dict[str, type]] = {}  # field -> record type of its object(s)
+    INTERNED: ClassVar[frozenset] = frozenset()  # string fields shared by many records
+
+    layout: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    extra: Optional[dict] = field(default=None, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        names, nested, special = _schema(cls)
+        values = dict(data)
+        extra = None
+        if not values.keys() <= names:
+            extra = {key: values.pop(key) for key in data if key not in names}
+        for key, converted in special:
+            if key in values:
+                value = values[key]
+                values[key] = _convert(value, nested.get(key)) if converted else _intern(value)
+        return cls(layout=_intern_layout(tuple(data)), extra=extra, **values)
+
+    def to_dict(self) -> dict:
+        """The JSON object this record encodes to, in its original key order."""
+        layout = self.layout or self.DEFAULT_LAYOUT
+        declared, read, undeclared, nested, listed = _plan(type(self), layout)
+        if undeclared:
+            data = dict.fromkeys(layout)
+            data.update(zip(declared, read(self)))
+            for key in undeclared:
+                data[key] = self.extra[key]
+        else:
+            data = dict(zip(declared, read(self)))
+        for key in nested:
+            data[key] = _encode(data[key])
+        for key in listed:
+            if type(data[key]) is tuple:
+                data[key] = list(data[key])
+        return data
+
+    def replace(self, **changes) -> "Record":
+        """
+        A copy with fields changed; keys the record didn't have are appended
+        to its layout, as assigning them on a dict would.
+        """
+        layout = self.layout or self.DEFAULT_LAYOUT
+        added = tuple(key for key in changes if key not in layout)
+        names = _schema(type(self))[0]
+        undeclared = {key: changes.pop(key) for key in list(changes) if key not in names}
+        if undeclared:
+            changes["extra"] = {**(self.extra or {}), **undeclared}
+        if added:
+            changes["layout"] = _intern_layout(layout + added)
+        return dataclasses.replace(self, **changes)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a key the record has (as read by dict.get())."""
+        if key not in (self.layout or self.DEFAULT_LAYOUT):
+            return default
+        value = getattr(self, key, _MISSING)
+        return self.extra[key] if value is _MISSING else value
+
+    def __contains__(self, key: str) -> bool:
+        return key in (self.layout or self.DEFAULT_LAYOUT)
+
+
+@cache
+def _schema(cls: type) -> tuple[frozenset, dict, tuple]:
+    """
+    Declared field names (without layout/extra), nested record types, and the
+    fields decoded specially: (name, True) for those converted on the way in
+    and out (records and tuples), (name, False) for interned strings.
+    """
+    fields = [f for f in dataclasses.fields(cls) if f.name not in ("layout", "extra")]
+    names = frozenset(f.name for f in fields)
+    special = tuple(
+        (f.name, f.name in cls.NESTED or type(f.default) is tuple)
+        for f in fields
+        if f.name in cls.NESTED or type(f.default) is tuple or f.name in cls.INTERNED
+    )
+    return names, cls.NESTED, special
+
+
+@cache
+def _plan(cls: type, layout: tuple) -> tuple[tuple, Callable, tuple, tuple, tuple]:
+    """
+    How to_dict() writes one key order: the declared keys and a getter
+    returning their values as a tuple, the undeclared keys (read from extra),
+    the keys holding records (encoded by _encode()) and those holding tuples
+    of plain values (written as lists).
+    """
+    names, nested_types, special = _schema(cls)
+    declared = tuple(key for key in layout if key in names)
+    undeclared = tuple(key for key in layout if key not in names)
+    converted = [key for key, is_converted in special if is_converted and key in declared]
+    nested = tuple(key for key in converted if key in nested_types)
+    listed = tuple(key for key in converted if key not in nested_types)
+    if len(declared) == 1:
+        getter = attrgetter(declared[0])
+        read = lambda record: (getter(record),)  # noqa: E731
+    elif declared:
+        read = attrgetter(*declared)
+    else:
+        read = lambda record: ()  # noqa: E731
+    return declared, read, undeclared, nested, listed
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _convert(value: Any, record_type: Optional[type]) -> Any:
+    """A decoded value as stored: lists as tuples, objects as records, strings interned."""
+    if type(value) is list:
+        if record_type:
+            return tuple([record_type.from_dict(item) for item in value])
+        try:
+            return tuple(map(sys.intern, value))
+        except TypeError:  # not a list of strings
+            return tuple(value)
+    if record_type and type(value) is dict:
+        return record_type.from_dict(value)
+    return _intern(value)
+
+
+# ---------------------------------------------------------------------------
+# Publications
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Publication(Record):
+    """An entry of ads_publications.json or non_ads_publications.json."""
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = (
+        "bibcode", "title", "authors", "month", "year", "journal",
+        "publication_type", "properties", "citations", "url", "invited",
+    )
+    INTERNED: ClassVar[frozenset] = frozenset({"month", "year", "journal", "publication_type", "booktitle"})
+
+    bibcode: Optional[str] = None
+    title: str = ""
+    authors: tuple[str, ...] = ()
+    month: str = ""
+    year: str = ""
+    journal: str = ""
+    publication_type: str = ""
+    properties: tuple[str, ...] = ()
+    citations: int = 0
+    url: str = ""
+    invited: bool = False
+    # Invited-talk enrichment (merge_invited_conferences.py)
+    booktitle: Optional[str] = None
+    location: Optional[str] = None
+    day: Optional[str] = None
+    invited_url: Optional[str] = None
+    keywords: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InvitedTalk(Publication):
+    """An entry of invited_conferences.json or invited_presentations.json."""
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = (
+        "title", "authors", "year", "month", "publication_type", "citations",
+        "invited", "booktitle", "journal", "keywords", "url",
+    )
+
+    invited: bool = True
+
+
+# ---------------------------------------------------------------------------
+# Figures (figure-registry.json)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FigureSummary(Record):
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = ("what_we_see", "the_finding", "why_it_matters")
+
+    what_we_see: str = ""
+    the_finding: str = ""
+    why_it_matters: str = ""
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Figure(Record):
+    """A figure-registry.json entry, keyed "paper_id/figure_id" in the registry."""
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = (
+        "paper_id", "figure_id", "src", "short_title", "alt", "summary",
+        "summary_short", "keywords", "technical_caption",
+        "used_as_primary_in", "used_as_related_in",
+    )
+    NESTED: ClassVar[dict[str, type]] = {"summary": FigureSummary}
+    INTERNED: ClassVar[frozenset] = frozenset({"paper_id"})
+
+    paper_id: str = ""
+    figure_id: str = ""
+    src: str = ""
+    short_title: str = ""
+    alt: str = ""
+    summary: Optional[FigureSummary] = None
+    summary_short: Optional[str] = None
+    keywords: tuple[str, ...] = ()
+    technical_caption: str = ""
+    used_as_primary_in: tuple[str, ...] = ()
+    used_as_related_in: tuple[str, ...] = ()
+    # Added by review tooling, not by generate_figure_registry_from_corpus.py
+    used_as_not_shown_in: tuple[str, ...] = ()
+    meta_description: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.paper_id}/{self.figure_id}"
+
+
+# ---------------------------------------------------------------------------
+# Research topics (public/data/research-topics/<slug>.json)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FigureRef(Record):
+    """A topic's reference to a registry figure ("paper_id/figure_id")."""
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = ("ref", "relevance")
+
+    ref: str = ""
+    relevance: Optional[str] = None
+    topic_keywords: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TopicLink(Record):
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = ("slug", "connection")
+
+    slug: str = ""
+    connection: str = ""
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TopicPaper(Record):
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = (
+        "id", "title", "doi", "bibcode", "journal", "year", "license",
+    )
+
+    id: str = ""
+    title: str = ""
+    doi: Optional[str] = None
+    bibcode: Optional[str] = None
+    journal: Optional[str] = None
+    year: Optional[int] = None
+    license: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Topic(Record):
+    """
+    A research topic page.
+
+    Topic files use the optional singular "primary_figure"; files written by
+    apply_figure_topic_mappings.py use the "primary_figures" list.
+    """
+    DEFAULT_LAYOUT: ClassVar[tuple[str, ...]] = (
+        "slug", "title", "subtitle", "description", "primary_figure",
+        "related_figures", "related_topics", "published", "paper",
+    )
+    NESTED: ClassVar[dict[str, type]] = {
+        "primary_figure": FigureRef,
+        "primary_figures": FigureRef,
+        "related_figures": FigureRef,
+        "related_topics": TopicLink,
+        "paper": TopicPaper,
+    }
+
+    slug: str = ""
+    title: str = ""
+    subtitle: str = ""
+    description: str = ""
+    primary_figure: Optional[FigureRef] = None
+    primary_figures: tuple[FigureRef, ...] = ()
+    related_figures: tuple[FigureRef, ...] = ()
+    related_topics: tuple[TopicLink, ...] = ()
+    published: bool = False
+    paper: Optional[TopicPaper] = None
+    meta_description: Optional[str] = None
+
+    @property
+    def primary_refs(self) -> list[str]:
+        """Refs of the primary figure(s), without duplicates."""
+        refs = [self.primary_figure.ref] if self.primary_figure else []
+        for ref in self.primary_figures:
+            if ref.ref not in refs:
+                refs.append(ref.ref)
+        return refs
+
+    @property
+    def related_refs(self) -> list[str]:
+        return [ref.ref for ref in self.related_figures]
+
+
+# ---------------------------------------------------------------------------
+# Encoding and decoding
+# ---------------------------------------------------------------------------
+
+def to_builtins(data: Any) -> Any:
+    """Records (alone, in a list or as dict values) converted to plain JSON data."""
+    if isinstance(data, Record):
+        return data.to_dict()
+    if isinstance(data, dict):
+        return {key: to_builtins(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_builtins(item) for item in data]
+    return data
+
+
+def from_builtins(data: Any, record_type: type) -> Any:
+    """Decoded JSON as records: a list of objects or a dict of objects (keyed records)."""
+    if isinstance(data, list):
+        return [record_type.from_dict(item) for item in data]
+    return {key: record_type.from_dict(value) for key, value in data.items()}
+
+
+def decode_records(body: bytes, record_type: type) -> Any:
+    return from_builtins(decode_json(body), record_type)
+
+
+def load_records(path: Path, record_type: type) -> Any:
+    """Read a JSON file of records (a list, or an object keyed by record)."""
+    return decode_records(path.read_bytes(), record_type)
+
+
+def _float_free(data: Any) -> bool:
+    """
+    True if the JSON data holds only strings, integers, booleans, None, lists
+    and dicts (no floats, which orjson spells differently). The scan goes one
+    nesting level at a time so that it runs in C.
+    """
+    values = [data]
+    while values:
+        types = set(map(type, values))
+        if not types <= _FLOAT_FREE_TYPES:
+            return False
+        if dict not in types and list not in types:
+            break
+        values = list(chain(
+            chain.from_iterable(map(dict.values, [value for value in values if type(value) is dict])),
+            chain.from_iterable([value for value in values if type(value) is list]),
+        ))
+    return True
+
+
+def encode_records(
+    data: Any,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    trailing_newline: bool = False,
+) -> bytes:
+    """
+    The bytes utils.write_json_atomic() would write for the same data as dicts.
+
+    With orjson installed, indent=2 and ensure_ascii=False, float-free data is
+    encoded by orjson, whose output is byte-identical to json.dumps() there;
+    everything else (floats, ASCII escaping, integers beyond 64 bits,
+    non-string keys) goes through utils.json_bytes().
+    """
+    data = to_builtins(data)
+    if orjson is not None and indent == 2 and not ensure_ascii and _float_free(data):
+        try:
+            body = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:  # orjson.JSONEncodeError: big integer, non-string key, ...
+            pass
+        else:
+            return body + b"\n" if trailing_newline else body
+    return json_bytes(data, indent=indent, ensure_ascii=ensure_ascii, trailing_newline=trailing_newline)
+
+
+def write_records(path: Path, data: Any, **json_options) -> bool:
+    """
+    Encode records and write them atomically.
+
+    Returns:
+        bool: True if the file changed, False if it already had these bytes.
+    """
+    return write_bytes_atomic(path, encode_records(data, **json_options))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Maintain the topic <-> figure <-> paper index for research topics.
+
+Reads: public/data/research-topics/*.json
+Writes: public/data/topic-figure-index.json
+
+The index answers "which figures does this topic show", "which topics use
+this figure (and in what role)" and "which topics/figures come from this
+paper" with a single dict lookup, so the registry generator, exporters and
+the frontend no longer walk every topic file to rebuild those views.
+
+    {
+      "version": 1,
+      "sources": {"<file>.json": {"sha256": ..., "slug": ...}},
+      "topics":  {slug: {"primary": [refs], "related": [refs], "papers": [ids]}},
+      "figures": {ref: {"paper_id": ..., "primary_in": [slugs], "related_in": [slugs]}},
+      "papers":  {paper_id: {"figures": [refs], "topics": [slugs]}}
+    }
+
+Updates are incremental: a topic file is only re-parsed when its content
+hash differs from the one recorded in "sources". The figure and paper
+views are then re-derived from the per-topic entries. A version bump
+forces a full rebuild.
+
+Usage:
+    python scripts/topic_index.py [--rebuild]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from instrumentation import instrument_run, span
+from records import Topic
+from utils import get_public_data_dir, write_json_atomic
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "topic-figure-index.json"
+
+
+def get_index_path(data_dir: Path) -> Path:
+    """Path of the persisted topic-figure index."""
+    return data_dir / INDEX_FILENAME
+
+
+def index_topic(topic: Topic) -> dict:
+    """Build the per-topic index entry from a topic record."""
+    primary = topic.primary_refs
+    related = topic.related_refs
+    papers = list(dict.fromkeys(ref.split("/", 1)[0] for ref in primary + related))
+    return {"primary": primary, "related": related, "papers": papers}
+
+
+def derive_views(topics: dict[str, dict]) -> tuple[dict, dict]:
+    """
+    Derive the figure and paper views from per-topic entries.
+
+    Returns:
+        (figures, papers) keyed by figure ref and paper_id, sorted by key.
+    """
+    figures: dict[str, dict] = {}
+    papers: dict[str, dict] = {}
+
+    def add(ref: str, slug: str, role: str) -> None:
+        paper_id = ref.split("/", 1)[0]
+        fig = figures.setdefault(ref, {"paper_id": paper_id, "primary_in": [], "related_in": []})
+        fig[role].append(slug)
+        paper = papers.setdefault(paper_id, {"figures": [], "topics": []})
+        if ref not in paper["figures"]:
+            paper["figures"].append(ref)
+        if slug not in paper["topics"]:
+            paper["topics"].append(slug)
+
+    for slug in sorted(topics):
+        for ref in topics[slug]["primary"]:
+            add(ref, slug, "primary_in")
+        for ref in topics[slug]["related"]:
+            add(ref, slug, "related_in")
+
+    for paper in papers.values():
+        paper["figures"].sort()
+
+    return dict(sorted(figures.items())), dict(sorted(papers.items()))
+
+
+def load_topic_figure_index(data_dir: Path) -> dict | None:
+    """Load the persisted index, or None if missing or from another version."""
+    index_path = get_index_path(data_dir)
+    if not index_path.exists():
+        return None
+    with open(index_path) as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def update_topic_figure_index(data_dir: Path, rebuild: bool = False, write: bool = True) -> dict:
+    """
+    Bring the topic-figure index up to date with the topic files.
+
+    Only topic files whose content hash changed since the last run are
+    parsed. The index file is rewritten only when something changed.
+
+    Args:
+        data_dir: public/data directory.
+        rebuild: Ignore the persisted index and parse every topic file.
+        write: Persist the updated index.
+
+    Returns:
+        The up-to-date index.
+    """
+    topics_dir = data_dir / "research-topics"
+    previous = None if rebuild else load_topic_figure_index(data_dir)
+    old_sources = previous["sources"] if previous else {}
+    old_topics = previous["topics"] if previous else {}
+
+    sources: dict[str, dict] = {}
+    topics: dict[str, dict] = {}
+    parsed = 0
+
+    for json_path in sorted(topics_dir.glob("*.json")):
+        raw = json_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cached = old_sources.get(json_path.name)
+
+        if cached and cached["sha256"] == digest and cached["slug"] in old_topics:
+            slug = cached["slug"]
+            topics[slug] = old_topics[slug]
+        else:
+            topic = Topic.from_dict(json.loads(raw))
+            slug = topic.slug
+            topics[slug] = index_topic(topic)
+            parsed += 1
+
+        sources[json_path.name] = {"sha256": digest, "slug": slug}
+
+    figures, papers = derive_views(topics)
+    index = {
+        "version": INDEX_VERSION,
+        "sources": sources,
+        "topics": dict(sorted(topics.items())),
+        "figures": figures,
+        "papers": papers,
+    }
+
+    if write:
+        write_json_atomic(get_index_path(data_dir), index, ensure_ascii=False, trailing_newline=True)
+
+    print(f"  Topic index: {len(topics)} topics ({parsed} re-parsed), "
+          f"{len(figures)} figures, {len(papers)} papers")
+    return index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Update the topic-figure index.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Re-parse every topic file instead of only changed ones")
+    args = parser.parse_args()
+
+    instrument_run()
+    data_dir = get_public_data_dir()
+    with span("update-index", rebuild=args.rebuild):
+        update_topic_figure_index(data_dir, rebuild=args.rebuild)
+    print(f"✓ Index up to date: {get_index_path(data_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
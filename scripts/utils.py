@@ -1,7 +1,10 @@
 """
 Utility functions for NASA ADS data fetching scripts.
 """
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 
 def get_repo_root() -> Path:
@@ -43,12 +46,18 @@ def get_public_data_dir() -> Path:
     """
     Get the public/data directory path.
 
+    Set PUBLIC_DATA_DIR to point the scripts at another data tree (used by
+    the benchmarks to run against synthetic corpora).
+
     Note: This returns the path only. Call path.mkdir(parents=True, exist_ok=True)
     if you need to ensure the directory exists.
 
     Returns:
         Path: Absolute path to public/data directory.
     """
+    override = os.getenv("PUBLIC_DATA_DIR")
+    if override:
+        return Path(override).resolve()
     return get_repo_root() / "public" / "data"
 
 
@@ -56,15 +65,52 @@ def get_public_plots_dir() -> Path:
     """
     Get the public/plots directory path.
 
+    Set PUBLIC_PLOTS_DIR to write plots elsewhere (see get_public_data_dir).
+
     Note: This returns the path only. Call path.mkdir(parents=True, exist_ok=True)
     if you need to ensure the directory exists.
 
     Returns:
         Path: Absolute path to public/plots directory.
     """
+    override = os.getenv("PUBLIC_PLOTS_DIR")
+    if override:
+        return Path(override).resolve()
     return get_repo_root() / "public" / "plots"
 
 
+def get_ads_api_url() -> str:
+    """
+    Get the base URL of the NASA ADS API.
+
+    Set ADS_API_URL to point the fetch scripts at another server, e.g. the
+    offline stand-in in scripts/benchmarks/ads_standin.py.
+
+    Returns:
+        str: API base URL without a trailing slash.
+    """
+    return os.getenv("ADS_API_URL", "https://api.adsabs.harvard.edu/v1").rstrip("/")
+
+
+def get_data_store_path() -> Path:
+    """
+    Get the path of the SQLite data store (see data_store.py).
+
+    Set DATA_STORE_PATH to use another database. When only PUBLIC_DATA_DIR is
+    overridden, the store lives inside that data tree, so runs against a
+    scratch tree never touch the repository's database.
+
+    Returns:
+        Path: Absolute path to the database file (it may not exist yet).
+    """
+    override = os.getenv("DATA_STORE_PATH")
+    if override:
+        return Path(override).resolve()
+    if os.getenv("PUBLIC_DATA_DIR"):
+        return get_public_data_dir() / "publications.sqlite"
+    return get_repo_root() / "data" / "publications.sqlite"
+
+
 def get_relative_path(path: Path) -> Path:
     """
     Convert an absolute path to a path relative to the repository root.
@@ -84,4 +130,116 @@ def get_relative_path(path: Path) -> Path:
         return abs_path.relative_to(repo_root)
     except ValueError:
         # Path is not within the repository
-        return path
\ No newline at end of file
+        return path
+
+def _create_temp(path: Path) -> tuple:
+    """
+    Create a new, empty temporary file next to path; returns (fd, name).
+
+    Like tempfile.mkstemp(), but created with mode 0o666 so the umask
+    applies, as it would to a file opened normally.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        tmp_name = str(path.parent / f".{path.name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No usable temporary file name for {path}")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> bool:
+    """
+    Atomically replace a file's contents, skipping the write if unchanged.
+
+    The data is written to a temporary file in the same directory, fsynced,
+    and renamed over the target with os.replace(), so readers (and an
+    interrupted run) only ever see the old or the new complete file. The
+    existing file's permissions are kept; new files get the default
+    permissions for the current umask (applied by the kernel when the
+    temporary file is created, so the process umask is never changed).
+
+    Args:
+        path: Destination file. The parent directory must exist.
+        data: Complete new file contents.
+
+    Returns:
+        True if the file was written, False if it already had these bytes.
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == data:
+            return False
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    # Persist the rename itself (not supported on every platform)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return True
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+    return True
+
+
+def write_json_atomic(
+    path: Path,
+    data: Any,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    trailing_newline: bool = False,
+) -> bool:
+    """
+    Serialize data as JSON and write it with write_bytes_atomic().
+
+    Formatting matches json.dump(data, f, indent=indent, ensure_ascii=...)
+    so each script keeps its existing output byte-for-byte. Unchanged
+    output is not rewritten, which avoids git churn and redeploys.
+
+    Args:
+        path: Destination file. The parent directory must exist.
+        data: JSON-serializable data.
+        indent: Indentation passed to json.dumps.
+        ensure_ascii: Escape non-ASCII characters (json.dumps default).
+        trailing_newline: Append a final newline.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    return write_bytes_atomic(path, json_bytes(data, indent, ensure_ascii, trailing_newline))
+
+
+def json_bytes(
+    data: Any,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    trailing_newline: bool = False,
+) -> bytes:
+    """The exact bytes write_json_atomic() writes for these arguments."""
+    text = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
+    if trailing_newline:
+        text += "\n"
+    return text.encode("utf-8")
@@ -1,13 +1,18 @@
 """Quick validation of author name standardization."""
 
 import json
+from instrumentation import instrument_run, phase
 from utils import get_public_data_dir
 
+instrument_run()
+
+phase("load")
 data_dir = get_public_data_dir()
 with open(data_dir / "ads_publications.json", 'r') as f:
     pubs = json.load(f)
 
 # Find all Alterman name variants
+phase("check")
 variants = {}
 for pub in pubs:
     for author in pub.get('authors', []):
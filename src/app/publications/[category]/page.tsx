@@ -1,9 +1,11 @@
 import { Button } from "@/components/ui/button";
 import { GraduationCap, BookOpen, Database, FileText, Presentation, ScrollText, FileCode } from "lucide-react";
 import { Metadata, ResolvingMetadata } from 'next';
-import { loadJSONData, loadAllPublications } from "@/lib/data-loader";
+import { loadJSONData, loadAllPublications, loadPublicationSearchIndex } from "@/lib/data-loader";
 import { buildPageMetadata } from "@/lib/metadata";
 import { getPublicationsByType, getInvitedPublications, getSeminarPresentations } from "@/lib/publication-utils";
+import { slicePublicationSearchIndex, withSearchKeys } from "@/lib/publication-search";
+import { categoryFacetSelection, countFacets, type FacetCube } from "@/lib/facet-cube";
 import type { Publication } from "@/types/publication";
 import { redirect } from "next/navigation";
 import Link from "next/link";
@@ -43,10 +45,15 @@ const iconMap = {
 
 export async function generateStaticParams() {
   const categoriesData = loadJSONData<PublicationsCategoriesData>('publications-categories.json');
-  const adsPublications = loadAllPublications<Publication>();
+  const facetCube = loadJSONData<{ facet_cube?: FacetCube }>('publication_statistics.json').facet_cube;
 
-  // Only generate routes for categories that have publications
+  // Only generate routes for categories that have publications: a facet cube
+  // lookup, or a recount when the statistics predate the cube
+  const adsPublications = facetCube ? [] : loadAllPublications<Publication>();
   const categoriesWithPublications = categoriesData.categories.filter((category) => {
+    if (facetCube) {
+      return countFacets(facetCube, categoryFacetSelection(category)) > 0;
+    }
     const publications = getPublicationsByType(adsPublications, category.publicationType);
     return publications.length > 0;
   });
@@ -84,7 +91,10 @@ export default async function PublicationCategoryPage({ params }: { params: Prom
 
   const adsPublications = loadAllPublications<Publication>();
   const stats = loadJSONData<any>('publication_statistics.json');
-  const invitedPresentations = loadJSONData<Publication[]>('invited_presentations.json');
+  const invitedPresentations = withSearchKeys(
+    loadJSONData<Publication[]>('invited_presentations.json'),
+    'invited_presentations'
+  );
 
   // Merge invited presentations into main publications list for Invited Talks page
   const allPublications = categoryData.slug === 'invited-talks'
@@ -106,6 +116,9 @@ export default async function PublicationCategoryPage({ params }: { params: Prom
     redirect('/publications');
   }
 
+  // Search index restricted to this page's publications (null = filter linearly)
+  const searchIndex = slicePublicationSearchIndex(loadPublicationSearchIndex(), publications);
+
   const IconComponent = iconMap[categoryData.icon as keyof typeof iconMap];
 
   return (
@@ -143,6 +156,8 @@ export default async function PublicationCategoryPage({ params }: { params: Prom
       {/* Publications with filtering */}
       <PublicationFilters
         publications={publications}
+        searchIndex={searchIndex}
+        facetCube={stats.facet_cube}
         categoryData={categoryData}
         {...(categoryData.slug === 'conferences' && {
           labels: { journal: 'Conference' }
@@ -7,6 +7,7 @@ import {
   RelatedFigure
 } from '@/types/research-topic';
 import { filterPublishedProjects } from '@/lib/research-utils';
+import { loadFigureEntries, loadTopicFigureIndex } from '@/lib/figure-registry';
 import { buildPageMetadata } from '@/lib/metadata';
 import { Metadata } from 'next';
 import { notFound } from 'next/navigation';
@@ -20,11 +21,13 @@ type Props = {
   params: Promise<{ slug: string }>;
 };
 
-// Load the figure registry
-function loadFigureRegistry(): FigureRegistry {
-  const registryPath = path.join(process.cwd(), 'public/data/figure-registry.json');
-  const content = fs.readFileSync(registryPath, 'utf8');
-  return JSON.parse(content);
+// Load only the registry entries a topic references (from per-paper shards)
+function loadTopicFigures(raw: RawResearchTopicData): FigureRegistry {
+  const refs = raw.related_figures.map(rf => rf.ref);
+  if (raw.primary_figure) {
+    refs.push(raw.primary_figure.ref);
+  }
+  return loadFigureEntries(refs);
 }
 
 // Load all raw topic data from JSON files
@@ -67,6 +70,7 @@ function resolveTopicData(
   }
 
   // Resolve related figures
+  const topicIndex = loadTopicFigureIndex();
   const relatedFigures: RelatedFigure[] = raw.related_figures.map(rf => {
     const entry = registry[rf.ref];
     if (!entry) {
@@ -74,7 +78,7 @@ function resolveTopicData(
     }
 
     // If this figure is primary for another topic, link there; otherwise link to figure detail
-    const primaryTopics = (entry.used_as_primary_in || []).filter(t => t !== raw.slug);
+    const primaryTopics = (topicIndex.figures[rf.ref]?.primary_in || []).filter(t => t !== raw.slug);
     const link = primaryTopics.length > 0
       ? `/research/${primaryTopics[0]}`
       : `/research/figure/${entry.paper_id}/${entry.figure_id}`;
@@ -108,15 +112,14 @@ function resolveTopicData(
   };
 }
 
-// Load and resolve all topics
-function loadAllTopics(): ResearchTopicData[] {
-  const registry = loadFigureRegistry();
-  const rawTopics = loadAllRawTopics();
-  return rawTopics.map(raw => resolveTopicData(raw, registry));
+// Load and resolve a single topic by slug
+function loadTopic(slug: string): ResearchTopicData | undefined {
+  const raw = loadAllRawTopics().find(t => t.slug === slug);
+  return raw ? resolveTopicData(raw, loadTopicFigures(raw)) : undefined;
 }
 
 export async function generateStaticParams() {
-  const topics = loadAllTopics();
+  const topics = loadAllRawTopics();
   const publishedTopics = filterPublishedProjects(topics);
 
   return publishedTopics.map((topic) => ({
@@ -126,8 +129,7 @@ export async function generateStaticParams() {
 
 export async function generateMetadata({ params }: Props): Promise<Metadata> {
   const { slug } = await params;
-  const topics = loadAllTopics();
-  const topic = topics.find(t => t.slug === slug);
+  const topic = loadAllRawTopics().find(t => t.slug === slug);
 
   return buildPageMetadata({
     path: `/research/${slug}`,
@@ -138,8 +140,7 @@ export async function generateMetadata({ params }: Props): Promise<Metadata> {
 
 export default async function ResearchTopicPage({ params }: Props) {
   const { slug } = await params;
-  const topics = loadAllTopics();
-  const topic = topics.find(t => t.slug === slug);
+  const topic = loadTopic(slug);
 
   if (!topic) {
     notFound();
@@ -1,11 +1,10 @@
 import Link from 'next/link';
-import { FigureRegistry, FigureRegistryEntry } from '@/types/research-topic';
+import { FigureIndexEntry } from '@/types/research-topic';
 import { Metadata } from 'next';
 import { notFound } from 'next/navigation';
 import { ArrowLeft } from 'lucide-react';
 import { buildPageMetadata } from '@/lib/metadata';
-import fs from 'fs';
-import path from 'path';
+import { loadFigureEntry, loadFigureIndex, loadTopicFigureIndex } from '@/lib/figure-registry';
 
 export const dynamicParams = false;
 
@@ -13,15 +12,9 @@ type Props = {
   params: Promise<{ paper_id: string; figure_id: string }>;
 };
 
-function loadFigureRegistry(): FigureRegistry {
-  const registryPath = path.join(process.cwd(), 'public/data/figure-registry.json');
-  const content = fs.readFileSync(registryPath, 'utf8');
-  return JSON.parse(content);
-}
-
 export async function generateStaticParams() {
-  const registry = loadFigureRegistry();
-  return Object.values(registry).map((entry: FigureRegistryEntry) => ({
+  const index = loadFigureIndex();
+  return Object.values(index).map((entry: FigureIndexEntry) => ({
     paper_id: entry.paper_id,
     figure_id: entry.figure_id,
   }));
@@ -29,8 +22,7 @@ export async function generateStaticParams() {
 
 export async function generateMetadata({ params }: Props): Promise<Metadata> {
   const { paper_id, figure_id } = await params;
-  const registry = loadFigureRegistry();
-  const entry = registry[`${paper_id}/${figure_id}`];
+  const entry = loadFigureEntry(`${paper_id}/${figure_id}`);
 
   return buildPageMetadata({
     path: `/research/figure/${paper_id}/${figure_id}`,
@@ -50,17 +42,17 @@ function SummarySection({ title, content }: { title: string; content: string })
 
 export default async function FigureDetailPage({ params }: Props) {
   const { paper_id, figure_id } = await params;
-  const registry = loadFigureRegistry();
   const key = `${paper_id}/${figure_id}`;
-  const entry = registry[key];
+  const entry = loadFigureEntry(key);
 
   if (!entry) {
     notFound();
   }
 
   // Find topic pages where this figure appears
-  const primaryTopics = entry.used_as_primary_in || [];
-  const relatedTopics = entry.used_as_related_in || [];
+  const usage = loadTopicFigureIndex().figures[key];
+  const primaryTopics = usage?.primary_in || [];
+  const relatedTopics = usage?.related_in || [];
   const notShownTopics = entry.used_as_not_shown_in || [];
 
   return (
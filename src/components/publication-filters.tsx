@@ -23,8 +23,9 @@ import {
   SelectValue,
 } from '@/components/ui/select'
 import { Label } from '@/components/ui/label'
+import { Input } from '@/components/ui/input'
 import { MultiSelect } from '@/components/ui/multi-select'
-import { BookOpen, Download, Filter, ChevronDown, ChevronUp, X } from 'lucide-react'
+import { BookOpen, Download, Filter, ChevronDown, ChevronUp, Search, X } from 'lucide-react'
 import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from '@/components/ui/tooltip'
 import {
   extractUniqueJournals,
@@ -39,6 +40,12 @@ import {
   sortPublicationsByFirstAuthor,
   sortPublicationsByJournal,
 } from '@/lib/publication-utils'
+import {
+  matchesPublicationText,
+  searchPublicationSlice,
+  type PublicationSearchSlice,
+} from '@/lib/publication-search'
+import { categoryFacetSelection, facetBreakdown, type FacetCube } from '@/lib/facet-cube'
 
 interface PublicationCategory {
   title: string
@@ -56,6 +63,10 @@ interface PublicationCategory {
 
 interface PublicationFiltersProps {
   publications: Publication[]
+  /** Precomputed index over `publications`; null/absent falls back to linear filtering */
+  searchIndex?: PublicationSearchSlice | null
+  /** Precomputed counts (publication_statistics.json facet_cube) for the Year filter */
+  facetCube?: FacetCube
   categoryData: PublicationCategory
   labels?: {
     journal?: string
@@ -64,6 +75,8 @@ interface PublicationFiltersProps {
 
 export function PublicationFilters({
   publications,
+  searchIndex = null,
+  facetCube,
   categoryData,
   labels = {},
 }: PublicationFiltersProps) {
@@ -80,6 +93,7 @@ export function PublicationFilters({
   }
 
   // Filter state
+  const [searchText, setSearchText] = useState('')
   const [authorshipFilter, setAuthorshipFilter] = useState<'all' | 'first' | 'coauthor'>('all')
   const [invitedFilter, setInvitedFilter] = useState<'all' | 'invited' | 'contributed'>('all')
   const [journalFilters, setJournalFilters] = useState<string[]>([])
@@ -113,9 +127,45 @@ export function PublicationFilters({
     [publications]
   )
 
+  // Per-year counts for the Year filter, looked up in the facet cube. The cube
+  // covers category and invited status only, so counts are shown while no
+  // text, authorship or journal filter is narrowing the list.
+  const yearCounts = useMemo(() => {
+    if (!facetCube || searchText || authorshipFilter !== 'all' || journalFilters.length > 0) {
+      return undefined
+    }
+    const selection = categoryFacetSelection(categoryData)
+    if (categoryData.slug === 'conferences' && invitedFilter !== 'all') {
+      const invited = invitedFilter === 'invited'
+      selection.invited = (selection.invited ?? [false, true]).filter(v => v === invited)
+    }
+    return facetBreakdown(facetCube, 'year', selection)
+  }, [facetCube, categoryData, searchText, authorshipFilter, journalFilters, invitedFilter])
+
   // Filter publications based on selected criteria
   const filteredPublications = useMemo(() => {
+    const invitedActive = categoryData.slug === 'conferences' && invitedFilter !== 'all'
+
+    // Indexed path: each criterion is a bitmap, combined by intersection
+    if (searchIndex) {
+      const positions = searchPublicationSlice(searchIndex, {
+        text: searchText,
+        facets: {
+          first_author: authorshipFilter === 'all' ? [] : [authorshipFilter === 'first' ? 'true' : 'false'],
+          journal: journalFilters,
+          year: yearFilters,
+          invited: invitedActive ? [invitedFilter === 'invited' ? 'true' : 'false'] : [],
+        },
+      })
+      return positions ? positions.map(i => publications[i]) : publications
+    }
+
     return publications.filter(pub => {
+      // Text search
+      if (searchText && !matchesPublicationText(pub, searchText)) {
+        return false
+      }
+
       // Authorship filter
       if (authorshipFilter === 'first') {
         if (!isFirstAuthor(pub)) return false
@@ -135,14 +185,14 @@ export function PublicationFilters({
       }
 
       // Invited filter (only for conferences)
-      if (categoryData.slug === 'conferences' && invitedFilter !== 'all') {
+      if (invitedActive) {
         if (invitedFilter === 'invited' && !pub.invited) return false
         if (invitedFilter === 'contributed' && pub.invited) return false
       }
 
       return true
     })
-  }, [publications, authorshipFilter, invitedFilter, journalFilters, yearFilters, categoryData.slug])
+  }, [publications, searchIndex, searchText, authorshipFilter, invitedFilter, journalFilters, yearFilters, categoryData.slug])
 
   // Count active filters
   const activeFilterCount = useMemo(() => {
@@ -176,6 +226,7 @@ export function PublicationFilters({
 
   // Reset all filters
   const clearAllFilters = () => {
+    setSearchText('')
     setAuthorshipFilter('all')
     setInvitedFilter('all')
     setJournalFilters([])
@@ -274,6 +325,7 @@ export function PublicationFilters({
                 <Label className="text-sm font-medium">Year</Label>
                 <MultiSelect
                   options={uniqueYears}
+                  counts={yearCounts}
                   selected={yearFilters}
                   onChange={setYearFilters}
                   placeholder="All Years"
@@ -303,6 +355,19 @@ export function PublicationFilters({
           </PopoverContent>
         </Popover>
 
+        {/* Text search over titles, authors and venues */}
+        <div className="relative flex-1 max-w-sm mx-4">
+          <Search className="absolute left-3 top-1/2 h-4 w-4 -translate-y-1/2 text-muted-foreground" />
+          <Input
+            type="search"
+            value={searchText}
+            onChange={(e) => setSearchText(e.target.value)}
+            placeholder={`Search titles, authors, ${journalLabel.toLowerCase()}s...`}
+            aria-label="Search publications"
+            className="pl-9"
+          />
+        </div>
+
         <div className="text-sm text-muted-foreground">
           Showing {filteredPublications.length} of {publications.length} publications
         </div>
@@ -11,6 +11,7 @@ import { Label } from '@/components/ui/label'
 
 interface MultiSelectProps {
   options: string[]
+  counts?: Record<string, number>  // Optional per-option count shown after the label
   selected: string[]
   onChange: (selected: string[]) => void
   placeholder?: string
@@ -20,6 +21,7 @@ interface MultiSelectProps {
 
 export function MultiSelect({
   options,
+  counts,
   selected,
   onChange,
   placeholder = 'Select items...',
@@ -119,6 +121,11 @@ export function MultiSelect({
                     <Label className="flex-1 cursor-pointer text-sm font-normal">
                       {option}
                     </Label>
+                    {counts && (
+                      <span className="text-xs text-muted-foreground tabular-nums">
+                        {counts[option] ?? 0}
+                      </span>
+                    )}
                   </div>
                 ))}
               </div>
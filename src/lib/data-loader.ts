@@ -1,14 +1,39 @@
 import fs from 'fs';
 import path from 'path';
+import { withSearchKeys, type PublicationSearchIndex } from '@/lib/publication-search';
+
+const DATA_DIR = path.join(process.cwd(), 'public', 'data');
+
+/** Minified, field-projected variants written by scripts/generate_compact_data.py. */
+const COMPACT_DIR = path.join(DATA_DIR, 'compact');
 
 /**
- * Reads and parses a JSON file from the public/data directory.
+ * Picks the file to read for a data file name: the compact variant
+ * (compact/<name>.min.json) when it exists and is at least as new as the
+ * pretty-printed source, otherwise the source itself. A stale or missing
+ * compact file (e.g. a hand edit since the last generate run) never wins.
+ */
+function resolveDataFile(fileName: string): string {
+  const source = path.join(DATA_DIR, fileName);
+  const compact = path.join(COMPACT_DIR, fileName.replace(/\.json$/, '.min.json'));
+  try {
+    if (fs.statSync(compact).mtimeMs >= fs.statSync(source).mtimeMs) {
+      return compact;
+    }
+  } catch {
+    // No compact variant (or no source): fall through to the source path
+  }
+  return source;
+}
+
+/**
+ * Reads and parses a JSON file from the public/data directory, preferring
+ * its compact build-time variant when one is up to date.
  * @param fileName The name of the JSON file to load (e.g., 'education.json').
  * @returns The parsed JSON data.
  */
 export function loadJSONData<T>(fileName: string): T {
-  const filePath = path.join(process.cwd(), 'public', 'data', fileName);
-  const fileContents = fs.readFileSync(filePath, 'utf-8');
+  const fileContents = fs.readFileSync(resolveDataFile(fileName), 'utf-8');
   return JSON.parse(fileContents);
 }
 
@@ -18,10 +43,10 @@ interface PublicationPdf {
   path: string;
   /** Which version is hosted. */
   version: 'vor' | 'preprint' | 'thesis' | 'whitepaper';
-  /** Human-readable license/provenance note (not rendered). */
-  license: string;
-  /** Where the file was sourced from (research-corpus | zotero | unpaywall | arxiv). */
-  source: string;
+  /** Human-readable license/provenance note (not rendered; dropped from the compact variant). */
+  license?: string;
+  /** Where the file was sourced from (research-corpus | zotero | unpaywall | arxiv); dropped from the compact variant. */
+  source?: string;
 }
 
 /**
@@ -35,8 +60,8 @@ interface PublicationPdf {
  * orphan is surfaced loudly rather than dropping a Download button without a trace.
  */
 export function loadAllPublications<T extends { bibcode: string }>(): T[] {
-  const ads = loadJSONData<T[]>('ads_publications.json');
-  const nonAds = loadJSONData<T[]>('non_ads_publications.json');
+  const ads = withSearchKeys(loadJSONData<T[]>('ads_publications.json'), 'ads_publications');
+  const nonAds = withSearchKeys(loadJSONData<T[]>('non_ads_publications.json'), 'non_ads_publications');
   const pdfs = loadJSONData<Record<string, PublicationPdf>>('publication-pdfs.json');
   const merged = [...ads, ...nonAds];
 
@@ -55,3 +80,17 @@ export function loadAllPublications<T extends { bibcode: string }>(): T[] {
     return pdf ? { ...p, pdfPath: pdf.path, pdfVersion: pdf.version } : p;
   });
 }
+
+/**
+ * Loads the publication search index written by
+ * scripts/generate_publication_search_index.py, or null when it has not been
+ * generated (it is a build artifact). Pages slice it with
+ * slicePublicationSearchIndex() and fall back to linear filtering on null.
+ */
+export function loadPublicationSearchIndex(): PublicationSearchIndex | null {
+  const filePath = path.join(DATA_DIR, 'publication-search-index.json');
+  if (!fs.existsSync(filePath)) {
+    return null;
+  }
+  return JSON.parse(fs.readFileSync(filePath, 'utf-8'));
+}
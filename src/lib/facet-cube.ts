@@ -0,0 +1,93 @@
+/**
+ * Count lookups over the precomputed facet cube in publication_statistics.json
+ * (written by scripts/generate_publication_statistics.py).
+ *
+ * The cube stores publication counts for every type x year x invited x
+ * refereed combination as a flat row-major array (last dimension fastest)
+ * with one sorted value dictionary per dimension. A count for any filter
+ * combination is the sum of the matching cells: at most a few hundred
+ * additions, independent of how many publications there are.
+ */
+
+export type FacetDimension = 'type' | 'year' | 'invited' | 'refereed';
+export type FacetValue = string | boolean;
+
+export interface FacetCube {
+  dimensions: FacetDimension[];
+  values: Record<FacetDimension, FacetValue[]>;
+  counts: number[];
+}
+
+/** Accepted values per dimension (OR within, AND across). Omitted = any value. */
+export type FacetSelection = Partial<Record<FacetDimension, FacetValue[]>>;
+
+/** Which value indices of each dimension a selection keeps. */
+function selectedIndices(cube: FacetCube, selection: FacetSelection): number[][] {
+  return cube.dimensions.map((dim) => {
+    const values = cube.values[dim];
+    const wanted = selection[dim];
+    if (!wanted) return values.map((_, i) => i);
+    return values.flatMap((value, i) => (wanted.includes(value) ? [i] : []));
+  });
+}
+
+/** Sum of the cells matching a selection (row-major walk over the kept indices). */
+function sumCells(cube: FacetCube, indices: number[][]): number {
+  const shape = cube.dimensions.map((dim) => cube.values[dim].length);
+  let total = 0;
+  const walk = (axis: number, offset: number) => {
+    if (axis === shape.length) {
+      total += cube.counts[offset];
+      return;
+    }
+    for (const i of indices[axis]) walk(axis + 1, offset * shape[axis] + i);
+  };
+  walk(0, 0);
+  return total;
+}
+
+/** Number of publications matching a selection. */
+export function countFacets(cube: FacetCube, selection: FacetSelection = {}): number {
+  return sumCells(cube, selectedIndices(cube, selection));
+}
+
+/**
+ * Counts per value of one dimension under a selection, e.g. publications per
+ * year for a category. Values with a zero count are omitted.
+ */
+export function facetBreakdown(
+  cube: FacetCube,
+  dimension: FacetDimension,
+  selection: FacetSelection = {}
+): Record<string, number> {
+  const axis = cube.dimensions.indexOf(dimension);
+  const indices = selectedIndices(cube, selection);
+  const breakdown: Record<string, number> = {};
+  for (const i of indices[axis]) {
+    const count = sumCells(cube, indices.map((kept, a) => (a === axis ? [i] : kept)));
+    if (count > 0) breakdown[String(cube.values[dimension][i])] = count;
+  }
+  return breakdown;
+}
+
+/**
+ * The cube selection equivalent to a publications category page, mirroring
+ * the filtering in src/app/publications/[category]/page.tsx: invited talks
+ * are every invited entry regardless of type, conferences exclude invited
+ * talks, and every other category is its publication type(s).
+ */
+export function categoryFacetSelection(category: {
+  slug: string;
+  publicationType: string | string[];
+}): FacetSelection {
+  if (category.slug === 'invited-talks') {
+    return { invited: [true] };
+  }
+  const type = Array.isArray(category.publicationType)
+    ? category.publicationType
+    : [category.publicationType];
+  if (category.slug === 'conferences') {
+    return { type, invited: [false] };
+  }
+  return { type };
+}
@@ -0,0 +1,83 @@
+import fs from 'fs';
+import path from 'path';
+import {
+  FigureIndex,
+  FigureRegistry,
+  FigureRegistryEntry,
+  TopicFigureIndex,
+} from '@/types/research-topic';
+
+/**
+ * Build-time access to the sharded figure registry written by
+ * scripts/generate_figure_registry_from_corpus.py:
+ *
+ *   public/data/figure-registry/index.json              (key -> src, title, size)
+ *   public/data/figure-registry/papers/<paper_id>.json  (full entries per paper)
+ *
+ * Pages load the small index and only the paper shards they reference,
+ * instead of parsing every figure's summaries and captions.
+ *
+ * Topic usage (which topics show a figure, as primary or related) comes from
+ * public/data/topic-figure-index.json, written by scripts/topic_index.py.
+ */
+
+const REGISTRY_DIR = path.join(process.cwd(), 'public', 'data', 'figure-registry');
+
+// Shards are read once per build worker and reused across pages.
+const shardCache = new Map<string, FigureRegistry>();
+let topicIndexCache: TopicFigureIndex | undefined;
+
+/**
+ * Loads the lightweight figure index (no summaries, keywords or captions).
+ */
+export function loadFigureIndex(): FigureIndex {
+  const content = fs.readFileSync(path.join(REGISTRY_DIR, 'index.json'), 'utf8');
+  return JSON.parse(content);
+}
+
+function loadPaperShard(paperId: string): FigureRegistry {
+  let shard = shardCache.get(paperId);
+  if (!shard) {
+    const shardPath = path.join(REGISTRY_DIR, 'papers', `${paperId}.json`);
+    shard = fs.existsSync(shardPath)
+      ? (JSON.parse(fs.readFileSync(shardPath, 'utf8')) as FigureRegistry)
+      : {};
+    shardCache.set(paperId, shard);
+  }
+  return shard;
+}
+
+/**
+ * Loads a single full registry entry by "paper_id/figure_id" key.
+ * @returns The entry, or undefined if the figure is not registered.
+ */
+export function loadFigureEntry(ref: string): FigureRegistryEntry | undefined {
+  const [paperId] = ref.split('/', 1);
+  return loadPaperShard(paperId)[ref];
+}
+
+/**
+ * Loads full registry entries for the given refs, touching only their paper shards.
+ * Unknown refs are omitted; callers decide whether that is an error.
+ */
+export function loadFigureEntries(refs: string[]): FigureRegistry {
+  const entries: FigureRegistry = {};
+  for (const ref of refs) {
+    const entry = loadFigureEntry(ref);
+    if (entry) {
+      entries[ref] = entry;
+    }
+  }
+  return entries;
+}
+
+/**
+ * Loads the topic <-> figure <-> paper index (cached per build worker).
+ */
+export function loadTopicFigureIndex(): TopicFigureIndex {
+  if (!topicIndexCache) {
+    const indexPath = path.join(process.cwd(), 'public', 'data', 'topic-figure-index.json');
+    topicIndexCache = JSON.parse(fs.readFileSync(indexPath, 'utf8')) as TopicFigureIndex;
+  }
+  return topicIndexCache;
+}
@@ -0,0 +1,285 @@
+import type { Publication } from '@/types/publication';
+
+/**
+ * Set-based search and filtering over the precomputed publication index
+ * (public/data/publication-search-index.json, written by
+ * scripts/generate_publication_search_index.py).
+ *
+ * The server slices the global index down to one page's publications
+ * (slicePublicationSearchIndex), renumbering docs to page positions, and
+ * passes the slice to the client. There, text search is a lookup in a
+ * sorted vocabulary plus posting-list intersection, and each facet filter
+ * is a bitmap union; no per-keystroke scan over titles, authors or venues.
+ *
+ * Pure functions only (no fs), so the module is safe in client components.
+ */
+
+/** Tokenizer/stemmer settings, shipped inside the index so both sides agree. */
+export interface SearchAnalyzer {
+  min_length: number;
+  min_stem: number;
+  stopwords: string[];
+  stem_rules: [string, string][];
+}
+
+/** On-disk index covering every publication (see the Python script docstring). */
+export interface PublicationSearchIndex {
+  version: number;
+  analyzer: SearchAnalyzer;
+  /** Doc keys; a doc id is a position in this list. */
+  docs: string[];
+  /** field -> stem -> sorted doc ids */
+  terms: Record<string, Record<string, number[]>>;
+  /** facet -> value -> base64 bitmap over doc ids */
+  facets: Record<string, Record<string, string>>;
+}
+
+/** The index restricted to one page's publications; ids are page positions. */
+export interface PublicationSearchSlice {
+  analyzer: SearchAnalyzer;
+  size: number;
+  /** Sorted vocabulary across title, author and venue fields. */
+  terms: string[];
+  /** Sorted page positions for each entry of `terms`. */
+  postings: number[][];
+  /** facet -> value -> bitmap as 32-bit words over page positions */
+  facets: Record<string, Record<string, number[]>>;
+}
+
+/** Index format version this module understands. */
+export const SEARCH_INDEX_VERSION = 2;
+
+type Bitset = Uint32Array;
+
+/**
+ * Key of a publication in the index: its bibcode, or the searchKey set by
+ * withSearchKeys() for entries without one (invited presentations).
+ * Mirrors doc_key() in Python.
+ */
+export function publicationSearchKey(pub: Publication): string {
+  return pub.bibcode || pub.searchKey || '';
+}
+
+/**
+ * Give entries without a bibcode their index key, "<source>#<position>",
+ * where source is the data file's name without .json. Call on a file's
+ * entries as loaded, before any filtering or sorting.
+ */
+export function withSearchKeys<T extends { bibcode?: string }>(
+  entries: T[],
+  source: string
+): (T & { searchKey?: string })[] {
+  return entries.map((entry, position) =>
+    entry.bibcode ? entry : { ...entry, searchKey: `${source}#${position}` }
+  );
+}
+
+function stem(token: string, analyzer: SearchAnalyzer): string {
+  if (/^\d+$/.test(token)) return token;
+  for (const [suffix, replacement] of analyzer.stem_rules) {
+    if (token.endsWith(suffix)) {
+      const stemmed = token.slice(0, token.length - suffix.length) + replacement;
+      return stemmed.length >= analyzer.min_stem ? stemmed : token;
+    }
+  }
+  return token;
+}
+
+/** Lowercase ASCII folding: accents stripped, as in the Python analyzer. */
+function normalize(text: string): string {
+  return text.normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+}
+
+/** Split normalized text into indexable tokens (unstemmed). */
+function tokenize(normalized: string, analyzer: SearchAnalyzer): string[] {
+  const tokens = normalized.match(/[a-z0-9]+/g) || [];
+  return tokens.filter((t) => t.length >= analyzer.min_length && !analyzer.stopwords.includes(t));
+}
+
+function decodeBase64Bitmap(encoded: string): Uint8Array {
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  return bytes;
+}
+
+/**
+ * Restrict the global index to `publications`, renumbering every posting
+ * and bitmap to positions in that array.
+ *
+ * Returns null when the index is missing, from another version, or does not
+ * cover every publication (e.g. data edited since the last build); callers
+ * then fall back to linear filtering, so a stale index never hides results.
+ */
+export function slicePublicationSearchIndex(
+  index: PublicationSearchIndex | null,
+  publications: Publication[]
+): PublicationSearchSlice | null {
+  if (!index || index.version !== SEARCH_INDEX_VERSION) return null;
+
+  const docIds = new Map(index.docs.map((key, id) => [key, id]));
+  const positionsByDoc = new Map<number, number[]>();
+  for (let pos = 0; pos < publications.length; pos++) {
+    const id = docIds.get(publicationSearchKey(publications[pos]));
+    if (id === undefined) return null;
+    const positions = positionsByDoc.get(id);
+    if (positions) positions.push(pos);
+    else positionsByDoc.set(id, [pos]);
+  }
+
+  const merged = new Map<string, Set<number>>();
+  for (const fieldTerms of Object.values(index.terms)) {
+    for (const [term, ids] of Object.entries(fieldTerms)) {
+      for (const id of ids) {
+        const positions = positionsByDoc.get(id);
+        if (!positions) continue;
+        let set = merged.get(term);
+        if (!set) merged.set(term, (set = new Set()));
+        for (const pos of positions) set.add(pos);
+      }
+    }
+  }
+  const terms = Array.from(merged.keys()).sort();
+  const postings = terms.map((term) => Array.from(merged.get(term)!).sort((a, b) => a - b));
+
+  const words = Math.ceil(publications.length / 32);
+  const facets: Record<string, Record<string, number[]>> = {};
+  for (const [facet, values] of Object.entries(index.facets)) {
+    facets[facet] = {};
+    for (const [value, encoded] of Object.entries(values)) {
+      const bytes = decodeBase64Bitmap(encoded);
+      const bits = new Array<number>(words).fill(0);
+      let any = false;
+      positionsByDoc.forEach((positions, id) => {
+        if ((bytes[id >> 3] >> (id & 7)) & 1) {
+          for (const pos of positions) bits[pos >>> 5] |= 1 << (pos & 31);
+          any = true;
+        }
+      });
+      if (any) facets[facet][value] = bits;
+    }
+  }
+
+  return { analyzer: index.analyzer, size: publications.length, terms, postings, facets };
+}
+
+function emptyBitset(size: number): Bitset {
+  return new Uint32Array(Math.ceil(size / 32));
+}
+
+function intersectInto(target: Bitset, other: ArrayLike<number>): void {
+  for (let i = 0; i < target.length; i++) target[i] &= other[i];
+}
+
+/** Index of the first vocabulary entry >= prefix (binary search). */
+function lowerBound(terms: string[], prefix: string): number {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (terms[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/**
+ * Docs matching one query token: its stem exactly or, for the token still
+ * being typed, any term starting with the token or its stem, plus any stem
+ * the token has typed past into a suffix ("observe" -> "observ" from
+ * "observed", "instabilitie" -> "instability"). A partial token that may still become a stopword
+ * ("wi" -> "with") is no constraint (null).
+ */
+function matchToken(slice: PublicationSearchSlice, token: string, isPrefix: boolean): Bitset | null {
+  if (isPrefix && slice.analyzer.stopwords.some((word) => word.startsWith(token))) return null;
+  const bits = emptyBitset(slice.size);
+  const add = (i: number) => {
+    for (const pos of slice.postings[i]) bits[pos >>> 5] |= 1 << (pos & 31);
+  };
+  const stemmed = stem(token, slice.analyzer);
+  const prefixes = isPrefix ? Array.from(new Set([token, stemmed])) : [];
+
+  const exact = lowerBound(slice.terms, stemmed);
+  if (slice.terms[exact] === stemmed) add(exact);
+  for (const prefix of prefixes) {
+    for (let i = lowerBound(slice.terms, prefix); i < slice.terms.length && slice.terms[i].startsWith(prefix); i++) {
+      add(i);
+    }
+  }
+  if (isPrefix) {
+    for (const [suffix, replacement] of slice.analyzer.stem_rules) {
+      for (let end = Math.max(1, token.length - suffix.length + 1); end < token.length; end++) {
+        if (!suffix.startsWith(token.slice(end))) continue;
+        const candidate = token.slice(0, end) + replacement;
+        const i = lowerBound(slice.terms, candidate);
+        if (candidate.length >= slice.analyzer.min_stem && slice.terms[i] === candidate) add(i);
+      }
+    }
+  }
+  return bits;
+}
+
+export interface PublicationSearchQuery {
+  /** Free text; every token must match (title, authors or venue). */
+  text?: string;
+  /** facet -> accepted values (OR within a facet, AND across facets). Empty = no constraint. */
+  facets?: Record<string, string[]>;
+}
+
+/**
+ * Page positions matching a query, ascending (i.e. in page order), or null
+ * when the query places no constraint at all.
+ */
+export function searchPublicationSlice(
+  slice: PublicationSearchSlice,
+  query: PublicationSearchQuery
+): number[] | null {
+  const constraints: Bitset[] = [];
+
+  const text = normalize(query.text || '');
+  const tokens = tokenize(text, slice.analyzer);
+  const endsMidToken = /[a-z0-9]$/.test(text);
+  tokens.forEach((token, i) => {
+    const bits = matchToken(slice, token, endsMidToken && i === tokens.length - 1);
+    if (bits) constraints.push(bits);
+  });
+
+  for (const [facet, values] of Object.entries(query.facets || {})) {
+    if (values.length === 0) continue;
+    const bits = emptyBitset(slice.size);
+    for (const value of values) {
+      const words = slice.facets[facet]?.[value];
+      if (words) for (let i = 0; i < bits.length; i++) bits[i] |= words[i];
+    }
+    constraints.push(bits);
+  }
+
+  if (constraints.length === 0) return null;
+  const [matches, ...rest] = constraints;
+  for (const bits of rest) intersectInto(matches, bits);
+
+  const positions: number[] = [];
+  for (let w = 0; w < matches.length; w++) {
+    let word = matches[w];
+    while (word) {
+      const bit = 31 - Math.clz32(word & -word);
+      positions.push(w * 32 + bit);
+      word &= word - 1;
+    }
+  }
+  return positions;
+}
+
+/**
+ * Linear text match used when no index slice is available: every
+ * whitespace-separated query word must occur in the title, authors or venue.
+ */
+export function matchesPublicationText(pub: Publication, text: string): boolean {
+  const words = text.toLowerCase().split(/\s+/).filter(Boolean);
+  if (words.length === 0) return true;
+  const haystack = [pub.title, ...(pub.authors || []), pub.journal, pub.booktitle, pub.location]
+    .filter(Boolean)
+    .join(' ')
+    .toLowerCase();
+  return words.every((word) => haystack.includes(word));
+}
@@ -39,6 +39,9 @@ export interface Publication {
    */
   keywords?: string;
 
+  /** Search index key of an entry without a bibcode ("<source>#<position>", see withSearchKeys()) */
+  searchKey?: string;
+
   /** Venue/institution name for presentations */
   booktitle?: string;
 
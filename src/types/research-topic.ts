@@ -84,6 +84,34 @@ export interface FigureRegistry {
   [key: string]: FigureRegistryEntry;  // key = "paper_id/figure_id"
 }
 
+// Lightweight entry from figure-registry/index.json (full entries live in per-paper shards)
+export interface FigureIndexEntry {
+  paper_id: string;
+  figure_id: string;
+  src: string;
+  short_title: string;
+  width: number | null;   // Intrinsic image size, null if unknown
+  height: number | null;
+}
+
+export interface FigureIndex {
+  [key: string]: FigureIndexEntry;  // key = "paper_id/figure_id"
+}
+
+// Topic <-> figure <-> paper index (public/data/topic-figure-index.json)
+export interface TopicFigureIndex {
+  version: number;
+  topics: {
+    [slug: string]: { primary: string[]; related: string[]; papers: string[] };
+  };
+  figures: {
+    [ref: string]: { paper_id: string; primary_in: string[]; related_in: string[] };
+  };
+  papers: {
+    [paperId: string]: { figures: string[]; topics: string[] };
+  };
+}
+
 export interface PaperInfo {
   id: string;
   title: string;